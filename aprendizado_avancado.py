@@ -33,6 +33,8 @@ from dataclasses import dataclass, field, asdict
 from typing import List, Dict, Optional, Tuple
 from collections import defaultdict
 
+from perfilador import perfilado
+
 
 # =============================================================================
 # CONFIGURAÇÕES
@@ -398,6 +400,7 @@ class MotorAprendizado:
     def __init__(self, banco: BancoAprendizado):
         self.banco = banco
     
+    @perfilado('descobrir_regras')
     def descobrir_regras(self) -> List[RegraDeOuro]:
         """Descobre todas as regras de ouro nos dados."""
         
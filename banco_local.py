@@ -0,0 +1,424 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+=============================================================================
+BANCO LOCAL DE DADOS (SQLITE)
+=============================================================================
+Autor: RefStats
+
+Guarda entre execuções o que já foi obtido da API do SofaScore. Árbitros
+e times se repetem dia após dia, então a maior parte das consultas vira
+uma leitura local; a rede só é usada quando o banco ainda não cobre o
+que foi pedido.
+
+TABELAS:
+    eventos           → evento por event_id (JSON compacto + colunas de busca)
+    arbitro_eventos   → vínculo árbitro → evento
+    time_eventos      → vínculo time → evento
+    estatisticas      → itens de /event/{id}/statistics por período (jogos finalizados)
+    estatisticas_eventos → quais eventos já tiveram as estatísticas gravadas
+    cartoes           → total de amarelos de jogos finalizados (validador)
+    classificacoes    → snapshots da tabela de cada liga/temporada
+    sincronizacoes    → última sincronização de cada lista (ex.: árbitro)
+    paginacoes        → próxima página antiga (last/N) de cada lista e se acabou
+    noticias_arbitros → notícias do Google News já filtradas por árbitro
+    aquecimentos      → execuções --warmup por data alvo e até quando valem
+
+ESTRUTURA DE PASTAS:
+    /dados_locais/refstats.sqlite3   → Banco local (pode ser apagado; é reconstruído)
+
+Nos modos de gravação/reprodução (gravacao_http.py) o banco fica só em
+memória, para que toda execução passe pelos cassetes.
+=============================================================================
+"""
+
+import os
+import json
+import time
+import zlib
+import sqlite3
+import threading
+from typing import Optional, List, Tuple
+
+from gravacao_http import modo_http
+
+
+# =============================================================================
+# CONFIGURAÇÕES
+# =============================================================================
+
+PASTA_BANCO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dados_locais")
+
+# Desligue para voltar a consultar sempre a API
+USAR_BANCO_LOCAL = True
+
+ESQUEMA = """
+    CREATE TABLE IF NOT EXISTS eventos (
+        event_id        INTEGER PRIMARY KEY,
+        torneio_id      INTEGER,
+        start_timestamp INTEGER NOT NULL,
+        status_codigo   INTEGER,
+        status_tipo     TEXT,
+        time_casa_id    INTEGER,
+        time_fora_id    INTEGER,
+        dados           BLOB NOT NULL,
+        atualizado_em   REAL NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS arbitro_eventos (
+        arbitro_id INTEGER NOT NULL,
+        event_id   INTEGER NOT NULL,
+        PRIMARY KEY (arbitro_id, event_id)
+    );
+    CREATE TABLE IF NOT EXISTS time_eventos (
+        team_id  INTEGER NOT NULL,
+        event_id INTEGER NOT NULL,
+        PRIMARY KEY (team_id, event_id)
+    );
+    CREATE TABLE IF NOT EXISTS estatisticas (
+        event_id INTEGER NOT NULL,
+        ordem    INTEGER NOT NULL,
+        periodo  TEXT NOT NULL,
+        grupo    INTEGER NOT NULL,
+        nome     TEXT NOT NULL,
+        home     TEXT,
+        away     TEXT,
+        PRIMARY KEY (event_id, ordem)
+    );
+    CREATE TABLE IF NOT EXISTS estatisticas_eventos (
+        event_id      INTEGER PRIMARY KEY,
+        disponivel    INTEGER NOT NULL,
+        atualizado_em REAL NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS cartoes (
+        event_id  INTEGER PRIMARY KEY,
+        amarelos  INTEGER NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS classificacoes (
+        liga_id      INTEGER NOT NULL,
+        season_id    INTEGER NOT NULL,
+        capturado_em REAL NOT NULL,
+        linhas       BLOB NOT NULL,
+        PRIMARY KEY (liga_id, season_id, capturado_em)
+    );
+    CREATE TABLE IF NOT EXISTS sincronizacoes (
+        chave           TEXT PRIMARY KEY,
+        sincronizado_em REAL NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS paginacoes (
+        chave          TEXT PRIMARY KEY,
+        proxima_pagina INTEGER NOT NULL,
+        esgotada       INTEGER NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS noticias_arbitros (
+        chave        TEXT PRIMARY KEY,
+        capturado_em REAL NOT NULL,
+        noticias     BLOB NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS aquecimentos (
+        data       TEXT PRIMARY KEY,
+        inicio     REAL NOT NULL,
+        valido_ate REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_eventos_inicio ON eventos(start_timestamp);
+"""
+
+
+def _comprimir(valor) -> bytes:
+    return zlib.compress(json.dumps(valor, ensure_ascii=False, separators=(',', ':')).encode('utf-8'), 6)
+
+
+def _descomprimir(blob: bytes):
+    return json.loads(zlib.decompress(blob))
+
+
+# =============================================================================
+# BANCO
+# =============================================================================
+
+class BancoLocal:
+    """Banco SQLite com eventos, estatísticas, vínculos e classificações."""
+
+    def __init__(self, caminho: str):
+        if caminho != ':memory:':
+            os.makedirs(os.path.dirname(caminho), exist_ok=True)
+        self.caminho = caminho
+        self._lock = threading.Lock()
+
+        self._conexao = sqlite3.connect(caminho, check_same_thread=False)
+        if caminho != ':memory:':
+            self._conexao.execute("PRAGMA journal_mode=WAL")
+        self._conexao.execute("PRAGMA synchronous=NORMAL")
+        self._conexao.executescript(ESQUEMA)
+        self._conexao.commit()
+
+    # -------------------------------------------------------------------------
+    # Eventos e vínculos
+    # -------------------------------------------------------------------------
+
+    def registrar_eventos(self, eventos: List[dict], arbitro_id: int = None):
+        """
+        Grava/atualiza os eventos (e os vínculos com os times). Com
+        arbitro_id, também vincula cada evento ao árbitro.
+        """
+        agora = time.time()
+        linhas_eventos = []
+        linhas_times = []
+        linhas_arbitro = []
+
+        for evento in eventos:
+            event_id = evento.get('id')
+            if not event_id:
+                continue
+            status = evento.get('status', {})
+            casa_id = evento.get('homeTeam', {}).get('id')
+            fora_id = evento.get('awayTeam', {}).get('id')
+
+            linhas_eventos.append((
+                event_id,
+                evento.get('tournament', {}).get('uniqueTournament', {}).get('id'),
+                evento.get('startTimestamp', 0),
+                status.get('code'),
+                status.get('type'),
+                casa_id,
+                fora_id,
+                _comprimir(evento),
+                agora,
+            ))
+            linhas_times.extend((team_id, event_id) for team_id in (casa_id, fora_id) if team_id)
+            if arbitro_id:
+                linhas_arbitro.append((arbitro_id, event_id))
+
+        with self._lock:
+            self._conexao.executemany(
+                "INSERT OR REPLACE INTO eventos (event_id, torneio_id, start_timestamp, status_codigo, "
+                "status_tipo, time_casa_id, time_fora_id, dados, atualizado_em) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                linhas_eventos
+            )
+            self._conexao.executemany(
+                "INSERT OR IGNORE INTO time_eventos (team_id, event_id) VALUES (?, ?)", linhas_times
+            )
+            self._conexao.executemany(
+                "INSERT OR IGNORE INTO arbitro_eventos (arbitro_id, event_id) VALUES (?, ?)", linhas_arbitro
+            )
+            self._conexao.commit()
+
+    def eventos_arbitro(self, arbitro_id: int, antes_de: float) -> List[dict]:
+        """Eventos do árbitro que começaram antes de `antes_de`, mais recentes primeiro."""
+        return self._consultar_eventos(
+            "SELECT e.dados FROM eventos e JOIN arbitro_eventos v ON v.event_id = e.event_id "
+            "WHERE v.arbitro_id = ? AND e.start_timestamp < ? ORDER BY e.start_timestamp DESC",
+            (arbitro_id, antes_de)
+        )
+
+    def eventos_time(self, team_id: int, antes_de: float) -> List[dict]:
+        """Eventos do time que começaram antes de `antes_de`, mais recentes primeiro."""
+        return self._consultar_eventos(
+            "SELECT e.dados FROM eventos e JOIN time_eventos v ON v.event_id = e.event_id "
+            "WHERE v.team_id = ? AND e.start_timestamp < ? ORDER BY e.start_timestamp DESC",
+            (team_id, antes_de)
+        )
+
+    def inicio_mais_recente_arbitro(self, arbitro_id: int) -> Optional[int]:
+        """startTimestamp do evento mais recente já conhecido do árbitro."""
+        with self._lock:
+            linha = self._conexao.execute(
+                "SELECT MAX(e.start_timestamp) FROM eventos e JOIN arbitro_eventos v ON v.event_id = e.event_id "
+                "WHERE v.arbitro_id = ?", (arbitro_id,)
+            ).fetchone()
+        return linha[0] if linha else None
+
+    def _consultar_eventos(self, sql: str, parametros: tuple) -> List[dict]:
+        with self._lock:
+            linhas = self._conexao.execute(sql, parametros).fetchall()
+        return [_descomprimir(dados) for (dados,) in linhas]
+
+    # -------------------------------------------------------------------------
+    # Estatísticas
+    # -------------------------------------------------------------------------
+
+    def estatisticas(self, event_id: int) -> Optional[List[Tuple[str, int, str, object, object]]]:
+        """
+        Linhas (período, grupo, nome, home, away) gravadas para o evento.
+        Lista vazia = evento sem estatísticas na API; None = ainda não consultado.
+        """
+        with self._lock:
+            marcador = self._conexao.execute(
+                "SELECT disponivel FROM estatisticas_eventos WHERE event_id = ?", (event_id,)
+            ).fetchone()
+            if marcador is None:
+                return None
+            linhas = self._conexao.execute(
+                "SELECT periodo, grupo, nome, home, away FROM estatisticas WHERE event_id = ? ORDER BY ordem",
+                (event_id,)
+            ).fetchall()
+
+        return [(periodo, grupo, nome, json.loads(home), json.loads(away))
+                for periodo, grupo, nome, home, away in linhas]
+
+    def salvar_estatisticas(self, event_id: int, linhas: List[Tuple[str, int, str, object, object]]):
+        """Grava as linhas de estatísticas de um evento finalizado (vazia = sem estatísticas)."""
+        registros = [
+            (event_id, ordem, periodo, grupo, nome, json.dumps(home), json.dumps(away))
+            for ordem, (periodo, grupo, nome, home, away) in enumerate(linhas)
+        ]
+        with self._lock:
+            self._conexao.execute("DELETE FROM estatisticas WHERE event_id = ?", (event_id,))
+            self._conexao.executemany(
+                "INSERT INTO estatisticas (event_id, ordem, periodo, grupo, nome, home, away) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                registros
+            )
+            self._conexao.execute(
+                "INSERT OR REPLACE INTO estatisticas_eventos (event_id, disponivel, atualizado_em) VALUES (?, ?, ?)",
+                (event_id, 1 if registros else 0, time.time())
+            )
+            self._conexao.commit()
+
+    def cartoes_amarelos(self, event_id: int) -> Optional[int]:
+        with self._lock:
+            linha = self._conexao.execute(
+                "SELECT amarelos FROM cartoes WHERE event_id = ?", (event_id,)
+            ).fetchone()
+        return linha[0] if linha else None
+
+    def salvar_cartoes_amarelos(self, event_id: int, amarelos: int):
+        with self._lock:
+            self._conexao.execute(
+                "INSERT OR REPLACE INTO cartoes (event_id, amarelos) VALUES (?, ?)", (event_id, amarelos)
+            )
+            self._conexao.commit()
+
+    # -------------------------------------------------------------------------
+    # Classificações
+    # -------------------------------------------------------------------------
+
+    def classificacao(self, liga_id: int, season_id: int, capturada_apos: float) -> Optional[List[dict]]:
+        """Linhas do snapshot mais recente da tabela capturado depois de `capturada_apos`."""
+        with self._lock:
+            linha = self._conexao.execute(
+                "SELECT linhas FROM classificacoes WHERE liga_id = ? AND season_id = ? AND capturado_em >= ? "
+                "ORDER BY capturado_em DESC LIMIT 1",
+                (liga_id, season_id, capturada_apos)
+            ).fetchone()
+        return _descomprimir(linha[0]) if linha else None
+
+    def salvar_classificacao(self, liga_id: int, season_id: int, linhas: List[dict]):
+        with self._lock:
+            self._conexao.execute(
+                "INSERT OR REPLACE INTO classificacoes (liga_id, season_id, capturado_em, linhas) VALUES (?, ?, ?, ?)",
+                (liga_id, season_id, time.time(), _comprimir(linhas))
+            )
+            self._conexao.commit()
+
+    # -------------------------------------------------------------------------
+    # Sincronizações
+    # -------------------------------------------------------------------------
+
+    def sincronizado_em(self, chave: str) -> Optional[float]:
+        with self._lock:
+            linha = self._conexao.execute(
+                "SELECT sincronizado_em FROM sincronizacoes WHERE chave = ?", (chave,)
+            ).fetchone()
+        return linha[0] if linha else None
+
+    def marcar_sincronizado(self, chave: str, quando: float = None):
+        with self._lock:
+            self._conexao.execute(
+                "INSERT OR REPLACE INTO sincronizacoes (chave, sincronizado_em) VALUES (?, ?)",
+                (chave, quando or time.time())
+            )
+            self._conexao.commit()
+
+    def paginacao(self, chave: str) -> Tuple[int, bool]:
+        """(próxima página antiga a buscar, lista já esgotada) da lista `chave`."""
+        with self._lock:
+            linha = self._conexao.execute(
+                "SELECT proxima_pagina, esgotada FROM paginacoes WHERE chave = ?", (chave,)
+            ).fetchone()
+        return (linha[0], bool(linha[1])) if linha else (1, False)
+
+    def salvar_paginacao(self, chave: str, proxima_pagina: int, esgotada: bool):
+        with self._lock:
+            self._conexao.execute(
+                "INSERT OR REPLACE INTO paginacoes (chave, proxima_pagina, esgotada) VALUES (?, ?, ?)",
+                (chave, proxima_pagina, 1 if esgotada else 0)
+            )
+            self._conexao.commit()
+
+    # -------------------------------------------------------------------------
+    # Aquecimentos (--warmup)
+    # -------------------------------------------------------------------------
+
+    def registrar_aquecimento(self, data: str, inicio: float, valido_ate: float):
+        """Aquecimento completo da data DD/MM/YYYY que começou em `inicio`."""
+        with self._lock:
+            self._conexao.execute(
+                "INSERT OR REPLACE INTO aquecimentos (data, inicio, valido_ate) VALUES (?, ?, ?)",
+                (data, inicio, valido_ate)
+            )
+            self._conexao.commit()
+
+    def inicio_aquecimento(self, data: str = None) -> Optional[float]:
+        """
+        Início do aquecimento mais recente ainda em vigor (da data pedida
+        ou de qualquer uma); None se não houver.
+        """
+        consulta = "SELECT MAX(inicio) FROM aquecimentos WHERE valido_ate > ?"
+        parametros = [time.time()]
+        if data is not None:
+            consulta += " AND data = ?"
+            parametros.append(data)
+        with self._lock:
+            linha = self._conexao.execute(consulta, parametros).fetchone()
+        return linha[0] if linha else None
+
+    # -------------------------------------------------------------------------
+    # Notícias
+    # -------------------------------------------------------------------------
+
+    def noticias_arbitro(self, chave: str, capturadas_apos: float) -> Optional[List[dict]]:
+        """Notícias do árbitro `chave` gravadas depois de `capturadas_apos` (None se não houver)."""
+        with self._lock:
+            linha = self._conexao.execute(
+                "SELECT noticias FROM noticias_arbitros WHERE chave = ? AND capturado_em >= ?",
+                (chave, capturadas_apos)
+            ).fetchone()
+        return _descomprimir(linha[0]) if linha else None
+
+    def salvar_noticias_arbitro(self, chave: str, noticias: List[dict]):
+        with self._lock:
+            self._conexao.execute(
+                "INSERT OR REPLACE INTO noticias_arbitros (chave, capturado_em, noticias) VALUES (?, ?, ?)",
+                (chave, time.time(), _comprimir(noticias))
+            )
+            self._conexao.commit()
+
+    def fechar(self):
+        """Fecha a conexão com o banco."""
+        with self._lock:
+            self._conexao.close()
+
+
+# Instância global
+_banco_local: BancoLocal = None
+_lock_banco = threading.Lock()
+
+def obter_banco_local() -> Optional[BancoLocal]:
+    """Obtém ou cria o banco local (None se USAR_BANCO_LOCAL estiver desligado)."""
+    global _banco_local
+    if not USAR_BANCO_LOCAL:
+        return None
+    with _lock_banco:
+        if _banco_local is None:
+            caminho = ':memory:' if modo_http() else os.path.join(PASTA_BANCO, "refstats.sqlite3")
+            _banco_local = BancoLocal(caminho)
+        return _banco_local
+
+
+def reiniciar_banco_local():
+    """Fecha o banco compartilhado; o próximo obter_banco_local() abre outro."""
+    global _banco_local
+    with _lock_banco:
+        if _banco_local is not None:
+            _banco_local.fechar()
+            _banco_local = None
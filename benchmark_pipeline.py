@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+=============================================================================
+BENCHMARK DO FLUXO DIÁRIO (CASSETES GRAVADOS)
+=============================================================================
+Autor: RefStats
+
+Roda o fluxo completo de um dia contra requisições gravadas
+(gravacao_http.py) e mede, por etapa: tempo, requisições HTTP, bytes
+recebidos, acertos de cache, retentativas e pico de memória.
+
+O tracemalloc deixa o código bem mais lento, então os tempos vêm de
+execuções sem rastreamento e o pico de memória de uma execução extra
+do mesmo cenário, com o tracemalloc ligado.
+
+ETAPAS:
+    partidas       → buscar_partidas_do_dia
+    analise        → analisar_partidas (árbitro + times de cada partida)
+    html           → gerar_html_unificado (JOGOS_DO_DIA_DDMMYYYY.html)
+    probabilidade  → probabilidade_cartoes_v2 (PROBABILIDADE_DDMMYYYY.html)
+    validacao      → validar_probabilidades_v2.processar_arquivo_v2
+
+CENÁRIOS:
+    pequeno → 04/12/2025 (3 jogos)
+    tipico  → 08/12/2025 (14 jogos)
+    grande  → 07/12/2025 (28 jogos)
+
+USO:
+    # 1ª vez: grava os cassetes a partir da API real
+    python benchmark_pipeline.py --gravar
+
+    # Depois: mede offline, sempre com as mesmas respostas
+    python benchmark_pipeline.py --cenario grande --latencia-ms 40
+
+    # Compara dois resultados (ex.: antes/depois de um commit)
+    python benchmark_pipeline.py --comparar benchmarks/a.json benchmarks/b.json
+
+Os arquivos gerados vão para uma pasta temporária; o Historico/ e o
+Probabilidade/ do projeto não são tocados. Os resultados (JSON) vão para
+benchmarks/ com o commit atual no nome.
+=============================================================================
+"""
+
+import os
+import sys
+import io
+import json
+import time
+import platform
+import argparse
+import tempfile
+import statistics
+import subprocess
+import tracemalloc
+from contextlib import contextmanager, redirect_stdout
+from datetime import datetime
+
+import gravacao_http
+
+
+# =============================================================================
+# CONFIGURAÇÕES
+# =============================================================================
+
+PASTA_ATUAL = os.path.dirname(os.path.abspath(__file__))
+PASTA_BENCHMARKS = os.path.join(PASTA_ATUAL, "benchmarks")
+PASTA_CALIBRACAO = os.path.join(PASTA_ATUAL, "Calibracao")
+
+CENARIOS = {
+    'pequeno': '04/12/2025',
+    'tipico': '08/12/2025',
+    'grande': '07/12/2025',
+}
+
+VERSAO_RESULTADO = 2
+
+
+# =============================================================================
+# MEDIÇÃO
+# =============================================================================
+
+class MedidorEtapas:
+    """
+    Mede tempo e tráfego HTTP de cada etapa; com medir_memoria, também
+    o pico de memória (exige o tracemalloc ligado).
+    """
+
+    def __init__(self, medir_memoria: bool = False):
+        self.medir_memoria = medir_memoria
+        self.etapas = []
+
+    @contextmanager
+    def etapa(self, nome: str):
+        from cliente_sofascore import obter_cliente
+
+        antes = obter_cliente().resumo_contadores()
+        if self.medir_memoria and hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            segundos = time.perf_counter() - inicio
+            depois = obter_cliente().resumo_contadores()
+
+            registro = {'etapa': nome, 'segundos': round(segundos, 4)}
+            for contador, valor in depois.items():
+                registro[contador] = valor - antes.get(contador, 0)
+            if self.medir_memoria:
+                _, pico = tracemalloc.get_traced_memory()
+                registro['pico_memoria_mb'] = round(pico / (1024 * 1024), 2)
+            self.etapas.append(registro)
+
+
+def executar_cenario(nome: str, data_str: str, paralelo: int, verboso: bool = False,
+                     medir_memoria: bool = False) -> dict:
+    """
+    Roda o fluxo completo de uma data numa pasta temporária. Com
+    medir_memoria o tracemalloc fica ligado (tempos não comparáveis).
+    """
+    import sistema_unificado_v1_5 as sistema
+    import probabilidade_cartoes_v2 as probabilidade
+    import validar_probabilidades_v2 as validador
+    from cliente_sofascore import reiniciar_cliente
+    from dados_sofascore import limpar_dados_execucao
+    from banco_local import reiniciar_banco_local
+    from sidecar_jogos import salvar_sidecar
+
+    # Cada cenário começa sem nada em memória
+    reiniciar_cliente()
+    reiniciar_banco_local()
+    limpar_dados_execucao()
+    validador.normalizar_nome_time.cache_clear()
+
+    medidor = MedidorEtapas(medir_memoria)
+    data_arquivo = data_str.replace('/', '')
+    saida = io.StringIO()
+
+    with tempfile.TemporaryDirectory(prefix="refstats_bench_") as pasta:
+        pasta_historico = os.path.join(pasta, "Historico")
+        pasta_probabilidade = os.path.join(pasta, "Probabilidade")
+        pasta_relatorio = os.path.join(pasta_probabilidade, "Relatorio")
+        os.makedirs(pasta_historico)
+        os.makedirs(pasta_probabilidade)
+
+        with redirect_stdout(sys.stdout if verboso else saida):
+            if medir_memoria:
+                tracemalloc.start()
+            inicio = time.perf_counter()
+            try:
+                with medidor.etapa('partidas'):
+                    partidas = sistema.buscar_partidas_do_dia(data_str)
+
+                with medidor.etapa('analise'):
+                    analises = sistema.analisar_partidas(partidas, data_str, max_partidas=paralelo)
+
+                with medidor.etapa('html'):
+                    timestamp = datetime.now().strftime('%Y%m%d_%H%M')
+                    html = sistema.gerar_html_unificado(analises, timestamp, data_str)
+                    arquivo_jogos = os.path.join(pasta_historico, f"JOGOS_DO_DIA_{data_arquivo}.html")
+                    with open(arquivo_jogos, 'w', encoding='utf-8') as f:
+                        f.write(html)
+                    salvar_sidecar(arquivo_jogos, analises, data_str)
+
+                with medidor.etapa('probabilidade'):
+                    gerenciador = probabilidade.obter_gerenciador_calibracao(PASTA_CALIBRACAO)
+                    regras = probabilidade.carregar_regras_ouro(PASTA_CALIBRACAO)
+                    arquivo_prob = probabilidade.gerar_probabilidade_arquivo(
+                        arquivo_jogos, pasta_probabilidade, gerenciador, regras, PASTA_CALIBRACAO
+                    )
+
+                with medidor.etapa('validacao'):
+                    if arquivo_prob:
+                        validador.processar_arquivo_v2(arquivo_prob, pasta_relatorio)
+            finally:
+                total = time.perf_counter() - inicio
+                if medir_memoria:
+                    tracemalloc.stop()
+
+    return {
+        'cenario': nome,
+        'data': data_str,
+        'partidas': len(partidas or []),
+        'segundos_total': round(total, 4),
+        'etapas': medidor.etapas,
+    }
+
+
+def consolidar_repeticoes(execucoes: list, memoria: dict) -> dict:
+    """
+    Mediana dos tempos entre repetições (contadores da última execução)
+    e pico de memória de cada etapa na execução `memoria`.
+    """
+    base = dict(execucoes[-1])
+    base['repeticoes'] = len(execucoes)
+    base['segundos_total'] = round(statistics.median(e['segundos_total'] for e in execucoes), 4)
+
+    etapas = []
+    for i, etapa in enumerate(base['etapas']):
+        etapa = dict(etapa)
+        etapa['segundos'] = round(statistics.median(e['etapas'][i]['segundos'] for e in execucoes), 4)
+        etapa['pico_memoria_mb'] = memoria['etapas'][i]['pico_memoria_mb']
+        etapas.append(etapa)
+    base['etapas'] = etapas
+    return base
+
+
+def commit_atual() -> str:
+    """Hash curto do commit atual (+ '-sujo' se houver alterações locais)."""
+    try:
+        commit = subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=PASTA_ATUAL, text=True,
+            stderr=subprocess.DEVNULL
+        ).strip()
+        sujo = subprocess.call(
+            ['git', 'diff', '--quiet', 'HEAD', '--', '*.py'], cwd=PASTA_ATUAL,
+            stderr=subprocess.DEVNULL
+        )
+        return f"{commit}-sujo" if sujo else commit
+    except (OSError, subprocess.CalledProcessError):
+        return "desconhecido"
+
+
+# =============================================================================
+# RELATÓRIOS
+# =============================================================================
+
+def exibir_resultado(resultado: dict):
+    print(f"\n📊 {resultado['cenario'].upper()} - {resultado['data']} "
+          f"({resultado['partidas']} partidas) - {resultado['segundos_total']:.2f}s")
+    print(f"   {'Etapa':<14} {'Tempo(s)':>9} {'Req.':>6} {'KB':>9} {'Cache':>6} {'Retent.':>8} {'Pico(MB)':>9}")
+    for etapa in resultado['etapas']:
+        print(f"   {etapa['etapa']:<14} {etapa['segundos']:>9.2f} {etapa['requisicoes']:>6} "
+              f"{etapa['bytes_recebidos'] / 1024:>9.1f} {etapa['acertos_cache']:>6} "
+              f"{etapa['retentativas']:>8} {etapa['pico_memoria_mb']:>9.1f}")
+
+
+def comparar_resultados(caminho_a: str, caminho_b: str):
+    """Compara dois JSONs de benchmark, etapa a etapa."""
+    with open(caminho_a, 'r', encoding='utf-8') as f:
+        a = json.load(f)
+    with open(caminho_b, 'r', encoding='utf-8') as f:
+        b = json.load(f)
+
+    print(f"\n🔬 A: {a.get('commit')} ({a.get('gerado_em')})")
+    print(f"   B: {b.get('commit')} ({b.get('gerado_em')})")
+
+    cenarios_b = {c['cenario']: c for c in b.get('cenarios', [])}
+    for cenario_a in a.get('cenarios', []):
+        cenario_b = cenarios_b.get(cenario_a['cenario'])
+        if not cenario_b:
+            continue
+
+        print(f"\n📊 {cenario_a['cenario'].upper()} ({cenario_a['data']})")
+        print(f"   {'Etapa':<14} {'A(s)':>8} {'B(s)':>8} {'Δ%':>7} {'Req A':>6} {'Req B':>6} {'MB A':>7} {'MB B':>7}")
+
+        etapas_b = {e['etapa']: e for e in cenario_b['etapas']}
+        linhas = [(e, etapas_b.get(e['etapa'])) for e in cenario_a['etapas']]
+        linhas.append((
+            {'etapa': 'TOTAL', 'segundos': cenario_a['segundos_total'],
+             'requisicoes': sum(e['requisicoes'] for e in cenario_a['etapas']),
+             'pico_memoria_mb': max((e['pico_memoria_mb'] for e in cenario_a['etapas']), default=0)},
+            {'etapa': 'TOTAL', 'segundos': cenario_b['segundos_total'],
+             'requisicoes': sum(e['requisicoes'] for e in cenario_b['etapas']),
+             'pico_memoria_mb': max((e['pico_memoria_mb'] for e in cenario_b['etapas']), default=0)},
+        ))
+
+        for etapa_a, etapa_b in linhas:
+            if etapa_b is None:
+                continue
+            delta = ((etapa_b['segundos'] - etapa_a['segundos']) / etapa_a['segundos'] * 100
+                     if etapa_a['segundos'] else 0.0)
+            print(f"   {etapa_a['etapa']:<14} {etapa_a['segundos']:>8.2f} {etapa_b['segundos']:>8.2f} "
+                  f"{delta:>+6.1f}% {etapa_a['requisicoes']:>6} {etapa_b['requisicoes']:>6} "
+                  f"{etapa_a['pico_memoria_mb']:>7.1f} {etapa_b['pico_memoria_mb']:>7.1f}")
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="RefStats - benchmark do fluxo diário")
+    parser.add_argument('--cenario', choices=list(CENARIOS) + ['todos'], default='todos')
+    parser.add_argument('--data', help="data avulsa (DD/MM/YYYY) em vez dos cenários")
+    parser.add_argument('--gravar', action='store_true',
+                        help="grava os cassetes consultando a API real")
+    parser.add_argument('--cassetes', default=gravacao_http.pasta_cassetes())
+    parser.add_argument('--latencia-ms', type=float, default=0,
+                        help="latência simulada por requisição na reprodução")
+    parser.add_argument('--paralelo', type=int, default=None,
+                        help="partidas analisadas ao mesmo tempo (padrão do sistema)")
+    parser.add_argument('--repeticoes', type=int, default=1)
+    parser.add_argument('--saida', help="arquivo JSON de resultado")
+    parser.add_argument('--verboso', action='store_true', help="mostra a saída do fluxo")
+    parser.add_argument('--comparar', nargs=2, metavar=('A', 'B'),
+                        help="compara dois resultados JSON e sai")
+    args = parser.parse_args()
+
+    if args.comparar:
+        comparar_resultados(*args.comparar)
+        return
+
+    # O modo precisa estar definido antes de o cliente ser criado
+    os.environ['REFSTATS_HTTP_MODO'] = gravacao_http.MODO_GRAVAR if args.gravar else gravacao_http.MODO_REPRODUZIR
+    os.environ['REFSTATS_CASSETES'] = args.cassetes
+    os.environ['REFSTATS_REPLAY_LATENCIA_MS'] = str(args.latencia_ms)
+    os.environ.pop('REFSTATS_HTTP_SERVIDOR', None)
+
+    import sistema_unificado_v1_5 as sistema
+    paralelo = args.paralelo or sistema.MAX_PARTIDAS_SIMULTANEAS
+
+    if args.data:
+        cenarios = {'avulso': args.data}
+    elif args.cenario == 'todos':
+        cenarios = CENARIOS
+    else:
+        cenarios = {args.cenario: CENARIOS[args.cenario]}
+
+    modo = 'gravacao' if args.gravar else 'reproducao'
+    print(f"⏱️  Benchmark ({modo}) • cassetes: {args.cassetes} • {paralelo} partida(s) em paralelo")
+
+    resultados = []
+    for nome, data_str in cenarios.items():
+        if args.gravar:
+            # Gravando, o tempo não interessa: uma só execução, já medindo a memória
+            execucoes = [executar_cenario(nome, data_str, paralelo, args.verboso, medir_memoria=True)]
+            memoria = execucoes[0]
+        else:
+            execucoes = [executar_cenario(nome, data_str, paralelo, args.verboso)
+                         for _ in range(max(1, args.repeticoes))]
+            memoria = executar_cenario(nome, data_str, paralelo, args.verboso, medir_memoria=True)
+        resultado = consolidar_repeticoes(execucoes, memoria)
+        exibir_resultado(resultado)
+        resultados.append(resultado)
+
+    if args.gravar:
+        print("\n📼 Cassetes gravados. Rode novamente sem --gravar para medir.")
+        return
+
+    commit = commit_atual()
+    documento = {
+        'versao': VERSAO_RESULTADO,
+        'commit': commit,
+        'gerado_em': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'latencia_ms': args.latencia_ms,
+        'paralelo': paralelo,
+        'cenarios': resultados,
+    }
+
+    caminho = args.saida
+    if not caminho:
+        os.makedirs(PASTA_BENCHMARKS, exist_ok=True)
+        caminho = os.path.join(
+            PASTA_BENCHMARKS, f"benchmark_{commit}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        )
+    with open(caminho, 'w', encoding='utf-8') as f:
+        json.dump(documento, f, ensure_ascii=False, indent=2)
+
+    print(f"\n💾 Resultado salvo: {caminho}")
+
+
+if __name__ == "__main__":
+    main()
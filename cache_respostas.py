@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+=============================================================================
+CACHE PERSISTENTE DE RESPOSTAS DA API
+=============================================================================
+Autor: RefStats
+
+Cache em disco (SQLite) usado pelo SofaScoreClient para reaproveitar
+respostas entre execuções.
+
+    - Chave: URL completa
+    - TTL por classe de endpoint (ver TTL_POR_ENDPOINT)
+    - Corpo armazenado comprimido (zlib)
+    - Limite de tamanho com descarte LRU (menos acessado recentemente)
+    - Validadores HTTP (ETag / Last-Modified) guardados com o corpo: uma
+      entrada vencida pode ser revalidada com GET condicional e, se a
+      API responder 304, só o prazo é renovado (ver obter_para_revalidar)
+
+ESTRUTURA DE PASTAS:
+    /cache_api/respostas.sqlite3   → Banco do cache (pode ser apagado a qualquer momento)
+=============================================================================
+"""
+
+import os
+import re
+import time
+import zlib
+import sqlite3
+import threading
+from typing import Optional, Tuple
+
+
+# =============================================================================
+# CONFIGURAÇÕES
+# =============================================================================
+
+PASTA_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache_api")
+
+# Tamanho máximo (bytes comprimidos) antes de descartar entradas antigas
+TAMANHO_MAXIMO_CACHE = 512 * 1024 * 1024
+
+# Ao estourar o limite, descarta até ficar nesta fração do máximo
+FRACAO_APOS_DESCARTE = 0.9
+
+MINUTO = 60
+HORA = 60 * MINUTO
+
+# TTL especial: entrada nunca expira
+SEM_EXPIRACAO = -1
+
+# TTL por classe de endpoint (primeira regra que casar vence).
+# TTL 0 = não cacheia.
+# Estatísticas de evento ficam 1h por padrão; quem sabe que o jogo já
+# terminou (histórico do árbitro/time, validador) pede SEM_EXPIRACAO.
+TTL_POR_ENDPOINT = [
+    (re.compile(r'/event/\d+/statistics$'), 1 * HORA),
+    (re.compile(r'/event/\d+/incidents$'), 1 * HORA),
+    (re.compile(r'/event/\d+$'), 10 * MINUTO),
+    (re.compile(r'/sport/football/scheduled-events/'), 10 * MINUTO),
+    (re.compile(r'/unique-tournament/\d+/seasons$'), 24 * HORA),
+    (re.compile(r'/unique-tournament/\d+/season/\d+/standings/'), 6 * HORA),
+    (re.compile(r'/team/\d+/events/(last|next)/\d+$'), 1 * HORA),
+    (re.compile(r'/referee/\d+/events/last/\d+$'), 1 * HORA),
+    (re.compile(r'news\.google\.com/rss/search$'), 1 * HORA),
+]
+
+TTL_PADRAO = 0
+
+
+def ttl_para_url(url: str) -> float:
+    """Retorna o TTL (segundos) da classe de endpoint da URL."""
+    caminho = url.split('?', 1)[0]
+    for padrao, ttl in TTL_POR_ENDPOINT:
+        if padrao.search(caminho):
+            return ttl
+    return TTL_PADRAO
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+class CacheRespostas:
+    """Cache de respostas HTTP em SQLite, comprimido e com limite LRU."""
+
+    def __init__(self, pasta: str = PASTA_CACHE, tamanho_maximo: int = TAMANHO_MAXIMO_CACHE):
+        os.makedirs(pasta, exist_ok=True)
+        self.caminho = os.path.join(pasta, "respostas.sqlite3")
+        self.tamanho_maximo = tamanho_maximo
+        self._lock = threading.Lock()
+
+        self._conexao = sqlite3.connect(self.caminho, check_same_thread=False)
+        self._conexao.execute("PRAGMA journal_mode=WAL")
+        self._conexao.execute("PRAGMA synchronous=NORMAL")
+        self._conexao.execute("""
+            CREATE TABLE IF NOT EXISTS respostas (
+                url         TEXT PRIMARY KEY,
+                corpo       BLOB NOT NULL,
+                tamanho     INTEGER NOT NULL,
+                criado_em   REAL NOT NULL,
+                expira_em   REAL,
+                acessado_em REAL NOT NULL,
+                etag        TEXT,
+                modificado  TEXT
+            )
+        """)
+        # Bancos criados antes dos validadores não têm as colunas novas
+        colunas = {linha[1] for linha in self._conexao.execute("PRAGMA table_info(respostas)")}
+        for coluna in ('etag', 'modificado'):
+            if coluna not in colunas:
+                self._conexao.execute(f"ALTER TABLE respostas ADD COLUMN {coluna} TEXT")
+        self._conexao.execute(
+            "CREATE INDEX IF NOT EXISTS idx_respostas_acesso ON respostas(acessado_em)"
+        )
+        self._conexao.commit()
+
+        linha = self._conexao.execute("SELECT COALESCE(SUM(tamanho), 0) FROM respostas").fetchone()
+        self._tamanho_total = linha[0]
+
+    def obter(self, url: str, idade_maxima: float = None) -> Optional[bytes]:
+        """
+        Retorna o corpo descomprimido se houver entrada válida para a URL.
+        Com idade_maxima, entradas gravadas há mais tempo que isso contam
+        como vencidas mesmo dentro do prazo.
+        """
+        agora = time.time()
+        with self._lock:
+            linha = self._conexao.execute(
+                "SELECT corpo, expira_em, criado_em FROM respostas WHERE url = ?", (url,)
+            ).fetchone()
+            if linha is None:
+                return None
+
+            corpo, expira_em, criado_em = linha
+            if expira_em is not None and expira_em <= agora:
+                return None
+            if idade_maxima is not None and criado_em + idade_maxima <= agora:
+                return None
+
+            self._conexao.execute(
+                "UPDATE respostas SET acessado_em = ? WHERE url = ?", (agora, url)
+            )
+            self._conexao.commit()
+
+        try:
+            return zlib.decompress(corpo)
+        except zlib.error:
+            self.remover(url)
+            return None
+
+    def obter_para_revalidar(self, url: str) -> Optional[Tuple[bytes, Optional[str], Optional[str]]]:
+        """
+        Entrada vencida que tem validador: (corpo, etag, last_modified).
+        O chamador faz o GET condicional e, num 304, chama renovar().
+        Retorna None se não houver entrada ou ela não tiver validador.
+        """
+        with self._lock:
+            linha = self._conexao.execute(
+                "SELECT corpo, etag, modificado FROM respostas WHERE url = ?", (url,)
+            ).fetchone()
+        if linha is None or not (linha[1] or linha[2]):
+            return None
+
+        try:
+            return zlib.decompress(linha[0]), linha[1], linha[2]
+        except zlib.error:
+            self.remover(url)
+            return None
+
+    def renovar(self, url: str, ttl: float):
+        """Dá novo prazo à entrada sem regravar o corpo (resposta 304)."""
+        agora = time.time()
+        expira_em = None if ttl == SEM_EXPIRACAO else agora + ttl
+        with self._lock:
+            self._conexao.execute(
+                "UPDATE respostas SET expira_em = ?, acessado_em = ? WHERE url = ?", (expira_em, agora, url)
+            )
+            self._conexao.commit()
+
+    def guardar(self, url: str, corpo: bytes, ttl: float, etag: str = None, last_modified: str = None):
+        """
+        Armazena o corpo comprimido com o TTL informado (SEM_EXPIRACAO = permanente)
+        e os validadores HTTP da resposta, se houver.
+        """
+        if ttl == 0:
+            return
+
+        agora = time.time()
+        expira_em = None if ttl == SEM_EXPIRACAO else agora + ttl
+        comprimido = zlib.compress(corpo, 6)
+
+        with self._lock:
+            anterior = self._conexao.execute(
+                "SELECT tamanho FROM respostas WHERE url = ?", (url,)
+            ).fetchone()
+            self._conexao.execute(
+                "INSERT OR REPLACE INTO respostas "
+                "(url, corpo, tamanho, criado_em, expira_em, acessado_em, etag, modificado) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, comprimido, len(comprimido), agora, expira_em, agora, etag, last_modified)
+            )
+            self._tamanho_total += len(comprimido) - (anterior[0] if anterior else 0)
+
+            if self._tamanho_total > self.tamanho_maximo:
+                self._descartar_lru()
+
+            self._conexao.commit()
+
+    def remover(self, url: str):
+        """Remove a entrada da URL (se existir)."""
+        with self._lock:
+            linha = self._conexao.execute(
+                "SELECT tamanho FROM respostas WHERE url = ?", (url,)
+            ).fetchone()
+            if linha:
+                self._conexao.execute("DELETE FROM respostas WHERE url = ?", (url,))
+                self._conexao.commit()
+                self._tamanho_total -= linha[0]
+
+    def _descartar_lru(self):
+        """
+        Remove entradas expiradas sem validador e depois as menos acessadas
+        até caber no limite.
+        """
+        agora = time.time()
+        self._conexao.execute(
+            "DELETE FROM respostas WHERE expira_em IS NOT NULL AND expira_em <= ? "
+            "AND etag IS NULL AND modificado IS NULL", (agora,)
+        )
+        self._tamanho_total = self._conexao.execute(
+            "SELECT COALESCE(SUM(tamanho), 0) FROM respostas"
+        ).fetchone()[0]
+
+        alvo = self.tamanho_maximo * FRACAO_APOS_DESCARTE
+        if self._tamanho_total <= alvo:
+            return
+
+        cursor = self._conexao.execute(
+            "SELECT url, tamanho FROM respostas ORDER BY acessado_em ASC"
+        )
+        remover = []
+        for url, tamanho in cursor:
+            if self._tamanho_total <= alvo:
+                break
+            remover.append((url,))
+            self._tamanho_total -= tamanho
+
+        self._conexao.executemany("DELETE FROM respostas WHERE url = ?", remover)
+
+    def fechar(self):
+        """Fecha a conexão com o banco."""
+        with self._lock:
+            self._conexao.close()
@@ -0,0 +1,463 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+=============================================================================
+CLIENTE HTTP COMPARTILHADO - API SOFASCORE
+=============================================================================
+Autor: RefStats
+
+Centraliza todas as chamadas à API do SofaScore feitas pelo sistema
+unificado (sistema_unificado_v1_5.py) e pelo validador
+(validar_probabilidades_v2.py).
+
+    - Uma única requests.Session com pool de conexões keep-alive
+      (evita um handshake TCP+TLS por requisição)
+    - Headers de navegador e timeouts padronizados
+    - Cache persistente em disco com TTL por endpoint (cache_respostas.py);
+      entradas vencidas com ETag/Last-Modified são revalidadas com GET
+      condicional (304 renova o prazo sem baixar o corpo de novo)
+    - Limite global de requisições simultâneas (seguro para várias threads)
+    - Limitador de taxa (token bucket adaptativo) com suporte a HTTP 429 e
+      Retry-After, backoff exponencial com jitter e orçamento de
+      retentativas por execução
+    - Disjuntor (circuit breaker) por modelo de endpoint: depois de
+      FALHAS_PARA_ABRIR falhas seguidas as chamadas falham na hora, até
+      uma sondagem depois de ESPERA_CIRCUITO segundos dar certo
+    - Gravação/reprodução de requisições em cassetes e servidor local
+      substituto da API (gravacao_http.py)
+    - Métricas por endpoint (requisições, cache, latência, retentativas)
+      para o relatório da execução (metricas_execucao.py)
+=============================================================================
+"""
+
+import json
+import time
+import random
+import threading
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Optional, Callable
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from cache_respostas import CacheRespostas, ttl_para_url, SEM_EXPIRACAO
+from gravacao_http import configurar_sessao, modo_http
+from metricas_execucao import obter_coletor, modelo_endpoint
+
+
+# =============================================================================
+# CONFIGURAÇÕES
+# =============================================================================
+
+BASE_URL = 'https://api.sofascore.com/api/v1'
+
+# Headers para simular navegador
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'application/json',
+    'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
+    'Referer': 'https://www.sofascore.com/'
+}
+
+# Timeout padrão (segundos) e tamanho do pool de conexões por host
+TIMEOUT_PADRAO = 10
+TAMANHO_POOL = 16
+
+# Máximo de requisições em andamento ao mesmo tempo (todas as threads)
+MAX_REQUISICOES_SIMULTANEAS = 8
+
+# Limitador de taxa (requisições/segundo). A taxa cai pela metade a cada
+# HTTP 429 e volta a subir aos poucos enquanto as respostas forem OK.
+TAXA_REQUISICOES = 8.0
+TAXA_MINIMA = 1.0
+RAJADA_MAXIMA = 10
+
+# Retentativas: só para falhas transitórias (timeout, conexão, 429, 5xx)
+MAX_TENTATIVAS = 3
+BACKOFF_BASE = 1.0
+BACKOFF_MAXIMO = 30.0
+ORCAMENTO_RETENTATIVAS = 200
+STATUS_RETENTAVEIS = {429, 500, 502, 503, 504}
+
+# Disjuntor por endpoint: falhas seguidas (timeout, conexão, 403, 429, 5xx)
+# que abrem o circuito e tempo até a próxima sondagem
+FALHAS_PARA_ABRIR = 5
+ESPERA_CIRCUITO = 60.0
+STATUS_FALHA_CIRCUITO = STATUS_RETENTAVEIS | {403}
+
+# Reaproveita respostas entre execuções (cache_api/)
+USAR_CACHE_PERSISTENTE = True
+
+
+# =============================================================================
+# LIMITADOR DE TAXA
+# =============================================================================
+
+class LimitadorTaxa:
+    """
+    Token bucket compartilhado por todas as threads.
+
+    - aguardar(): bloqueia até haver um token disponível
+    - pausar(s): suspende todas as requisições por s segundos (Retry-After)
+    - registrar_sucesso()/registrar_limite(): ajuste adaptativo da taxa
+      (aumento aditivo, redução multiplicativa)
+    """
+
+    def __init__(self, taxa: float = TAXA_REQUISICOES, capacidade: int = RAJADA_MAXIMA,
+                 taxa_minima: float = TAXA_MINIMA):
+        self.taxa_maxima = taxa
+        self.taxa_minima = min(taxa_minima, taxa)
+        self.taxa = taxa
+        self.capacidade = capacidade
+        self._tokens = float(capacidade)
+        self._ultimo = time.monotonic()
+        self._pausa_ate = 0.0
+        self._lock = threading.Lock()
+
+    def aguardar(self):
+        """Consome um token, esperando o necessário."""
+        while True:
+            with self._lock:
+                agora = time.monotonic()
+                if agora < self._pausa_ate:
+                    espera = self._pausa_ate - agora
+                else:
+                    self._tokens = min(self.capacidade, self._tokens + (agora - self._ultimo) * self.taxa)
+                    self._ultimo = agora
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    espera = (1 - self._tokens) / self.taxa
+            time.sleep(espera)
+
+    def pausar(self, segundos: float):
+        """Suspende a emissão de tokens por `segundos` (vale para todas as threads)."""
+        with self._lock:
+            self._pausa_ate = max(self._pausa_ate, time.monotonic() + segundos)
+            self._tokens = 0.0
+
+    def registrar_sucesso(self):
+        with self._lock:
+            self.taxa = min(self.taxa_maxima, self.taxa + 0.1)
+
+    def registrar_limite(self):
+        with self._lock:
+            self.taxa = max(self.taxa_minima, self.taxa / 2)
+
+
+# =============================================================================
+# DISJUNTOR POR ENDPOINT
+# =============================================================================
+
+class CircuitoAberto(requests.exceptions.RequestException):
+    """Chamada recusada sem ir à rede: o circuito do endpoint está aberto."""
+
+
+class DisjuntorEndpoints:
+    """
+    Um circuito por modelo de endpoint (/event/{id}/statistics, ...):
+
+    - fechado: chamadas normais; FALHAS_PARA_ABRIR falhas seguidas abrem
+    - aberto: chamadas recusadas na hora durante ESPERA_CIRCUITO segundos
+    - meio-aberto: passada a espera, uma única chamada sonda a API; sucesso
+      fecha o circuito, falha abre de novo
+    """
+
+    def __init__(self, falhas_para_abrir: int = FALHAS_PARA_ABRIR, espera: float = ESPERA_CIRCUITO):
+        self.falhas_para_abrir = falhas_para_abrir
+        self.espera = espera
+        self._circuitos = {}
+        self._lock = threading.Lock()
+
+    def _circuito(self, modelo: str) -> dict:
+        circuito = self._circuitos.get(modelo)
+        if circuito is None:
+            circuito = self._circuitos[modelo] = {'falhas': 0, 'aberto_ate': None, 'sondando': False}
+        return circuito
+
+    def permitir(self, url: str) -> bool:
+        """False se a chamada deve falhar na hora (circuito aberto ou sondagem em andamento)."""
+        with self._lock:
+            circuito = self._circuito(modelo_endpoint(url))
+            if circuito['aberto_ate'] is None:
+                return True
+            if circuito['sondando'] or time.monotonic() < circuito['aberto_ate']:
+                return False
+            circuito['sondando'] = True
+            return True
+
+    def registrar_sucesso(self, url: str):
+        with self._lock:
+            circuito = self._circuito(modelo_endpoint(url))
+            circuito.update(falhas=0, aberto_ate=None, sondando=False)
+
+    def registrar_falha(self, url: str) -> bool:
+        """
+        Conta uma falha; True se o circuito está aberto depois dela (não
+        vale retentar). Só a falha que abre (ou a sondagem que reabre) o
+        circuito renova a espera e registra a abertura; as das chamadas
+        que já estavam em andamento apenas o encontram aberto.
+        """
+        modelo = modelo_endpoint(url)
+        with self._lock:
+            circuito = self._circuito(modelo)
+            circuito['falhas'] += 1
+            if circuito['aberto_ate'] is not None and not circuito['sondando']:
+                return True
+            if not circuito['sondando'] and circuito['falhas'] < self.falhas_para_abrir:
+                return False
+            circuito.update(aberto_ate=time.monotonic() + self.espera, sondando=False)
+        obter_coletor().registrar_circuito(url, recusada=False)
+        print(f"   ⛔ API instável em {modelo}: chamadas suspensas por {self.espera:.0f}s")
+        return True
+
+
+def _cabecalhos_condicionais(etag: Optional[str], last_modified: Optional[str]) -> dict:
+    """Headers do GET condicional a partir dos validadores guardados no cache."""
+    cabecalhos = {}
+    if etag:
+        cabecalhos['If-None-Match'] = etag
+    if last_modified:
+        cabecalhos['If-Modified-Since'] = last_modified
+    return cabecalhos
+
+
+def _ler_retry_after(valor: Optional[str]) -> Optional[float]:
+    """Converte o header Retry-After (segundos ou data HTTP) em segundos."""
+    if not valor:
+        return None
+    try:
+        return max(0.0, float(valor))
+    except ValueError:
+        pass
+    try:
+        data = parsedate_to_datetime(valor)
+        if data.tzinfo is None:
+            data = data.replace(tzinfo=timezone.utc)
+        return max(0.0, (data - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+# =============================================================================
+# CLIENTE
+# =============================================================================
+
+class SofaScoreClient:
+    """Cliente HTTP com sessão keep-alive compartilhada para a API do SofaScore."""
+
+    def __init__(self, headers: dict = None, timeout: float = TIMEOUT_PADRAO,
+                 tamanho_pool: int = TAMANHO_POOL, cache: CacheRespostas = None,
+                 max_simultaneas: int = MAX_REQUISICOES_SIMULTANEAS):
+        self.timeout = timeout
+        self.cache = cache
+        self._semaforo = threading.BoundedSemaphore(max_simultaneas)
+        self.limitador = LimitadorTaxa()
+        self.disjuntor = DisjuntorEndpoints()
+        self.retentativas_restantes = ORCAMENTO_RETENTATIVAS
+        self._lock_orcamento = threading.Lock()
+        self.contadores = {'requisicoes': 0, 'bytes_recebidos': 0, 'acertos_cache': 0, 'revalidacoes': 0}
+        self._lock_contadores = threading.Lock()
+        # --warmup: respostas guardadas valem pelo menos até este instante
+        self.validade_minima: Optional[float] = None
+        self.session = requests.Session()
+        self.session.headers.update(headers or HEADERS)
+
+        adaptador = HTTPAdapter(pool_connections=tamanho_pool, pool_maxsize=tamanho_pool)
+        self.session.mount('https://', adaptador)
+        self.session.mount('http://', adaptador)
+        configurar_sessao(self.session, tamanho_pool)
+
+    def buscar_json(self, url: str, timeout: float = None, levantar_erro: bool = False,
+                    ttl: float = None, decodificar: Callable[[bytes], dict] = None) -> Optional[dict]:
+        """
+        Faz GET e retorna o JSON da resposta.
+
+        Por padrão devolve None em qualquer falha (timeout, HTTP != 200,
+        JSON inválido). Com levantar_erro=True a exceção é propagada.
+
+        ttl sobrescreve o TTL da classe do endpoint (0 = ignora o cache,
+        SEM_EXPIRACAO = guarda para sempre).
+
+        decodificar substitui o json.loads do corpo (ex.: leitura em fluxo
+        que só guarda parte do payload); deve levantar ValueError se o
+        corpo for inválido. O cache continua guardando o corpo original.
+        """
+        try:
+            return self._obter(url, timeout, ttl, decodificar or json.loads)
+        except (requests.exceptions.RequestException, json.JSONDecodeError, ValueError):
+            if levantar_erro:
+                raise
+            return None
+
+    def buscar_conteudo(self, url: str, timeout: float = None, ttl: float = None) -> Optional[bytes]:
+        """
+        Faz GET e retorna o corpo bruto (ex.: feeds RSS do Google News).
+        Usa o cache (com revalidação condicional) se a classe do endpoint
+        ou o ttl informado permitir. Devolve None em qualquer falha.
+        """
+        try:
+            return self._obter(url, timeout, ttl, bytes)
+        except requests.exceptions.RequestException:
+            return None
+
+    def _obter(self, url: str, timeout: Optional[float], ttl: Optional[float], decodificar: Callable):
+        """
+        Cache → GET (condicional se houver entrada vencida com validador) →
+        decodificar(corpo). Só guarda no cache corpos que decodificaram.
+        """
+        if ttl is None:
+            ttl = ttl_para_url(url)
+        usar_cache = self.cache is not None and ttl != 0
+
+        # Aquecendo: lê com o TTL normal (vê árbitros publicados desde o
+        # último aquecimento), mas grava valendo até a data alvo
+        idade_maxima = None
+        if usar_cache and self.validade_minima is not None and ttl != SEM_EXPIRACAO:
+            idade_maxima = ttl
+            ttl = max(ttl, self.validade_minima - time.time())
+
+        vencida = None
+        cabecalhos = None
+        if usar_cache:
+            corpo = self.cache.obter(url, idade_maxima)
+            obter_coletor().registrar_cache(url, corpo is not None)
+            if corpo is not None:
+                self._contar('acertos_cache')
+                return decodificar(corpo)
+
+            vencida = self.cache.obter_para_revalidar(url)
+            if vencida is not None:
+                cabecalhos = _cabecalhos_condicionais(vencida[1], vencida[2])
+
+        response = self._requisitar(url, timeout or self.timeout, cabecalhos)
+
+        if response.status_code == 304:
+            self.cache.renovar(url, ttl)
+            self._contar('revalidacoes')
+            obter_coletor().registrar_revalidacao(url)
+            return decodificar(vencida[0])
+
+        conteudo = response.content
+        dados = decodificar(conteudo)
+
+        if usar_cache:
+            self.cache.guardar(url, conteudo, ttl, response.headers.get('ETag'),
+                               response.headers.get('Last-Modified'))
+        return dados
+
+    def _requisitar(self, url: str, timeout: float, cabecalhos: dict = None) -> requests.Response:
+        """
+        GET com limitador de taxa e retentativas para falhas transitórias.
+        Com cabecalhos condicionais (If-None-Match...), 304 também é sucesso.
+        Levanta a última exceção se todas as tentativas falharem, ou
+        CircuitoAberto se o endpoint estiver suspenso pelo disjuntor.
+        """
+        for tentativa in range(1, MAX_TENTATIVAS + 1):
+            if not self.disjuntor.permitir(url):
+                obter_coletor().registrar_circuito(url, recusada=True)
+                raise CircuitoAberto(f"Circuito aberto para {modelo_endpoint(url)}")
+
+            self.limitador.aguardar()
+            espera = None
+
+            try:
+                with self._semaforo:
+                    inicio = time.perf_counter()
+                    response = self.session.get(url, timeout=timeout, headers=cabecalhos)
+                    segundos = time.perf_counter() - inicio
+                self._contar('requisicoes')
+                self._contar('bytes_recebidos', len(response.content))
+                obter_coletor().registrar_requisicao(url, segundos, len(response.content), response.status_code)
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+                obter_coletor().registrar_requisicao(url, time.perf_counter() - inicio)
+                if self._registrar_falha(url):
+                    raise
+                erro = e
+            except requests.exceptions.RequestException:
+                self._registrar_falha(url)
+                raise
+            else:
+                if response.status_code == 200 or (response.status_code == 304 and cabecalhos):
+                    self.limitador.registrar_sucesso()
+                    self.disjuntor.registrar_sucesso(url)
+                    return response
+
+                erro = requests.exceptions.HTTPError(f"HTTP {response.status_code}", response=response)
+                if response.status_code in STATUS_FALHA_CIRCUITO:
+                    if self._registrar_falha(url):
+                        raise erro
+                else:
+                    # 404 e afins: a API respondeu, só não há o recurso
+                    self.disjuntor.registrar_sucesso(url)
+                if response.status_code not in STATUS_RETENTAVEIS:
+                    raise erro
+
+                if response.status_code == 429:
+                    self.limitador.registrar_limite()
+                    espera = _ler_retry_after(response.headers.get('Retry-After'))
+                    if espera is not None:
+                        self.limitador.pausar(min(espera, BACKOFF_MAXIMO))
+
+            if tentativa == MAX_TENTATIVAS or not self._consumir_retentativa():
+                raise erro
+            obter_coletor().registrar_retentativa(url)
+
+            if espera is None:
+                time.sleep(self._backoff(tentativa))
+
+    def _registrar_falha(self, url: str) -> bool:
+        """Conta a falha no disjuntor; True se o circuito está aberto (não vale retentar)."""
+        return self.disjuntor.registrar_falha(url)
+
+    def _backoff(self, tentativa: int) -> float:
+        """Backoff exponencial com jitter (entre metade e o teto da janela)."""
+        teto = min(BACKOFF_MAXIMO, BACKOFF_BASE * (2 ** (tentativa - 1)))
+        return random.uniform(teto / 2, teto)
+
+    def _consumir_retentativa(self) -> bool:
+        """Desconta uma retentativa do orçamento da execução (False se esgotado)."""
+        with self._lock_orcamento:
+            if self.retentativas_restantes <= 0:
+                return False
+            self.retentativas_restantes -= 1
+            return True
+
+    def _contar(self, contador: str, quantidade: int = 1):
+        with self._lock_contadores:
+            self.contadores[contador] += quantidade
+
+    def resumo_contadores(self) -> dict:
+        """Requisições feitas, bytes recebidos, acertos de cache, revalidações (304) e retentativas usadas."""
+        with self._lock_contadores:
+            resumo = dict(self.contadores)
+        resumo['retentativas'] = ORCAMENTO_RETENTATIVAS - self.retentativas_restantes
+        return resumo
+
+    def fechar(self):
+        """Fecha a sessão e libera as conexões do pool."""
+        self.session.close()
+        if self.cache is not None:
+            self.cache.fechar()
+
+
+# Instância global
+_cliente: SofaScoreClient = None
+
+def obter_cliente() -> SofaScoreClient:
+    """Obtém ou cria o cliente compartilhado."""
+    global _cliente
+    if _cliente is None:
+        # Gravando/reproduzindo cassetes, toda requisição precisa ir à "rede"
+        usar_cache = USAR_CACHE_PERSISTENTE and modo_http() is None
+        cache = CacheRespostas() if usar_cache else None
+        _cliente = SofaScoreClient(cache=cache)
+    return _cliente
+
+def reiniciar_cliente():
+    """Fecha o cliente compartilhado; o próximo obter_cliente() cria outro."""
+    global _cliente
+    if _cliente is not None:
+        _cliente.fechar()
+        _cliente = None
@@ -0,0 +1,799 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+=============================================================================
+MODELOS DE DADOS DA API SOFASCORE
+=============================================================================
+Autor: RefStats
+
+Estruturas montadas a partir das respostas da API e compartilhadas entre
+o sistema unificado e o validador, para que cada payload seja baixado e
+percorrido uma única vez por execução.
+
+    - AgendaDiaria: /sport/football/scheduled-events/{data} decodificada
+      evento a evento (só os campos usados de cada um) e indexada por
+      torneio, time e evento
+    - EventStats: /event/{id}/statistics lido em uma única passada,
+      com faltas/amarelos/vermelhos por período (memoizado por evento)
+    - ServicoClassificacao: temporada e tabela de cada liga baixadas uma
+      vez por execução, com índice team_id → linha
+    - EventDetail: /event/{id} baixado uma vez por partida, com estádio,
+      árbitro, rodada/fase, status e ids dos times
+    - TeamTimeline: jogos passados e futuros de um time numa única
+      lista ordenada (last/0 + next/0 baixados uma vez por execução)
+    - Eventos recentes de árbitros/times, estatísticas de jogos
+      finalizados e classificações lidos primeiro do banco local
+      (banco_local.py); a API só é chamada quando o banco não cobre
+=============================================================================
+"""
+
+import re
+import json
+import time
+import bisect
+import threading
+from datetime import datetime
+from collections import defaultdict
+from typing import Optional, List, Dict, Tuple, Callable
+
+import requests
+
+from cliente_sofascore import BASE_URL, obter_cliente
+from cache_respostas import SEM_EXPIRACAO, HORA
+from banco_local import obter_banco_local
+
+
+# Um jogo que começou antes do limite já terminou se a lista foi
+# sincronizada pelo menos este tempo depois do limite
+MARGEM_SINCRONIZACAO = 4 * HORA
+
+# Idade máxima de um snapshot de classificação reaproveitado do banco
+VALIDADE_CLASSIFICACAO = 6 * HORA
+
+# Teto de páginas /events/last/N baixadas numa única consulta de histórico
+MAX_PAGINAS_HISTORICO = 20
+
+
+# =============================================================================
+# MEMOIZAÇÃO COMPARTILHADA
+# =============================================================================
+
+class _MemoPorChave:
+    """
+    Memoização thread-safe: cada chave é calculada uma única vez, mesmo
+    com várias threads pedindo ao mesmo tempo. Resultados None não são
+    guardados (uma falha de rede pode ser tentada de novo).
+    """
+
+    def __init__(self):
+        self._valores = {}
+        self._locks = defaultdict(threading.Lock)
+        self._lock = threading.Lock()
+
+    def obter(self, chave, fabrica: Callable):
+        with self._lock:
+            if chave in self._valores:
+                return self._valores[chave]
+            lock_chave = self._locks[chave]
+
+        with lock_chave:
+            with self._lock:
+                if chave in self._valores:
+                    return self._valores[chave]
+
+            valor = fabrica()
+            if valor is not None:
+                with self._lock:
+                    self._valores[chave] = valor
+            return valor
+
+    def descartar(self, chave):
+        with self._lock:
+            self._valores.pop(chave, None)
+
+    def limpar(self):
+        with self._lock:
+            self._valores.clear()
+            self._locks.clear()
+
+
+# =============================================================================
+# AGENDA DO DIA
+# =============================================================================
+
+class AgendaDiaria:
+    """Snapshot da agenda de um dia, indexada por torneio, time e evento."""
+
+    def __init__(self, data_api: str, eventos: List[dict]):
+        self.data_api = data_api
+        self.eventos = eventos
+        self.por_torneio: Dict[int, List[dict]] = defaultdict(list)
+        self.por_time: Dict[int, List[dict]] = defaultdict(list)
+        self.por_id: Dict[int, dict] = {}
+
+        for evento in eventos:
+            torneio_id = evento.get('tournament', {}).get('uniqueTournament', {}).get('id')
+            if torneio_id is not None:
+                self.por_torneio[torneio_id].append(evento)
+
+            for lado in ('homeTeam', 'awayTeam'):
+                team_id = evento.get(lado, {}).get('id')
+                if team_id is not None:
+                    self.por_time[team_id].append(evento)
+
+            if 'id' in evento:
+                self.por_id[evento['id']] = evento
+
+    def eventos_do_torneio(self, torneio_id: int) -> List[dict]:
+        """Eventos do dia de um uniqueTournament."""
+        return self.por_torneio.get(torneio_id, [])
+
+    def eventos_do_time(self, team_id: int) -> List[dict]:
+        """Eventos do dia em que o time joga (casa ou fora)."""
+        return self.por_time.get(team_id, [])
+
+    def evento(self, event_id: int) -> Optional[dict]:
+        """Evento pelo id, se estiver na agenda do dia."""
+        return self.por_id.get(event_id)
+
+
+# Campos de cada evento da agenda que o sistema e o validador usam
+# (True = valor inteiro; dict = só estas subchaves). O resto é descartado.
+CAMPOS_EVENTO_AGENDA = {
+    'id': True,
+    'startTimestamp': True,
+    'roundInfo': True,
+    'tournament': {'id': True, 'name': True, 'uniqueTournament': {'id': True, 'name': True}},
+    'homeTeam': {'id': True, 'name': True},
+    'awayTeam': {'id': True, 'name': True},
+    'status': {'code': True, 'type': True, 'description': True},
+    'homeScore': {'current': True},
+    'awayScore': {'current': True},
+}
+
+
+def _compilar_campos(campos: dict) -> tuple:
+    """CAMPOS_EVENTO_AGENDA → ((chave, subcampos ou None), ...), mais rápido de percorrer."""
+    return tuple((chave, None if sub is True else _compilar_campos(sub)) for chave, sub in campos.items())
+
+_CAMPOS_COMPILADOS = _compilar_campos(CAMPOS_EVENTO_AGENDA)
+
+_RE_INICIO_EVENTOS = re.compile(r'\s*\{\s*"events"\s*:\s*\[\s*')
+_RE_SEPARADOR = re.compile(r'\s*(,|\])\s*')
+
+
+def _projetar(valor: dict, campos: tuple) -> dict:
+    """Mantém de `valor` só os `campos` (compilados por _compilar_campos)."""
+    projetado = {}
+    for chave, sub in campos:
+        if chave in valor:
+            item = valor[chave]
+            projetado[chave] = item if sub is None or not isinstance(item, dict) else _projetar(item, sub)
+    return projetado
+
+
+def ler_agenda_em_fluxo(corpo: bytes) -> dict:
+    """
+    Decodifica o payload de scheduled-events evento a evento, reduzindo
+    cada um a CAMPOS_EVENTO_AGENDA antes de ler o próximo. O corpo é
+    convertido inteiro para uma str logo no início; o que se evita é
+    montar a árvore de dicionários de todos os eventos completos de uma
+    vez (só o evento atual existe inteiro enquanto é projetado).
+    Levanta ValueError se o corpo não for JSON válido.
+    """
+    texto = corpo.decode('utf-8') if isinstance(corpo, bytes) else corpo
+    inicio = _RE_INICIO_EVENTOS.match(texto)
+    if not inicio:
+        # Formato inesperado (outras chaves antes de "events"): leitura inteira
+        dados = json.loads(texto)
+        return {'events': [_projetar(e, _CAMPOS_COMPILADOS) for e in dados.get('events', [])]}
+
+    decodificador = json.JSONDecoder()
+    eventos = []
+    posicao = inicio.end()
+    if texto.startswith(']', posicao):
+        return {'events': eventos}
+
+    while True:
+        evento, posicao = decodificador.raw_decode(texto, posicao)
+        eventos.append(_projetar(evento, _CAMPOS_COMPILADOS))
+        separador = _RE_SEPARADOR.match(texto, posicao)
+        if not separador:
+            raise ValueError(f"JSON inválido na agenda (posição {posicao})")
+        posicao = separador.end()
+        if separador.group(1) == ']':
+            return {'events': eventos}
+
+
+# Agendas já carregadas nesta execução (data_api → AgendaDiaria)
+_agendas = _MemoPorChave()
+
+def obter_agenda(data_api: str) -> Optional[AgendaDiaria]:
+    """
+    Obtém a agenda do dia (YYYY-MM-DD), baixando-a no máximo uma vez por execução.
+    Retorna None se a API não responder.
+    """
+    def _baixar():
+        url = f"{BASE_URL}/sport/football/scheduled-events/{data_api}"
+        dados = obter_cliente().buscar_json(url, decodificar=ler_agenda_em_fluxo)
+        if not dados or 'events' not in dados:
+            return None
+        return AgendaDiaria(data_api, dados['events'])
+
+    return _agendas.obter(data_api, _baixar)
+
+
+# =============================================================================
+# DETALHE DO EVENTO
+# =============================================================================
+
+def fase_da_rodada(round_info: dict) -> str:
+    """Fase/rodada exibida no card a partir do roundInfo do evento"""
+    round_info = round_info or {}
+    round_name = round_info.get('name', '')
+    round_round = round_info.get('round', '')
+    
+    if round_name:
+        round_lower = round_name.lower()
+        if 'final' in round_lower and 'semi' not in round_lower and 'quarter' not in round_lower:
+            return 'FINAL'
+        elif 'semi' in round_lower:
+            return 'SEMIFINAL'
+        elif 'quarter' in round_lower or 'quartas' in round_lower:
+            return 'QUARTAS'
+        elif 'oitavas' in round_lower or 'round of 16' in round_lower:
+            return 'OITAVAS'
+        elif round_round:
+            return f'{round_round}ª Rodada'
+    elif round_round:
+        return f'{round_round}ª Rodada'
+    
+    return ''
+
+
+class EventDetail:
+    """Dados de /event/{id} usados pela análise de uma partida."""
+
+    def __init__(self, evento: dict):
+        status = evento.get('status', {})
+        torneio = evento.get('tournament', {})
+
+        self.event_id = evento.get('id')
+        self.status_codigo = status.get('code')
+        self.status_tipo = status.get('type', '')
+        self.status_descricao = status.get('description', '')
+        self.start_timestamp = evento.get('startTimestamp', 0)
+        self.time_casa_id = evento.get('homeTeam', {}).get('id')
+        self.time_fora_id = evento.get('awayTeam', {}).get('id')
+        self.torneio_id = torneio.get('uniqueTournament', {}).get('id')
+        self.round_info = evento.get('roundInfo', {}) or {}
+        self.fase = fase_da_rodada(self.round_info)
+
+        venue = evento.get('venue', {})
+        self.estadio = None
+        if venue:
+            self.estadio = {
+                'nome': venue.get('stadium', {}).get('name', 'Estádio não informado'),
+                'cidade': venue.get('city', {}).get('name', 'Cidade não informada'),
+                'pais': venue.get('country', {}).get('name', ''),
+                'latitude': venue.get('latitude'),
+                'longitude': venue.get('longitude')
+            }
+
+        arbitro = evento.get('referee')
+        self.arbitro = None
+        if arbitro and 'id' in arbitro:
+            self.arbitro = {
+                'id': arbitro['id'],
+                'nome': arbitro.get('name', ''),
+                'pais': arbitro.get('country', {}).get('name', 'N/A'),
+                'pais_codigo': arbitro.get('country', {}).get('alpha2', 'N/A')
+            }
+
+    @property
+    def finalizada(self) -> bool:
+        return self.status_codigo == 100 or self.status_tipo == 'finished'
+
+
+# Detalhes já lidos nesta execução (event_id → EventDetail)
+_detalhes = _MemoPorChave()
+
+def obter_detalhe_evento(event_id: int, atualizar: bool = False) -> Optional[EventDetail]:
+    """
+    Obtém /event/{id} com uma única requisição por execução.
+    Com atualizar=True ignora o que já foi carregado e o cache em disco
+    (árbitro e status recém-publicados). Retorna None se a API não responder.
+    """
+    if not event_id:
+        return None
+
+    if atualizar:
+        _detalhes.descartar(event_id)
+
+    def _baixar():
+        dados = obter_cliente().buscar_json(f"{BASE_URL}/event/{event_id}", ttl=0 if atualizar else None)
+        if not dados or 'event' not in dados:
+            return None
+        return EventDetail(dados['event'])
+
+    return _detalhes.obter(event_id, _baixar)
+
+
+# =============================================================================
+# ESTATÍSTICAS DE EVENTO
+# =============================================================================
+
+# Palavras-chave (minúsculas) de cada estatística usada pelo sistema
+METRICAS_ESTATISTICAS = {
+    'faltas': ("fouls", "fouls committed", "faltas", "faltas cometidas"),
+    'amarelos': ("yellow card", "yellow cards"),
+    'vermelhos': ("red card", "red cards"),
+}
+
+PERIODOS_ESTATISTICAS = ("1ST", "2ND", "ALL")
+
+
+def extrair_valor_estatistica(valor) -> int:
+    """Extrai valor numérico de uma estatística"""
+    if valor is None:
+        return 0
+    if isinstance(valor, (int, float)):
+        return int(valor)
+    if isinstance(valor, str):
+        try:
+            return int(float(valor.strip()))
+        except:
+            return 0
+    return 0
+
+
+class EventStats:
+    """
+    Estatísticas de um evento lidas em uma única passada pelo JSON.
+
+    Para cada métrica de METRICAS_ESTATISTICAS guarda os valores
+    home/away por período (1ST, 2ND, ALL). Mantém a regra histórica:
+    dentro de um grupo vale o primeiro item que casar; grupos seguintes
+    sobrescrevem. Também guarda a lista compacta de itens, na ordem da
+    API, para consultas avulsas (ex.: validador).
+
+    Pode ser montado a partir do JSON da API (dados) ou das linhas
+    (período, grupo, nome, home, away) gravadas no banco local.
+    """
+
+    def __init__(self, event_id: int, dados: dict = None,
+                 linhas: List[Tuple[str, int, str, object, object]] = None):
+        self.event_id = event_id
+        self.linhas = linhas if linhas is not None else self._linhas_do_json(dados)
+        self.itens: List[Tuple[str, str, object, object]] = [
+            (period, nome_stat, home, away) for period, _, nome_stat, home, away in self.linhas
+        ]
+        self._valores = {
+            metrica: {p: {"home": 0, "away": 0} for p in PERIODOS_ESTATISTICAS}
+            for metrica in METRICAS_ESTATISTICAS
+        }
+
+        grupo_atual = None
+        casadas_no_grupo = set()
+        for period, grupo, nome_stat, home, away in self.linhas:
+            if grupo != grupo_atual:
+                grupo_atual = grupo
+                casadas_no_grupo = set()
+
+            for metrica, keywords in METRICAS_ESTATISTICAS.items():
+                if metrica in casadas_no_grupo:
+                    continue
+                if any(kw in nome_stat for kw in keywords):
+                    self._valores[metrica][period] = {
+                        "home": extrair_valor_estatistica(home),
+                        "away": extrair_valor_estatistica(away),
+                    }
+                    casadas_no_grupo.add(metrica)
+
+    @staticmethod
+    def _linhas_do_json(dados: dict) -> List[Tuple[str, int, str, object, object]]:
+        """Achata o JSON de /statistics em (período, grupo, nome, home, away)."""
+        linhas = []
+        grupo_id = 0
+        for bloco in (dados or {}).get("statistics", []):
+            period = bloco.get("period", "ALL")
+            if period not in PERIODOS_ESTATISTICAS:
+                period = "ALL"
+
+            for grupo in bloco.get("groups", []):
+                grupo_id += 1
+                for item in grupo.get("statisticsItems", []):
+                    nome_stat = (item.get("name", "") or "").lower()
+                    linhas.append((period, grupo_id, nome_stat, item.get("home", 0), item.get("away", 0)))
+        return linhas
+
+    def periodos(self, metrica: str) -> Dict[str, Dict[str, int]]:
+        """Cópia dos valores {período: {home, away}} de uma métrica (pode ser alterada pelo chamador)."""
+        return {p: dict(v) for p, v in self._valores[metrica].items()}
+
+    def primeiro_item(self, predicado: Callable[[str], bool]) -> Optional[Tuple[object, object]]:
+        """(home, away) brutos do primeiro item, na ordem da API, cujo nome satisfaz o predicado."""
+        for _, nome_stat, home, away in self.itens:
+            if predicado(nome_stat):
+                return home, away
+        return None
+
+
+# Estatísticas já lidas nesta execução (event_id → EventStats)
+_estatisticas = _MemoPorChave()
+
+def obter_estatisticas_evento(event_id: int, finalizada: bool = False) -> Optional[EventStats]:
+    """
+    Obtém as estatísticas do evento com uma única requisição por execução.
+    finalizada=True lê/grava no banco local (o jogo não muda mais) e
+    guarda a resposta no cache persistente para sempre.
+    Retorna None se a API não responder ou o jogo não tiver estatísticas.
+    """
+    if not event_id:
+        return None
+
+    banco = obter_banco_local() if finalizada else None
+
+    def _baixar():
+        if banco is not None:
+            linhas = banco.estatisticas(event_id)
+            if linhas is not None:
+                return EventStats(event_id, linhas=linhas) if linhas else None
+
+        url = f"{BASE_URL}/event/{event_id}/statistics"
+        try:
+            dados = obter_cliente().buscar_json(url, ttl=SEM_EXPIRACAO if finalizada else None,
+                                                levantar_erro=True)
+        except requests.exceptions.HTTPError as e:
+            # Jogo finalizado sem estatísticas na API: não pergunta de novo
+            if banco is not None and e.response is not None and e.response.status_code == 404:
+                banco.salvar_estatisticas(event_id, [])
+            return None
+        except (requests.exceptions.RequestException, ValueError):
+            return None
+
+        if not dados:
+            return None
+        estatisticas = EventStats(event_id, dados)
+        if banco is not None:
+            banco.salvar_estatisticas(event_id, estatisticas.linhas)
+        return estatisticas
+
+    return _estatisticas.obter(event_id, _baixar)
+
+
+# =============================================================================
+# EVENTOS RECENTES DE ÁRBITROS E TIMES
+# =============================================================================
+
+def _sincronizacao_cobre(banco, sincronizado_em: Optional[float], timestamp_limite: float) -> bool:
+    """
+    A lista sincronizada em `sincronizado_em` serve para o limite sem
+    baixar de novo: foi sincronizada depois que os jogos anteriores ao
+    limite terminaram, ou por um --warmup ainda em vigor para o dia do
+    limite.
+    """
+    if sincronizado_em is None:
+        return False
+    if sincronizado_em >= timestamp_limite + MARGEM_SINCRONIZACAO:
+        return True
+    dia = datetime.fromtimestamp(timestamp_limite).strftime('%d/%m/%Y')
+    inicio = banco.inicio_aquecimento(dia)
+    return inicio is not None and sincronizado_em >= inicio
+
+
+def obter_eventos_recentes(tipo: str, entidade_id: int, timestamp_limite: float) -> Optional[List[dict]]:
+    """
+    Eventos de um árbitro (tipo='referee') ou time (tipo='team') que
+    começaram antes de timestamp_limite, mais recentes primeiro.
+
+    Lê do banco local quando a última sincronização da lista já cobre o
+    limite; caso contrário baixa /{tipo}/{id}/events/last/0, grava no
+    banco e então consulta. Retorna None se a API falhar e o banco não
+    tiver nada.
+    """
+    banco = obter_banco_local()
+    url = f"{BASE_URL}/{tipo}/{entidade_id}/events/last/0"
+
+    if banco is None:
+        dados = obter_cliente().buscar_json(url)
+        if not dados or 'events' not in dados:
+            return None
+        eventos = [e for e in dados['events'] if e.get('startTimestamp', 0) < timestamp_limite]
+        return sorted(eventos, key=lambda e: e.get('startTimestamp', 0), reverse=True)
+
+    chave = f"{tipo}:{entidade_id}:last"
+    sincronizado_em = banco.sincronizado_em(chave)
+
+    if not _sincronizacao_cobre(banco, sincronizado_em, timestamp_limite):
+        agora = time.time()
+        dados = obter_cliente().buscar_json(url)
+        if dados and 'events' in dados:
+            banco.registrar_eventos(dados['events'], arbitro_id=entidade_id if tipo == 'referee' else None)
+            banco.marcar_sincronizado(chave, agora)
+        elif sincronizado_em is None:
+            return None
+
+    if tipo == 'referee':
+        return banco.eventos_arbitro(entidade_id, timestamp_limite)
+    return banco.eventos_time(entidade_id, timestamp_limite)
+
+
+def _evento_finalizado(evento: dict) -> bool:
+    status = evento.get('status', {})
+    return status.get('code') == 100 or status.get('type') == 'finished'
+
+
+def _baixar_pagina_arbitro(arbitro_id: int, pagina: int) -> Optional[dict]:
+    dados = obter_cliente().buscar_json(f"{BASE_URL}/referee/{arbitro_id}/events/last/{pagina}")
+    if not dados or 'events' not in dados:
+        return None
+    return dados
+
+
+def _sincronizar_recentes_arbitro(banco, arbitro_id: int) -> bool:
+    """
+    Traz para o banco só os jogos novos do árbitro: baixa last/0 e segue
+    para last/1, last/2... apenas enquanto nenhuma página alcançar o jogo
+    mais recente já conhecido. Retorna False se a API não respondeu.
+    """
+    mais_recente = banco.inicio_mais_recente_arbitro(arbitro_id)
+    agora = time.time()
+
+    for pagina in range(MAX_PAGINAS_HISTORICO):
+        dados = _baixar_pagina_arbitro(arbitro_id, pagina)
+        if dados is None:
+            if pagina == 0:
+                return False
+            break
+
+        eventos = dados['events']
+        banco.registrar_eventos(eventos, arbitro_id=arbitro_id)
+
+        if pagina == 0 and mais_recente is None:
+            banco.salvar_paginacao(f"referee:{arbitro_id}:antigos", 1, not dados.get('hasNextPage'))
+        if mais_recente is None or not dados.get('hasNextPage'):
+            break
+        if any(e.get('startTimestamp', 0) <= mais_recente for e in eventos):
+            break
+
+    banco.marcar_sincronizado(f"referee:{arbitro_id}:last", agora)
+    return True
+
+
+def obter_historico_arbitro(arbitro_id: int, timestamp_limite: float, quantidade: int) -> List[dict]:
+    """
+    Jogos finalizados do árbitro que começaram antes de timestamp_limite,
+    mais recentes primeiro (até `quantidade`).
+
+    Histórico incremental no banco local: a atualização diária baixa só a
+    página mais recente (last/0); páginas antigas (last/1, last/2...) são
+    buscadas apenas quando a data alvo precisa de jogos mais velhos do
+    que os já guardados.
+    """
+    banco = obter_banco_local()
+    if banco is None:
+        eventos = obter_eventos_recentes('referee', arbitro_id, timestamp_limite) or []
+        return [e for e in eventos if _evento_finalizado(e)][:quantidade]
+
+    sincronizado_em = banco.sincronizado_em(f"referee:{arbitro_id}:last")
+    if not _sincronizacao_cobre(banco, sincronizado_em, timestamp_limite):
+        if not _sincronizar_recentes_arbitro(banco, arbitro_id) and sincronizado_em is None:
+            return []
+
+    def _finalizados():
+        return [e for e in banco.eventos_arbitro(arbitro_id, timestamp_limite) if _evento_finalizado(e)]
+
+    eventos = _finalizados()
+    chave_antigos = f"referee:{arbitro_id}:antigos"
+    proxima_pagina, esgotada = banco.paginacao(chave_antigos)
+    paginas_baixadas = 0
+
+    while len(eventos) < quantidade and not esgotada and paginas_baixadas < MAX_PAGINAS_HISTORICO:
+        dados = _baixar_pagina_arbitro(arbitro_id, proxima_pagina)
+        if dados is None:
+            break
+
+        banco.registrar_eventos(dados['events'], arbitro_id=arbitro_id)
+        proxima_pagina += 1
+        paginas_baixadas += 1
+        esgotada = not dados.get('hasNextPage') or not dados['events']
+        banco.salvar_paginacao(chave_antigos, proxima_pagina, esgotada)
+        eventos = _finalizados()
+
+    return eventos[:quantidade]
+
+
+# =============================================================================
+# LINHA DO TEMPO DOS TIMES
+# =============================================================================
+
+class TeamTimeline:
+    """
+    Jogos de um time (passados e futuros) sem duplicatas e ordenados por
+    início, montados uma vez por execução. "N jogos antes/depois de X" é
+    respondido por busca binária nos startTimestamps.
+
+    Cada metade é carregada só quando alguém precisa dela:
+        - passado: obter_eventos_recentes('team', ...) (banco local → last/0)
+        - futuro:  /team/{id}/events/next/0
+    """
+
+    def __init__(self, team_id: int):
+        self.team_id = team_id
+        self._por_id: Dict[int, dict] = {}
+        self._eventos: List[dict] = []
+        self._inicios: List[int] = []
+        self._passado_ate: Optional[float] = None
+        # Passado já carregado até "agora": nenhum limite pede mais nada
+        self._passado_completo = False
+        self._futuro_carregado = False
+        self._lock = threading.Lock()
+
+    def _mesclar(self, eventos: List[dict]):
+        for evento in eventos:
+            if evento.get('id'):
+                self._por_id[evento['id']] = evento
+        self._eventos = sorted(self._por_id.values(), key=lambda e: e.get('startTimestamp', 0))
+        self._inicios = [e.get('startTimestamp', 0) for e in self._eventos]
+
+    def _garantir_passado(self, timestamp: float):
+        if self._passado_completo or (self._passado_ate is not None and self._passado_ate >= timestamp):
+            return
+        eventos = obter_eventos_recentes('team', self.team_id, timestamp)
+        if eventos is not None:
+            self._mesclar(eventos)
+            self._passado_ate = timestamp
+
+    def _garantir_passado_completo(self):
+        """Passado até agora, carregado uma única vez por execução."""
+        if self._passado_completo:
+            return
+        agora = time.time()
+        self._garantir_passado(agora)
+        # Se a API falhou, fica para a próxima consulta
+        self._passado_completo = self._passado_ate is not None and self._passado_ate >= agora
+
+    def _garantir_futuro(self):
+        if self._futuro_carregado:
+            return
+        dados = obter_cliente().buscar_json(f"{BASE_URL}/team/{self.team_id}/events/next/0")
+        if dados and 'events' in dados:
+            self._mesclar(dados['events'])
+            self._futuro_carregado = True
+
+    def antes_de(self, timestamp: float, quantidade: int = None) -> List[dict]:
+        """Jogos que começaram antes de timestamp, mais recentes primeiro."""
+        with self._lock:
+            self._garantir_passado(timestamp)
+            fim = bisect.bisect_left(self._inicios, timestamp)
+            inicio = max(0, fim - quantidade) if quantidade else 0
+            return self._eventos[inicio:fim][::-1]
+
+    def depois_de(self, timestamp: float, quantidade: int = None) -> List[dict]:
+        """
+        Jogos que começam depois de timestamp, mais próximos primeiro.
+        Para uma data no passado, os jogos seguintes já podem ter
+        acontecido, então o passado até agora também é carregado.
+        """
+        with self._lock:
+            self._garantir_futuro()
+            inicio_hoje = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0).timestamp()
+            if timestamp < inicio_hoje:
+                self._garantir_passado_completo()
+            inicio = bisect.bisect_right(self._inicios, timestamp)
+            fim = inicio + quantidade if quantidade else len(self._eventos)
+            return self._eventos[inicio:fim]
+
+
+_linhas_do_tempo = _MemoPorChave()
+
+
+def obter_linha_do_tempo_time(team_id: int) -> TeamTimeline:
+    """TeamTimeline do time, compartilhada por toda a execução."""
+    return _linhas_do_tempo.obter(team_id, lambda: TeamTimeline(team_id))
+
+
+# =============================================================================
+# CLASSIFICAÇÃO DAS LIGAS
+# =============================================================================
+
+class ServicoClassificacao:
+    """
+    Classificação das ligas compartilhada por todas as partidas da execução.
+    A temporada atual e a tabela de cada liga são baixadas uma única vez;
+    depois cada consulta de posição é uma busca em dicionário.
+    """
+
+    def __init__(self):
+        self._temporadas = _MemoPorChave()
+        self._tabelas = _MemoPorChave()
+
+    def temporada_atual(self, liga_id: int) -> Optional[int]:
+        """Id da temporada mais recente da liga."""
+        def _baixar():
+            dados = obter_cliente().buscar_json(f"{BASE_URL}/unique-tournament/{liga_id}/seasons")
+            seasons = (dados or {}).get('seasons', [])
+            return seasons[0].get('id') if seasons else None
+
+        return self._temporadas.obter(liga_id, _baixar)
+
+    def tabela(self, liga_id: int) -> Dict[int, dict]:
+        """Índice team_id → linha da tabela (vazio se a liga não tiver classificação)."""
+        def _baixar():
+            # Falha devolve None para não ficar guardada no memo: a próxima
+            # consulta da mesma liga tenta de novo.
+            season_id = self.temporada_atual(liga_id)
+            if season_id is None:
+                return None
+
+            banco = obter_banco_local()
+            linhas = None
+            if banco is not None:
+                capturada_apos = time.time() - VALIDADE_CLASSIFICACAO
+                aquecimento = banco.inicio_aquecimento()
+                if aquecimento is not None:
+                    capturada_apos = min(capturada_apos, aquecimento)
+                linhas = banco.classificacao(liga_id, season_id, capturada_apos)
+
+            if linhas is None:
+                url = f"{BASE_URL}/unique-tournament/{liga_id}/season/{season_id}/standings/total"
+                dados = obter_cliente().buscar_json(url)
+                if dados is None:
+                    return None
+
+                linhas = [row for standing_group in dados.get('standings', [])
+                          for row in standing_group.get('rows', [])]
+                if banco is not None:
+                    banco.salvar_classificacao(liga_id, season_id, linhas)
+
+            indice = {}
+            for row in linhas:
+                team_id = row.get('team', {}).get('id')
+                if team_id is not None:
+                    indice.setdefault(team_id, row)
+            return indice
+
+        return self._tabelas.obter(liga_id, _baixar) or {}
+
+    def colocacao(self, team_id: int, liga_id: int) -> Optional[dict]:
+        """Colocação do time na liga, no formato usado pelos relatórios."""
+        if not team_id or not liga_id:
+            return None
+
+        row = self.tabela(liga_id).get(team_id)
+        if row is None:
+            return None
+
+        return {
+            'posicao': row.get('position', 0),
+            'pontos': row.get('points', 0),
+            'jogos': row.get('matches', 0),
+            'vitorias': row.get('wins', 0),
+            'empates': row.get('draws', 0),
+            'derrotas': row.get('losses', 0),
+            'gols_pro': row.get('scoresFor', 0),
+            'gols_contra': row.get('scoresAgainst', 0),
+            'saldo_gols': row.get('scoresFor', 0) - row.get('scoresAgainst', 0),
+        }
+
+
+# Instância global
+_servico_classificacao: ServicoClassificacao = None
+
+def obter_servico_classificacao() -> ServicoClassificacao:
+    """Obtém ou cria o serviço de classificação da execução."""
+    global _servico_classificacao
+    if _servico_classificacao is None:
+        _servico_classificacao = ServicoClassificacao()
+    return _servico_classificacao
+
+
+def limpar_dados_execucao():
+    """Descarta agendas, detalhes, estatísticas, linhas do tempo e classificações já carregados."""
+    global _servico_classificacao
+    _agendas.limpar()
+    _detalhes.limpar()
+    _estatisticas.limpar()
+    _linhas_do_tempo.limpar()
+    _servico_classificacao = None
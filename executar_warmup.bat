@@ -0,0 +1,32 @@
+@echo off
+title RefStats - Aquecimento do Cache
+
+:: Aquece o cache com os jogos de amanhã, sem gerar páginas.
+:: Feito para o Agendador de Tarefas do Windows (ex.: todo dia às 02:00;
+:: uma segunda rodada de manhã cedo traz os árbitros publicados depois).
+:: Requer o venv criado por "executar_sistema_unificado 1_5.bat".
+
+set "SCRIPT_DIR=%~dp0"
+cd /d "%SCRIPT_DIR%"
+
+set "VENV_NAME=venv_unificado"
+
+if not exist "%VENV_NAME%\Scripts\activate.bat" (
+    echo ❌ ERRO: ambiente virtual não encontrado!
+    echo    Execute primeiro "executar_sistema_unificado 1_5.bat".
+    exit /b 1
+)
+
+call "%VENV_NAME%\Scripts\activate.bat"
+
+echo ══════════════════════════════════════════════════════════════════════
+echo   🔥 AQUECENDO CACHE PARA OS JOGOS DE AMANHÃ
+echo ══════════════════════════════════════════════════════════════════════
+echo.
+
+python sistema_unificado_v1_5.py --warmup %*
+set "CODIGO=%errorlevel%"
+
+deactivate >nul 2>&1
+
+exit /b %CODIGO%
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+=============================================================================
+GRAVAÇÃO / REPRODUÇÃO DE REQUISIÇÕES HTTP (CASSETES)
+=============================================================================
+Autor: RefStats
+
+Permite rodar o sistema unificado e o validador sem depender da API do
+SofaScore nem do Google News ao vivo, de forma reproduzível.
+
+MODOS (variáveis de ambiente, lidas pelo SofaScoreClient):
+    REFSTATS_HTTP_MODO=gravar       → grava toda troca HTTP em cassetes
+    REFSTATS_HTTP_MODO=reproduzir   → responde só com os cassetes (offline)
+    REFSTATS_HTTP_SERVIDOR=URL      → envia tudo para o servidor local abaixo
+
+    REFSTATS_CASSETES=pasta         → pasta dos cassetes (padrão: cassetes/)
+    REFSTATS_REPLAY_LATENCIA_MS=50  → latência artificial na reprodução
+    REFSTATS_REPLAY_TAXA_ERRO=0.05  → fração de respostas HTTP 503 injetadas
+
+    Nos modos gravar/reproduzir o cache persistente é desligado, para que
+    toda requisição passe pelos cassetes.
+
+SERVIDOR LOCAL (substituto da API, serve os cassetes):
+    python gravacao_http.py servidor --cassetes cassetes --porta 8765 \
+        --latencia-ms 50 --taxa-erro 0.02
+
+    e, em outro terminal:
+    set REFSTATS_HTTP_SERVIDOR=http://127.0.0.1:8765
+    python sistema_unificado_v1_5.py
+=============================================================================
+"""
+
+import os
+import sys
+import json
+import gzip
+import time
+import base64
+import random
+import hashlib
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+
+# =============================================================================
+# CONFIGURAÇÕES
+# =============================================================================
+
+PASTA_CASSETES_PADRAO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cassetes")
+
+MODO_GRAVAR = 'gravar'
+MODO_REPRODUZIR = 'reproduzir'
+MODO_SERVIDOR = 'servidor'
+
+# Headers de resposta que não fazem sentido reproduzir
+HEADERS_IGNORADOS = {'content-encoding', 'transfer-encoding', 'content-length', 'connection'}
+
+
+def modo_http() -> Optional[str]:
+    """
+    Modo de gravação/reprodução ativo (None = rede normal). Apontar para o
+    servidor local (REFSTATS_HTTP_SERVIDOR) também conta como modo: em
+    qualquer um deles o cache persistente e o banco em disco ficam de fora.
+    """
+    modo = os.environ.get('REFSTATS_HTTP_MODO', '').strip().lower()
+    if modo in (MODO_GRAVAR, MODO_REPRODUZIR):
+        return modo
+    return MODO_SERVIDOR if os.environ.get('REFSTATS_HTTP_SERVIDOR', '').strip() else None
+
+
+def pasta_cassetes() -> str:
+    return os.environ.get('REFSTATS_CASSETES') or PASTA_CASSETES_PADRAO
+
+
+# =============================================================================
+# CASSETES
+# =============================================================================
+
+def chave_cassete(url: str, metodo: str = 'GET') -> str:
+    """Chave estável da troca: método + URL (host, caminho e query)."""
+    partes = urlsplit(url)
+    alvo = f"{metodo.upper()} {partes.netloc}{partes.path}"
+    if partes.query:
+        alvo += f"?{partes.query}"
+    return hashlib.sha1(alvo.encode('utf-8')).hexdigest()
+
+
+def caminho_cassete(pasta: str, url: str, metodo: str = 'GET') -> str:
+    chave = chave_cassete(url, metodo)
+    return os.path.join(pasta, chave[:2], f"{chave}.json.gz")
+
+
+def gravar_cassete(pasta: str, url: str, metodo: str, status: int, headers: dict, corpo: bytes):
+    """Grava uma troca HTTP (gzip + JSON, corpo em base64)."""
+    caminho = caminho_cassete(pasta, url, metodo)
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+
+    registro = {
+        'metodo': metodo.upper(),
+        'url': url,
+        'status': status,
+        'headers': {k: v for k, v in headers.items() if k.lower() not in HEADERS_IGNORADOS},
+        'corpo_b64': base64.b64encode(corpo or b'').decode('ascii'),
+        'gravado_em': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+    temporario = f"{caminho}.{threading.get_ident()}.tmp"
+    with gzip.open(temporario, 'wt', encoding='utf-8') as f:
+        json.dump(registro, f)
+    os.replace(temporario, caminho)
+
+
+def carregar_cassete(pasta: str, url: str, metodo: str = 'GET') -> Optional[dict]:
+    """Carrega a troca gravada para a URL (corpo já decodificado em bytes)."""
+    caminho = caminho_cassete(pasta, url, metodo)
+    if not os.path.exists(caminho):
+        return None
+    with gzip.open(caminho, 'rt', encoding='utf-8') as f:
+        registro = json.load(f)
+    registro['corpo'] = base64.b64decode(registro.pop('corpo_b64', ''))
+    return registro
+
+
+# =============================================================================
+# ADAPTADORES DO REQUESTS
+# =============================================================================
+
+class AdaptadorGravacao(HTTPAdapter):
+    """Adaptador que faz a requisição real e grava a resposta em cassete."""
+
+    def __init__(self, pasta: str, **kwargs):
+        super().__init__(**kwargs)
+        self.pasta = pasta
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        gravar_cassete(self.pasta, request.url, request.method, response.status_code,
+                       dict(response.headers), response.content)
+        return response
+
+
+class AdaptadorReproducao(BaseAdapter):
+    """Adaptador offline: responde com os cassetes, com latência e erros injetáveis."""
+
+    def __init__(self, pasta: str, latencia_ms: float = 0, taxa_erro: float = 0.0):
+        super().__init__()
+        self.pasta = pasta
+        self.latencia_ms = latencia_ms
+        self.taxa_erro = taxa_erro
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        if self.latencia_ms:
+            time.sleep(self.latencia_ms / 1000.0)
+
+        if self.taxa_erro and random.random() < self.taxa_erro:
+            return self._montar_resposta(request, 503, {'X-RefStats-Replay': 'erro-injetado'}, b'')
+
+        registro = carregar_cassete(self.pasta, request.url, request.method)
+        if registro is None:
+            return self._montar_resposta(request, 404, {'X-RefStats-Replay': 'cassete-ausente'}, b'')
+
+        return self._montar_resposta(request, registro['status'], registro.get('headers', {}), registro['corpo'])
+
+    def _montar_resposta(self, request, status: int, headers: dict, corpo: bytes) -> requests.Response:
+        response = requests.Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = corpo
+        response.url = request.url
+        response.request = request
+        response.reason = 'Replay'
+        return response
+
+    def close(self):
+        pass
+
+
+class AdaptadorServidorLocal(HTTPAdapter):
+    """
+    Redireciona toda requisição para o servidor local de cassetes:
+    https://host/caminho?q → {servidor}/host/caminho?q
+    """
+
+    def __init__(self, servidor: str, **kwargs):
+        super().__init__(**kwargs)
+        self.servidor = servidor.rstrip('/')
+
+    def send(self, request, **kwargs):
+        partes = urlsplit(request.url)
+        if not request.url.startswith(self.servidor):
+            novo = f"{self.servidor}/{partes.netloc}{partes.path}"
+            if partes.query:
+                novo += f"?{partes.query}"
+            request.url = novo
+        return super().send(request, **kwargs)
+
+
+def configurar_sessao(session: requests.Session, tamanho_pool: int):
+    """
+    Monta na sessão o adaptador do modo ativo (gravar, reproduzir ou
+    servidor local). Sem variáveis de ambiente, mantém o adaptador normal.
+    """
+    pasta = pasta_cassetes()
+    modo = modo_http()
+    servidor = os.environ.get('REFSTATS_HTTP_SERVIDOR', '').strip()
+
+    if modo == MODO_REPRODUZIR:
+        adaptador = AdaptadorReproducao(
+            pasta,
+            latencia_ms=float(os.environ.get('REFSTATS_REPLAY_LATENCIA_MS', 0) or 0),
+            taxa_erro=float(os.environ.get('REFSTATS_REPLAY_TAXA_ERRO', 0) or 0),
+        )
+    elif modo == MODO_GRAVAR:
+        adaptador = AdaptadorGravacao(pasta, pool_connections=tamanho_pool, pool_maxsize=tamanho_pool)
+    elif modo == MODO_SERVIDOR:
+        adaptador = AdaptadorServidorLocal(servidor, pool_connections=tamanho_pool, pool_maxsize=tamanho_pool)
+    else:
+        return
+
+    session.mount('https://', adaptador)
+    session.mount('http://', adaptador)
+
+
+# =============================================================================
+# SERVIDOR LOCAL
+# =============================================================================
+
+def criar_servidor(pasta: str, porta: int, latencia_ms: float = 0, taxa_erro: float = 0.0,
+                   host: str = '127.0.0.1') -> ThreadingHTTPServer:
+    """Servidor HTTP que responde /host/caminho?query com o cassete de https://host/caminho?query."""
+
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            if latencia_ms:
+                time.sleep(latencia_ms / 1000.0)
+
+            if taxa_erro and random.random() < taxa_erro:
+                self._responder(503, {}, b'')
+                return
+
+            url_original = f"https://{self.path.lstrip('/')}"
+            registro = carregar_cassete(pasta, url_original)
+            if registro is None:
+                self._responder(404, {'X-RefStats-Replay': 'cassete-ausente'}, b'')
+                return
+
+            self._responder(registro['status'], registro.get('headers', {}), registro['corpo'])
+
+        def _responder(self, status: int, headers: dict, corpo: bytes):
+            self.send_response(status)
+            for nome, valor in headers.items():
+                self.send_header(nome, valor)
+            self.send_header('Content-Length', str(len(corpo)))
+            self.end_headers()
+            self.wfile.write(corpo)
+
+        def log_message(self, formato, *args):
+            pass
+
+    return ThreadingHTTPServer((host, porta), _Handler)
+
+
+def main():
+    """Linha de comando: servidor local de cassetes."""
+    parser = argparse.ArgumentParser(description="RefStats - servidor local de cassetes HTTP")
+    sub = parser.add_subparsers(dest='comando')
+
+    p_servidor = sub.add_parser('servidor', help="serve os cassetes gravados como uma API local")
+    p_servidor.add_argument('--cassetes', default=pasta_cassetes())
+    p_servidor.add_argument('--porta', type=int, default=8765)
+    p_servidor.add_argument('--latencia-ms', type=float, default=0)
+    p_servidor.add_argument('--taxa-erro', type=float, default=0.0)
+
+    args = parser.parse_args()
+    if args.comando != 'servidor':
+        parser.print_help()
+        sys.exit(1)
+
+    servidor = criar_servidor(args.cassetes, args.porta, args.latencia_ms, args.taxa_erro)
+    print(f"📼 Servindo cassetes de {args.cassetes} em http://127.0.0.1:{args.porta}")
+    print(f"   Latência: {args.latencia_ms:.0f} ms • Taxa de erro: {args.taxa_erro:.0%}")
+    print(f"   Use: REFSTATS_HTTP_SERVIDOR=http://127.0.0.1:{args.porta}")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+=============================================================================
+MÉTRICAS DA EXECUÇÃO (RELATÓRIO JSON)
+=============================================================================
+Autor: RefStats
+
+Coleta, durante uma execução do sistema unificado, onde o tempo e as
+requisições estão indo:
+
+    - Requisições por modelo de endpoint (/event/{id}/statistics,
+      /team/{id}/events/last/0, ...), com bytes, erros e retentativas
+    - Aberturas do disjuntor por endpoint e chamadas recusadas com o
+      circuito aberto (dados que ficaram faltando na execução)
+    - Acertos e faltas do cache persistente, e revalidações (HTTP 304)
+    - Latência de cada requisição (percentis e histograma)
+    - Duração de cada etapa do fluxo (partidas, análise, HTML...)
+
+O SofaScoreClient registra as requisições; o sistema unificado marca as
+etapas e, no fim, grava relatorios_unificados/execucao_*.json e mostra um
+resumo de uma tela.
+=============================================================================
+"""
+
+import os
+import re
+import json
+import time
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import List, Optional
+from urllib.parse import urlsplit
+
+
+# =============================================================================
+# CONFIGURAÇÕES
+# =============================================================================
+
+VERSAO_RELATORIO = 1
+
+# Limites (ms) das faixas do histograma de latência; a última é "acima de"
+FAIXAS_LATENCIA_MS = (25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+# Recursos da API cujo segmento seguinte é um id numérico
+_RE_ID = re.compile(r'/(event|team|referee|player|unique-tournament|tournament|season)/\d+')
+_RE_DATA = re.compile(r'/\d{4}-\d{2}-\d{2}')
+
+# Linhas de endpoint no resumo da tela
+ENDPOINTS_NO_RESUMO = 10
+
+
+def modelo_endpoint(url: str) -> str:
+    """
+    Agrupa URLs pelo modelo do endpoint:
+    https://api.sofascore.com/api/v1/event/123/statistics → /event/{id}/statistics
+    Outros hosts (ex.: Google News) viram host + caminho.
+    """
+    partes = urlsplit(url)
+    caminho = partes.path
+    if caminho.startswith('/api/v1/'):
+        caminho = caminho[len('/api/v1'):]
+    else:
+        caminho = f"{partes.netloc}{caminho}"
+    caminho = _RE_ID.sub(lambda m: f"/{m.group(1)}/{{id}}", caminho)
+    return _RE_DATA.sub('/{data}', caminho)
+
+
+def _percentil(valores: List[float], fracao: float) -> float:
+    """Percentil por posição mais próxima (valores já ordenados)."""
+    if not valores:
+        return 0.0
+    indice = min(len(valores) - 1, max(0, int(round(fracao * len(valores))) - 1))
+    return valores[indice]
+
+
+# =============================================================================
+# COLETOR
+# =============================================================================
+
+class ColetorMetricas:
+    """Acumula as métricas da execução (seguro para várias threads)."""
+
+    def __init__(self):
+        self.iniciado_em = datetime.now()
+        self._inicio = time.perf_counter()
+        self._endpoints = {}
+        self._etapas = []
+        self._lock = threading.Lock()
+
+    def _endpoint(self, url: str) -> dict:
+        modelo = modelo_endpoint(url)
+        dados = self._endpoints.get(modelo)
+        if dados is None:
+            dados = self._endpoints[modelo] = {
+                'requisicoes': 0, 'erros': 0, 'bytes': 0, 'retentativas': 0,
+                'acertos_cache': 0, 'faltas_cache': 0, 'revalidacoes': 0,
+                'aberturas_circuito': 0, 'recusadas_circuito': 0, 'latencias_ms': [],
+            }
+        return dados
+
+    def registrar_requisicao(self, url: str, segundos: float, tamanho: int = 0, status: Optional[int] = None):
+        """Uma ida à rede (status None = timeout/erro de conexão)."""
+        with self._lock:
+            dados = self._endpoint(url)
+            dados['requisicoes'] += 1
+            dados['bytes'] += tamanho
+            dados['latencias_ms'].append(segundos * 1000)
+            if status not in (200, 304):
+                dados['erros'] += 1
+
+    def registrar_cache(self, url: str, acerto: bool):
+        with self._lock:
+            self._endpoint(url)['acertos_cache' if acerto else 'faltas_cache'] += 1
+
+    def registrar_revalidacao(self, url: str):
+        """Entrada vencida do cache confirmada pela API (304, sem corpo)."""
+        with self._lock:
+            self._endpoint(url)['revalidacoes'] += 1
+
+    def registrar_circuito(self, url: str, recusada: bool):
+        """Abertura do circuito do endpoint (recusada=False) ou chamada recusada por ele."""
+        with self._lock:
+            self._endpoint(url)['recusadas_circuito' if recusada else 'aberturas_circuito'] += 1
+
+    def registrar_retentativa(self, url: str):
+        with self._lock:
+            self._endpoint(url)['retentativas'] += 1
+
+    @contextmanager
+    def etapa(self, nome: str, data_str: str = None):
+        """Mede a duração de uma etapa do fluxo."""
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            registro = {'etapa': nome, 'segundos': round(time.perf_counter() - inicio, 3)}
+            if data_str:
+                registro['data'] = data_str
+            with self._lock:
+                self._etapas.append(registro)
+
+    # -------------------------------------------------------------------------
+    # Relatório
+    # -------------------------------------------------------------------------
+
+    def relatorio(self) -> dict:
+        """Métricas consolidadas (o que vai para o JSON)."""
+        with self._lock:
+            endpoints = {modelo: dict(dados, latencias_ms=list(dados['latencias_ms']))
+                         for modelo, dados in self._endpoints.items()}
+            etapas = list(self._etapas)
+
+        consolidado = {}
+        todas_latencias = []
+        for modelo, dados in sorted(endpoints.items(), key=lambda item: -item[1]['requisicoes']):
+            latencias = sorted(dados.pop('latencias_ms'))
+            todas_latencias.extend(latencias)
+            consultas = dados['acertos_cache'] + dados['faltas_cache']
+            dados['taxa_acerto_cache'] = round(dados['acertos_cache'] / consultas, 3) if consultas else None
+            dados['latencia_ms'] = self._resumo_latencias(latencias)
+            consolidado[modelo] = dados
+
+        todas_latencias.sort()
+        acertos = sum(d['acertos_cache'] for d in consolidado.values())
+        faltas = sum(d['faltas_cache'] for d in consolidado.values())
+
+        duracao_etapas = {}
+        for registro in etapas:
+            duracao_etapas[registro['etapa']] = round(duracao_etapas.get(registro['etapa'], 0) + registro['segundos'], 3)
+
+        return {
+            'versao': VERSAO_RELATORIO,
+            'iniciado_em': self.iniciado_em.isoformat(timespec='seconds'),
+            'segundos_total': round(time.perf_counter() - self._inicio, 3),
+            'totais': {
+                'requisicoes': sum(d['requisicoes'] for d in consolidado.values()),
+                'erros': sum(d['erros'] for d in consolidado.values()),
+                'bytes': sum(d['bytes'] for d in consolidado.values()),
+                'retentativas': sum(d['retentativas'] for d in consolidado.values()),
+                'acertos_cache': acertos,
+                'faltas_cache': faltas,
+                'revalidacoes': sum(d['revalidacoes'] for d in consolidado.values()),
+                'aberturas_circuito': sum(d['aberturas_circuito'] for d in consolidado.values()),
+                'recusadas_circuito': sum(d['recusadas_circuito'] for d in consolidado.values()),
+                'taxa_acerto_cache': round(acertos / (acertos + faltas), 3) if acertos + faltas else None,
+                'latencia_ms': self._resumo_latencias(todas_latencias),
+            },
+            'etapas': duracao_etapas,
+            'etapas_detalhe': etapas,
+            'endpoints': consolidado,
+        }
+
+    @staticmethod
+    def _resumo_latencias(latencias: List[float]) -> dict:
+        """p50/p90/p99/máx + histograma por faixa (latências já ordenadas)."""
+        histograma = {}
+        for limite in FAIXAS_LATENCIA_MS:
+            histograma[f"<={limite}"] = 0
+        histograma[f">{FAIXAS_LATENCIA_MS[-1]}"] = 0
+
+        for latencia in latencias:
+            for limite in FAIXAS_LATENCIA_MS:
+                if latencia <= limite:
+                    histograma[f"<={limite}"] += 1
+                    break
+            else:
+                histograma[f">{FAIXAS_LATENCIA_MS[-1]}"] += 1
+
+        return {
+            'p50': round(_percentil(latencias, 0.50), 1),
+            'p90': round(_percentil(latencias, 0.90), 1),
+            'p99': round(_percentil(latencias, 0.99), 1),
+            'max': round(latencias[-1], 1) if latencias else 0.0,
+            'histograma': histograma,
+        }
+
+    def salvar(self, pasta: str, sufixo: str = '') -> str:
+        """Grava o relatório em pasta/execucao_<sufixo>_<AAAAMMDD_HHMMSS>.json."""
+        os.makedirs(pasta, exist_ok=True)
+        nome = f"execucao_{sufixo + '_' if sufixo else ''}{self.iniciado_em.strftime('%Y%m%d_%H%M%S')}.json"
+        caminho = os.path.join(pasta, nome)
+        with open(caminho, 'w', encoding='utf-8') as f:
+            json.dump(self.relatorio(), f, ensure_ascii=False, indent=2)
+        return caminho
+
+    def exibir_resumo(self, relatorio: dict = None):
+        """Resumo de uma tela: totais, etapas e endpoints com mais requisições."""
+        relatorio = relatorio or self.relatorio()
+        totais = relatorio['totais']
+        latencia = totais['latencia_ms']
+        taxa = totais['taxa_acerto_cache']
+
+        print("📈 MÉTRICAS DA EXECUÇÃO:")
+        print(f"   • Tempo total: {relatorio['segundos_total']:.1f}s")
+        print(f"   • Requisições: {totais['requisicoes']} ({totais['bytes'] / (1024 * 1024):.1f} MB, "
+              f"{totais['erros']} erro(s), {totais['retentativas']} retentativa(s))")
+        print(f"   • Cache: {totais['acertos_cache']} acerto(s), {totais['faltas_cache']} falta(s)"
+              f"{f' ({taxa:.0%})' if taxa is not None else ''}, {totais['revalidacoes']} revalidada(s) (304)")
+        print(f"   • Latência: p50 {latencia['p50']:.0f} ms • p90 {latencia['p90']:.0f} ms • "
+              f"p99 {latencia['p99']:.0f} ms • máx {latencia['max']:.0f} ms")
+
+        if totais['aberturas_circuito']:
+            print(f"   ⛔ Circuito aberto {totais['aberturas_circuito']} vez(es); "
+                  f"{totais['recusadas_circuito']} chamada(s) recusada(s) (dados faltando):")
+            for modelo, dados in relatorio['endpoints'].items():
+                if dados['aberturas_circuito']:
+                    print(f"      - {modelo}: {dados['recusadas_circuito']} recusada(s)")
+
+        if relatorio['etapas']:
+            print("   • Etapas: " + " • ".join(f"{nome} {segundos:.1f}s" for nome, segundos in relatorio['etapas'].items()))
+
+        if relatorio['endpoints']:
+            print(f"   {'Endpoint':<46} {'Req.':>6} {'Cache':>6} {'p50':>7} {'p90':>7}")
+            for modelo, dados in list(relatorio['endpoints'].items())[:ENDPOINTS_NO_RESUMO]:
+                taxa_endpoint = dados['taxa_acerto_cache']
+                cache_txt = f"{taxa_endpoint:.0%}" if taxa_endpoint is not None else "-"
+                print(f"   {modelo[:46]:<46} {dados['requisicoes']:>6} {cache_txt:>6} "
+                      f"{dados['latencia_ms']['p50']:>7.0f} {dados['latencia_ms']['p90']:>7.0f}")
+
+
+# Instância global
+_coletor: ColetorMetricas = None
+_lock_coletor = threading.Lock()
+
+def obter_coletor() -> ColetorMetricas:
+    """Obtém ou cria o coletor da execução."""
+    global _coletor
+    with _lock_coletor:
+        if _coletor is None:
+            _coletor = ColetorMetricas()
+        return _coletor
+
+def reiniciar_coletor():
+    """Descarta as métricas coletadas; o próximo obter_coletor() começa do zero."""
+    global _coletor
+    with _lock_coletor:
+        _coletor = None
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+=============================================================================
+PERFILADOR OPCIONAL DAS ETAPAS (cProfile + tracemalloc)
+=============================================================================
+Autor: RefStats
+
+Desligado por padrão (custo praticamente zero). Ligado com --profile na
+linha de comando ou com a variável de ambiente REFSTATS_PROFILE=1 em:
+
+    sistema_unificado_v1_5.py, probabilidade_cartoes_v2.py,
+    validar_probabilidades_v2.py, traduzir_jogos.py, traduzir_html_en.py
+
+Cada etapa marcada (etapa_perfilada / @perfilado) roda sob cProfile e
+tracemalloc. No fim da execução são gravados em perfis/<script>_<data>/:
+
+    <etapa>.prof     → estatísticas do cProfile (snakeviz, pstats...)
+    relatorio.txt    → por etapa: chamadas, tempo, top-N funções
+                       (tempo próprio e acumulado) e top-N linhas que
+                       mais alocaram memória
+
+OBSERVAÇÕES:
+    - Etapas em threads diferentes são perfiladas separadamente e somadas
+      por nome; uma etapa dentro de outra na mesma thread só tem o tempo
+      medido (o cProfile da etapa de fora já cobre o trecho).
+    - Com várias threads, a memória de uma etapa inclui o que as outras
+      alocaram no mesmo intervalo (tracemalloc é global).
+=============================================================================
+"""
+
+import os
+import sys
+import io
+import time
+import atexit
+import pstats
+import cProfile
+import functools
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+
+
+# =============================================================================
+# CONFIGURAÇÕES
+# =============================================================================
+
+PASTA_PERFIS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "perfis")
+
+# Linhas das tabelas de funções e de alocações, por etapa
+TOP_N = 25
+
+# Quadros guardados por alocação (1 = só a linha que alocou)
+QUADROS_TRACEMALLOC = 1
+
+_FILTROS_MEMORIA = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+class _DadosEtapa:
+    """Acumulado de uma etapa (todas as chamadas, todas as threads)."""
+
+    def __init__(self):
+        self.chamadas = 0
+        self.segundos = 0.0
+        self.estatisticas = None
+        self.alocacoes = {}
+
+
+class Perfilador:
+    """Coleta cProfile + tracemalloc por etapa e grava os resultados no fim."""
+
+    def __init__(self, nome_script: str, pasta: str = None):
+        self.nome_script = nome_script
+        self.pasta = os.path.join(pasta or PASTA_PERFIS,
+                                  f"{nome_script}_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+        self._etapas = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(QUADROS_TRACEMALLOC)
+
+    @contextmanager
+    def etapa(self, nome: str):
+        ativo = getattr(self._local, 'ativo', False)
+        perfil = None
+        antes = None
+
+        if not ativo:
+            self._local.ativo = True
+            antes = tracemalloc.take_snapshot().filter_traces(_FILTROS_MEMORIA)
+            perfil = cProfile.Profile()
+            perfil.enable()
+
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            segundos = time.perf_counter() - inicio
+            alocacoes = []
+            if perfil is not None:
+                perfil.disable()
+                self._local.ativo = False
+                depois = tracemalloc.take_snapshot().filter_traces(_FILTROS_MEMORIA)
+                alocacoes = depois.compare_to(antes, 'lineno')[:TOP_N * 2]
+            self._acumular(nome, segundos, perfil, alocacoes)
+
+    def _acumular(self, nome: str, segundos: float, perfil, alocacoes):
+        with self._lock:
+            dados = self._etapas.setdefault(nome, _DadosEtapa())
+            dados.chamadas += 1
+            dados.segundos += segundos
+
+            if perfil is not None:
+                if dados.estatisticas is None:
+                    dados.estatisticas = pstats.Stats(perfil, stream=io.StringIO())
+                else:
+                    dados.estatisticas.add(perfil)
+
+            for estatistica in alocacoes:
+                quadro = estatistica.traceback[0]
+                chave = f"{quadro.filename}:{quadro.lineno}"
+                tamanho, quantidade = dados.alocacoes.get(chave, (0, 0))
+                dados.alocacoes[chave] = (tamanho + estatistica.size_diff, quantidade + estatistica.count_diff)
+
+    # -------------------------------------------------------------------------
+    # Saída
+    # -------------------------------------------------------------------------
+
+    def finalizar(self):
+        """Grava os .prof e o relatorio.txt. Retorna a pasta (None se nada foi medido)."""
+        with self._lock:
+            etapas = dict(self._etapas)
+            self._etapas = {}
+        if not etapas:
+            return None
+
+        os.makedirs(self.pasta, exist_ok=True)
+        linhas = [f"PERFIL - {self.nome_script} - {datetime.now().isoformat(timespec='seconds')}", ""]
+
+        for nome, dados in sorted(etapas.items(), key=lambda item: -item[1].segundos):
+            linhas.append("=" * 78)
+            linhas.append(f"ETAPA: {nome} • {dados.chamadas} chamada(s) • {dados.segundos:.3f}s")
+            linhas.append("=" * 78)
+
+            if dados.estatisticas is not None:
+                dados.estatisticas.dump_stats(os.path.join(self.pasta, f"{nome}.prof"))
+                for ordem, titulo in (('tottime', "tempo próprio"), ('cumulative', "tempo acumulado")):
+                    saida = io.StringIO()
+                    dados.estatisticas.stream = saida
+                    dados.estatisticas.sort_stats(ordem).print_stats(TOP_N)
+                    linhas.append(f"--- Funções por {titulo} (top {TOP_N}) ---")
+                    linhas.extend(_corpo_pstats(saida.getvalue()))
+                    linhas.append("")
+
+            if dados.alocacoes:
+                linhas.append(f"--- Alocações por linha (top {TOP_N}) ---")
+                linhas.append(f"{'KB':>12} {'Blocos':>9}  Linha")
+                maiores = sorted(dados.alocacoes.items(), key=lambda item: -item[1][0])[:TOP_N]
+                for chave, (tamanho, quantidade) in maiores:
+                    linhas.append(f"{tamanho / 1024:>12.1f} {quantidade:>9}  {chave}")
+                linhas.append("")
+
+        with open(os.path.join(self.pasta, "relatorio.txt"), 'w', encoding='utf-8') as f:
+            f.write("\n".join(linhas) + "\n")
+        return self.pasta
+
+
+def _corpo_pstats(texto: str) -> list:
+    """Só a tabela do print_stats (sem o cabeçalho de totais)."""
+    linhas = texto.splitlines()
+    for i, linha in enumerate(linhas):
+        if linha.strip().startswith('ncalls'):
+            return [l for l in linhas[i:] if l.strip()]
+    return [l for l in linhas if l.strip()]
+
+
+# =============================================================================
+# API
+# =============================================================================
+
+_perfilador: Perfilador = None
+
+def perfilador_solicitado(argv: list = None) -> bool:
+    """
+    True se --profile foi passado (a flag é removida de argv, para não
+    atrapalhar o argparse/sys.argv do script) ou REFSTATS_PROFILE está ligado.
+    """
+    argv = sys.argv if argv is None else argv
+    solicitado = '--profile' in argv
+    while '--profile' in argv:
+        argv.remove('--profile')
+    return solicitado or os.environ.get('REFSTATS_PROFILE', '').strip().lower() in ('1', 'true', 'sim')
+
+def iniciar_perfilador(nome_script: str, pasta: str = None) -> Perfilador:
+    """Liga o perfilador; os resultados são gravados ao final do processo."""
+    global _perfilador
+    if _perfilador is None:
+        _perfilador = Perfilador(nome_script, pasta)
+        atexit.register(finalizar_perfilador)
+        print(f"🔬 Perfilador ligado (cProfile + tracemalloc) → {_perfilador.pasta}")
+    return _perfilador
+
+def finalizar_perfilador():
+    """Grava os resultados do perfilador (se ligado)."""
+    if _perfilador is None:
+        return
+    pasta = _perfilador.finalizar()
+    if pasta:
+        print(f"\n🔬 Perfil salvo em: {pasta}")
+
+@contextmanager
+def etapa_perfilada(nome: str):
+    """Perfila o bloco como a etapa `nome` (não faz nada com o perfilador desligado)."""
+    if _perfilador is None:
+        yield
+        return
+    with _perfilador.etapa(nome):
+        yield
+
+def perfilado(nome: str):
+    """Decorador: cada chamada da função é perfilada como a etapa `nome`."""
+    def decorador(funcao):
+        @functools.wraps(funcao)
+        def envoltorio(*args, **kwargs):
+            if _perfilador is None:
+                return funcao(*args, **kwargs)
+            with _perfilador.etapa(nome):
+                return funcao(*args, **kwargs)
+        return envoltorio
+    return decorador
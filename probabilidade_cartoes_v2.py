@@ -37,6 +37,9 @@ from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Tuple
 from collections import defaultdict
 
+from sidecar_jogos import carregar_sidecar
+from perfilador import perfilado, etapa_perfilada, perfilador_solicitado, iniciar_perfilador
+
 # Importa módulo de aprendizado (se disponível)
 try:
     from aprendizado_avancado import (
@@ -93,6 +96,20 @@ DISPERSAO_POR_LIGA = {
 # Dispersão padrão (fallback) quando liga não está mapeada
 DISPERSAO_GLOBAL = 3.0
 
+# Média de amarelos por jogo das ligas conhecidas (baseline)
+MEDIAS_AMARELOS_LIGAS = {
+    "Brasileirão Série A": 5.4,
+    "Brasileirão Série B": 5.6,
+    "Premier League": 5.0,
+    "La Liga": 5.2,
+    "LaLiga": 5.2,
+    "Bundesliga": 4.2,
+    "Serie A": 4.6,
+    "Ligue 1": 4.0,
+    "Copa Libertadores": 6.0,
+    "Copa Sudamericana": 5.8,
+}
+
 # Thresholds para destaques por mercado
 THRESHOLDS_DESTAQUE = {
     "Over 2.5 Cartões": 55,
@@ -810,6 +827,7 @@ def carregar_regras_ouro(pasta_calibracao: str) -> list:
         return []
 
 
+@perfilado('verificar_regras')
 def verificar_regras_partida(resultado: 'ResultadoAnalise', regras: list, pasta_calibracao: str) -> list:
     """
     Verifica quais regras de ouro uma partida ativa.
@@ -1328,6 +1346,7 @@ def calcular_probabilidades_mercados(
     return probabilidades
 
 
+@perfilado('analisar_partida')
 def analisar_partida(partida: DadosPartida, gerenciador: GerenciadorCalibracao = None) -> ResultadoAnalise:
     """
     Realiza análise completa de uma partida.
@@ -1555,21 +1574,12 @@ def extrair_dados_baseline(card, liga: str) -> DadosBaseline:
                 media_amarelos = float(match.group(1).replace(',', '.'))
                 break
     
-    # Fallback para ligas conhecidas
-    MEDIAS_LIGAS = {
-        "Brasileirão Série A": 5.4,
-        "Brasileirão Série B": 5.6,
-        "Premier League": 5.0,
-        "La Liga": 5.2,
-        "LaLiga": 5.2,
-        "Bundesliga": 4.2,
-        "Serie A": 4.6,
-        "Ligue 1": 4.0,
-        "Copa Libertadores": 6.0,
-        "Copa Sudamericana": 5.8,
-    }
-    
-    for nome_liga, media in MEDIAS_LIGAS.items():
+    return montar_baseline(liga, media_amarelos, media_faltas)
+
+
+def montar_baseline(liga: str, media_amarelos: float = 5.0, media_faltas: float = 25.0) -> DadosBaseline:
+    """Monta o baseline da competição (ligas conhecidas usam a média de MEDIAS_AMARELOS_LIGAS)."""
+    for nome_liga, media in MEDIAS_AMARELOS_LIGAS.items():
         if nome_liga.lower() in liga.lower() or liga.lower() in nome_liga.lower():
             media_amarelos = media
             break
@@ -1675,6 +1685,7 @@ def extrair_dados_time(card, eh_mandante: bool) -> DadosTime:
     )
 
 
+@perfilado('extrair_cards')
 def extrair_partida(card) -> Optional[DadosPartida]:
     """Extrai todos os dados de uma partida de um card HTML."""
     
@@ -1749,23 +1760,108 @@ def extrair_partida(card) -> Optional[DadosPartida]:
         return None
 
 
+# =============================================================================
+# LEITURA DO SIDECAR JSON (sidecar_jogos.py)
+# =============================================================================
+# O sidecar só troca o parse do HTML por uma leitura direta: as entradas do
+# modelo têm de ser as mesmas que extrair_partida obtém de uma página gerada
+# pelo sistema unificado, porque a calibração (Calibracao/) foi ajustada
+# sobre elas. Por isso aqui se repetem os valores que a raspagem produz:
+#   - times: "Faltas Contra" cai em faltas_pro (o tooltip diz "cometidas"),
+#     faltas_contra fica 0 e a amostra é sempre 5 jogos
+#   - árbitro: perfil "Médio" (o badge lido é o de Liga/Copa), vermelhos 0
+#     (o rótulo casa com "10 j") e amostra sempre de 10 jogos
+#   - partida: fase vazia; baseline pela média padrão da liga, faltas 25.0
+
+def _dados_time_sidecar(nome: str, colocacao: Optional[dict], stats: Optional[dict]) -> DadosTime:
+    """Monta DadosTime a partir da análise estruturada de um time (mesmas entradas do HTML)."""
+    stats = stats or {}
+    return DadosTime(
+        nome=nome,
+        posicao=f"{colocacao['posicao']}º" if colocacao else "N/D",
+        faltas_pro=float(stats.get('media_faltas_sofridas', 0) or 0),
+        faltas_contra=0.0,
+        amarelos_pro=float(stats.get('media_amarelos_feitos', 0) or 0),
+        amarelos_contra=float(stats.get('media_amarelos_sofridos', 0) or 0),
+        n_jogos_disponiveis=5
+    )
+
+
+@perfilado('extrair_sidecar')
+def extrair_partida_sidecar(analise: dict) -> Optional[DadosPartida]:
+    """Monta DadosPartida direto de uma análise do sidecar (sem HTML)."""
+    
+    try:
+        partida = analise['partida']
+        arbitro = analise.get('arbitro') or {}
+        metricas = analise.get('metricas') or {}
+        estadio_info = analise.get('estadio_info') or {}
+        
+        liga = partida.get('liga_nome', '')
+        local = estadio_info.get('cidade', '')
+        if estadio_info.get('pais'):
+            local += f", {estadio_info['pais']}"
+        
+        dados_arbitro = DadosArbitro(
+            nome=arbitro.get('nome') or "Não informado",
+            pais=arbitro.get('pais', ''),
+            media_amarelos_10j=float(metricas.get('media_amarelos_10j', 0)),
+            media_amarelos_5j=float(metricas.get('media_amarelos_5j', 0)),
+            media_amarelos_1t=float(metricas.get('media_amarelos_1t', 0)),
+            media_amarelos_2t=float(metricas.get('media_amarelos_2t', 0)),
+            media_faltas_10j=float(metricas.get('media_faltas_10j', 0)),
+            media_faltas_5j=float(metricas.get('media_faltas_5j', 0)),
+            media_vermelhos=0.0,
+            perfil="Médio",
+            n_jogos_disponiveis=10
+        )
+        
+        return DadosPartida(
+            liga=liga or "Competição não identificada",
+            data=partida.get('data', ''),
+            horario=partida.get('horario', ''),
+            estadio=estadio_info.get('nome', 'Não informado'),
+            local=local,
+            fase="",
+            time_mandante=_dados_time_sidecar(partida['time_casa'], analise.get('colocacao_casa'), analise.get('stats_casa')),
+            time_visitante=_dados_time_sidecar(partida['time_fora'], analise.get('colocacao_fora'), analise.get('stats_fora')),
+            arbitro=dados_arbitro,
+            baseline=montar_baseline(liga),
+            perfil_card=metricas.get('perfil', 'N/A')
+        )
+        
+    except (KeyError, TypeError, ValueError) as e:
+        print(f"   ⚠️ Erro ao ler partida do sidecar: {e}")
+        return None
+
+
 def processar_arquivo(caminho_entrada: str, gerenciador: GerenciadorCalibracao = None) -> List[ResultadoAnalise]:
-    """Processa um arquivo HTML e retorna as análises."""
+    """
+    Processa um JOGOS_DO_DIA_*.html e retorna as análises.
+    Usa o sidecar JSON quando existir; páginas antigas são lidas do HTML.
+    """
     
     resultados = []
     
     try:
-        with open(caminho_entrada, 'r', encoding='utf-8') as f:
-            conteudo = f.read()
-        
-        soup = BeautifulSoup(conteudo, 'html.parser')
-        cards = soup.find_all(class_='jogo-card')
+        sidecar = carregar_sidecar(caminho_entrada)
         
-        print(f"✅ Encontrados {len(cards)} jogos no arquivo")
-        
-        for i, card in enumerate(cards, 1):
-            partida = extrair_partida(card)
+        if sidecar is not None:
+            analises = sidecar['analises']
+            print(f"✅ Encontrados {len(analises)} jogos no sidecar JSON")
+            partidas = (extrair_partida_sidecar(a) for a in analises)
+        else:
+            with open(caminho_entrada, 'r', encoding='utf-8') as f:
+                conteudo = f.read()
             
+            with etapa_perfilada('parse_html'):
+                soup = BeautifulSoup(conteudo, 'html.parser')
+                cards = soup.find_all(class_='jogo-card')
+            
+            print(f"✅ Encontrados {len(cards)} jogos no arquivo")
+            partidas = (extrair_partida(card) for card in cards)
+        
+        for i, partida in enumerate(partidas, 1):
             if partida:
                 print(f"   {i}. {partida.time_mandante.nome} vs {partida.time_visitante.nome}")
                 resultado = analisar_partida(partida, gerenciador)
@@ -2700,6 +2796,7 @@ def gerar_card_completo(resultado: ResultadoAnalise) -> str:
     '''
 
 
+@perfilado('gerar_html_completo')
 def gerar_html_completo(resultados: List[ResultadoAnalise], data_arquivo: str) -> str:
     """Gera o HTML completo com todas as partidas."""
     
@@ -2989,6 +3086,52 @@ def gerar_html_completo(resultados: List[ResultadoAnalise], data_arquivo: str) -
 # FUNÇÃO PRINCIPAL
 # =============================================================================
 
+def gerar_probabilidade_arquivo(arquivo: str, pasta_saida: str, gerenciador: GerenciadorCalibracao,
+                                regras_ouro: list, pasta_calibracao: str) -> Optional[str]:
+    """
+    Processa um JOGOS_DO_DIA_*.html e salva o PROBABILIDADE_*.html
+    correspondente em pasta_saida. Retorna o caminho salvo (None se falhar).
+    """
+    nome_arquivo = os.path.basename(arquivo)
+    
+    # Extrai data do nome
+    match = re.search(r'(\d{2})(\d{2})(\d{4})', nome_arquivo)
+    if match:
+        data_arquivo = f"{match.group(1)}/{match.group(2)}/{match.group(3)}"
+    else:
+        data_arquivo = "Data não identificada"
+    
+    # Processa
+    resultados = processar_arquivo(arquivo, gerenciador)
+    
+    if not resultados:
+        return None
+    
+    # Verifica regras de ouro para cada resultado
+    total_regras_ativadas = 0
+    if regras_ouro:
+        for resultado in resultados:
+            regras_ativadas = verificar_regras_partida(resultado, regras_ouro, pasta_calibracao)
+            resultado.regras_ativadas = regras_ativadas
+            if regras_ativadas:
+                total_regras_ativadas += 1
+        
+        if total_regras_ativadas > 0:
+            print(f"\n   🏆 {total_regras_ativadas} partida(s) ativaram Regras de Ouro!")
+    
+    # Gera HTML
+    html = gerar_html_completo(resultados, data_arquivo)
+    
+    # Salva
+    nome_saida = nome_arquivo.replace("JOGOS_DO_DIA_", "PROBABILIDADE_")
+    caminho_saida = os.path.join(pasta_saida, nome_saida)
+    
+    with open(caminho_saida, 'w', encoding='utf-8') as f:
+        f.write(html)
+    
+    return caminho_saida
+
+
 def main():
     """Função principal."""
     print("""
@@ -3062,39 +3205,10 @@ def main():
         print(f"📂 Processando: {nome_arquivo}")
         print(f"{'='*60}")
         
-        # Extrai data do nome
-        match = re.search(r'(\d{2})(\d{2})(\d{4})', nome_arquivo)
-        if match:
-            data_arquivo = f"{match.group(1)}/{match.group(2)}/{match.group(3)}"
-        else:
-            data_arquivo = "Data não identificada"
-        
-        # Processa
-        resultados = processar_arquivo(arquivo, gerenciador)
-        
-        if resultados:
-            # Verifica regras de ouro para cada resultado
-            total_regras_ativadas = 0
-            if regras_ouro:
-                for resultado in resultados:
-                    regras_ativadas = verificar_regras_partida(resultado, regras_ouro, pasta_calibracao)
-                    resultado.regras_ativadas = regras_ativadas
-                    if regras_ativadas:
-                        total_regras_ativadas += 1
-                
-                if total_regras_ativadas > 0:
-                    print(f"\n   🏆 {total_regras_ativadas} partida(s) ativaram Regras de Ouro!")
-            
-            # Gera HTML
-            html = gerar_html_completo(resultados, data_arquivo)
-            
-            # Salva
-            nome_saida = nome_arquivo.replace("JOGOS_DO_DIA_", "PROBABILIDADE_")
-            caminho_saida = os.path.join(pasta_probabilidade, nome_saida)
-            
-            with open(caminho_saida, 'w', encoding='utf-8') as f:
-                f.write(html)
-            
+        caminho_saida = gerar_probabilidade_arquivo(arquivo, pasta_probabilidade, gerenciador,
+                                                    regras_ouro, pasta_calibracao)
+        
+        if caminho_saida:
             print(f"\n✅ Arquivo salvo: {caminho_saida}")
             arquivos_sucesso += 1
         else:
@@ -3114,4 +3228,6 @@ def main():
 
 
 if __name__ == "__main__":
+    if perfilador_solicitado():
+        iniciar_perfilador('probabilidade')
     main()
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+=============================================================================
+ARQUIVO ESTRUTURADO DOS JOGOS DO DIA (SIDECAR JSON)
+=============================================================================
+Autor: RefStats
+
+Ao lado de cada Historico/JOGOS_DO_DIA_DDMMYYYY.html o sistema unificado
+grava Historico/JOGOS_DO_DIA_DDMMYYYY.json.gz com as análises completas
+(partida, árbitro, métricas, times, notícias...).
+
+As etapas seguintes (probabilidade_cartoes_v2.py) leem este arquivo
+diretamente e só fazem scraping do HTML para páginas antigas, sem sidecar.
+
+DIÁRIO DE PARTIDAS (retomada):
+    Durante a análise, cada partida concluída é acrescentada (uma linha
+    JSON por partida) em dados_locais/diario/JOGOS_DO_DIA_DDMMYYYY.jsonl.
+    Se a execução cair no meio, `--retomar` carrega as partidas já
+    analisadas e só consulta as que faltam.
+
+FORMATO (gzip + JSON):
+    {
+        "versao": 1,
+        "data": "DD/MM/YYYY",
+        "gerado_em": "YYYY-MM-DDTHH:MM:SS",
+        "analises": [ {...}, ... ]
+    }
+=============================================================================
+"""
+
+import os
+import json
+import gzip
+import threading
+from datetime import datetime
+from typing import Optional
+
+
+# =============================================================================
+# CONFIGURAÇÕES
+# =============================================================================
+
+VERSAO_SIDECAR = 1
+
+PASTA_DIARIO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dados_locais", "diario")
+
+# Campos das métricas que são só recortes do histórico (recalculados ao ler)
+CAMPOS_DERIVADOS_METRICAS = ('jogos_mesma_liga', 'jogos_outras_ligas')
+
+
+def caminho_sidecar(caminho_html: str) -> str:
+    """Historico/JOGOS_DO_DIA_DDMMYYYY.html → Historico/JOGOS_DO_DIA_DDMMYYYY.json.gz"""
+    base, _ = os.path.splitext(caminho_html)
+    return f"{base}.json.gz"
+
+
+# =============================================================================
+# GRAVAÇÃO / LEITURA
+# =============================================================================
+
+def _compactar_analise(analise: dict) -> dict:
+    """Remove da análise o que pode ser recalculado na leitura."""
+    metricas = analise.get('metricas')
+    if not metricas:
+        return analise
+
+    compacta = dict(analise)
+    compacta['metricas'] = {k: v for k, v in metricas.items() if k not in CAMPOS_DERIVADOS_METRICAS}
+    return compacta
+
+
+def _restaurar_analise(analise: dict) -> dict:
+    """Desfaz _compactar_analise e volta as datas das notícias para datetime."""
+    metricas = analise.get('metricas')
+    if metricas:
+        liga_id = analise.get('partida', {}).get('liga_id')
+        historico = analise.get('historico') or []
+        metricas['jogos_mesma_liga'] = [j for j in historico if j.get('liga_id') == liga_id]
+        metricas['jogos_outras_ligas'] = [j for j in historico if j.get('liga_id') != liga_id]
+
+    for noticia in analise.get('noticias_arbitro') or []:
+        if isinstance(noticia.get('data'), str):
+            try:
+                noticia['data'] = datetime.fromisoformat(noticia['data'])
+            except ValueError:
+                pass
+
+    return analise
+
+
+def _serializar(valor):
+    if isinstance(valor, datetime):
+        return valor.isoformat()
+    raise TypeError(f"Tipo não serializável: {type(valor).__name__}")
+
+
+def salvar_sidecar(caminho_html: str, analises: list, data_str: str) -> str:
+    """Grava o sidecar das análises ao lado do HTML. Retorna o caminho gravado."""
+    caminho = caminho_sidecar(caminho_html)
+    documento = {
+        'versao': VERSAO_SIDECAR,
+        'data': data_str,
+        'gerado_em': datetime.now().isoformat(timespec='seconds'),
+        'analises': [_compactar_analise(a) for a in analises],
+    }
+
+    temporario = f"{caminho}.tmp"
+    with gzip.open(temporario, 'wt', encoding='utf-8') as f:
+        json.dump(documento, f, ensure_ascii=False, separators=(',', ':'), default=_serializar)
+    os.replace(temporario, caminho)
+    return caminho
+
+
+def carregar_sidecar(caminho_html: str) -> Optional[dict]:
+    """
+    Carrega o sidecar do HTML informado.
+    Retorna None se não existir, estiver corrompido ou for de outra versão.
+    """
+    caminho = caminho_sidecar(caminho_html)
+    if not os.path.exists(caminho):
+        return None
+
+    try:
+        with gzip.open(caminho, 'rt', encoding='utf-8') as f:
+            documento = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if documento.get('versao') != VERSAO_SIDECAR:
+        return None
+
+    documento['analises'] = [_restaurar_analise(a) for a in documento.get('analises', [])]
+    return documento
+
+
+# =============================================================================
+# DIÁRIO DE PARTIDAS (RETOMADA)
+# =============================================================================
+
+def _cortar_linha_incompleta(caminho: str, bloco: int = 64 * 1024):
+    """Trunca o arquivo logo depois da última quebra de linha (se não terminar em uma)."""
+    if not os.path.exists(caminho):
+        return
+
+    with open(caminho, 'rb+') as f:
+        tamanho = f.seek(0, os.SEEK_END)
+        if tamanho == 0:
+            return
+        f.seek(tamanho - 1)
+        if f.read(1) == b"\n":
+            return
+
+        fim = tamanho
+        while fim > 0:
+            inicio = max(0, fim - bloco)
+            f.seek(inicio)
+            posicao = f.read(fim - inicio).rfind(b"\n")
+            if posicao >= 0:
+                f.truncate(inicio + posicao + 1)
+                return
+            fim = inicio
+        f.truncate(0)
+
+
+class DiarioPartidas:
+    """
+    Diário só-de-acréscimo das análises de uma data.
+    Cada linha: {"versao": 1, "event_id": ..., "analise": {...}}.
+    Uma linha incompleta (queda no meio da escrita) é ignorada na leitura.
+    """
+
+    def __init__(self, data_str: str, pasta: str = None):
+        self.data_str = data_str
+        self.caminho = os.path.join(pasta or PASTA_DIARIO, f"JOGOS_DO_DIA_{data_str.replace('/', '')}.jsonl")
+        self._arquivo = None
+        self._lock = threading.Lock()
+
+    def carregar(self) -> dict:
+        """Análises já registradas, por event_id (a última linha de cada partida vale)."""
+        analises = {}
+        if not os.path.exists(self.caminho):
+            return analises
+
+        with open(self.caminho, 'r', encoding='utf-8') as f:
+            for linha in f:
+                try:
+                    registro = json.loads(linha)
+                except ValueError:
+                    continue
+                if registro.get('versao') != VERSAO_SIDECAR or 'analise' not in registro:
+                    continue
+                analises[registro['event_id']] = _restaurar_analise(registro['analise'])
+        return analises
+
+    def abrir(self, retomar: bool = False):
+        """
+        Abre o diário para escrita. Sem retomar, começa um diário novo;
+        retomando, descarta antes a linha incompleta deixada por uma queda,
+        senão o próximo registro seria colado nela e se perderia.
+        """
+        os.makedirs(os.path.dirname(self.caminho), exist_ok=True)
+        if retomar:
+            _cortar_linha_incompleta(self.caminho)
+        self._arquivo = open(self.caminho, 'a' if retomar else 'w', encoding='utf-8')
+        return self
+
+    def registrar(self, analise: dict):
+        """Acrescenta uma partida concluída (gravada em disco na hora)."""
+        linha = json.dumps(
+            {'versao': VERSAO_SIDECAR, 'event_id': analise['partida']['id'], 'analise': _compactar_analise(analise)},
+            ensure_ascii=False, separators=(',', ':'), default=_serializar
+        )
+        with self._lock:
+            self._arquivo.write(linha + "\n")
+            self._arquivo.flush()
+            os.fsync(self._arquivo.fileno())
+
+    def fechar(self):
+        with self._lock:
+            if self._arquivo:
+                self._arquivo.close()
+                self._arquivo = None
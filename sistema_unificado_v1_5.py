@@ -47,39 +47,50 @@ Autor: RefStats v1.5
 Data: 2025-12-24
 """
 
-import requests
 import feedparser
-import json
 from datetime import datetime, timedelta
 from urllib.parse import quote
-import time
 import sys
 import re
 import os
 import traceback
-from functools import wraps, lru_cache
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, TimeoutError as TempoEsgotado
+from functools import lru_cache
 import unicodedata
 
+from cliente_sofascore import TIMEOUT_PADRAO, obter_cliente
+from cache_respostas import HORA
+from banco_local import obter_banco_local
+from sidecar_jogos import salvar_sidecar, carregar_sidecar, DiarioPartidas
+from metricas_execucao import obter_coletor
+from perfilador import perfilado, etapa_perfilada, perfilador_solicitado, iniciar_perfilador
+from dados_sofascore import (
+    obter_agenda, obter_estatisticas_evento, EventStats, obter_servico_classificacao,
+    obter_detalhe_evento, obter_historico_arbitro, obter_linha_do_tempo_time, fase_da_rodada
+)
+
 # ============================================================================
 # CONFIGURAÇÕES
 # ============================================================================
 
-BASE_URL = 'https://api.sofascore.com/api/v1'
 SOFASCORE_WEB = 'https://www.sofascore.com'
 OUTPUT_DIR = 'relatorios_unificados'
+HISTORICO_DIR = 'Historico'
 
-# Headers para simular navegador
-HEADERS = {
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-    'Accept': 'application/json',
-    'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
-    'Referer': 'https://www.sofascore.com/'
-}
+# Headers, BASE_URL, timeout, limitador de taxa e retentativas ficam em cliente_sofascore
 
-# Configurações de retry e timeout
-MAX_RETRIES = 3
-RETRY_DELAY = 2
-TIMEOUT_PADRAO = 10
+# Concorrência da execução diária
+# (o limite global de requisições simultâneas fica em cliente_sofascore)
+MAX_PARTIDAS_SIMULTANEAS = 4
+CONSULTAS_POR_PARTIDA = 6
+
+# Backfill (--de/--ate): dias processados ao mesmo tempo
+DIAS_SIMULTANEOS_BACKFILL = 2
+
+# Notícias já filtradas de um árbitro são reaproveitadas por um dia (banco local)
+VALIDADE_NOTICIAS = 24 * HORA
 
 # IDs das principais ligas
 LIGAS_PRINCIPAIS = {
@@ -129,69 +140,16 @@ MEDIA_LIGAS = {
     679: {"liga": "Série C Brasil",        "amarelos_total_jogo": 6.0, "faltas_total_jogo": 31.0},
 }
 
-# ============================================================================
-# DECORATOR DE RETRY
-# ============================================================================
-
-def retry_on_failure(max_attempts=MAX_RETRIES, delay=RETRY_DELAY, exceptions=(Exception,)):
-    """Decorator que tenta executar uma função até max_attempts vezes"""
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            last_exception = None
-            for attempt in range(1, max_attempts + 1):
-                try:
-                    return func(*args, **kwargs)
-                except exceptions as e:
-                    last_exception = e
-                    if attempt < max_attempts:
-                        time.sleep(delay)
-            if last_exception:
-                raise last_exception
-        return wrapper
-    return decorator
-
 # ============================================================================
 # FUNÇÕES AUXILIARES
 # ============================================================================
 
-def fazer_requisicao(url, headers=None, timeout=TIMEOUT_PADRAO):
-    """Faz uma requisição HTTP com tratamento de erros"""
-    try:
-        if headers is None:
-            headers = HEADERS
-        response = requests.get(url, headers=headers, timeout=timeout)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.Timeout:
-        return None
-    except requests.exceptions.RequestException:
-        return None
-    except json.JSONDecodeError:
-        return None
-
-@retry_on_failure(max_attempts=3)
-def fazer_requisicao_com_retry(url, headers=None, timeout=TIMEOUT_PADRAO):
-    """Faz uma requisição HTTP com retry automático"""
-    if headers is None:
-        headers = HEADERS
-    response = requests.get(url, headers=headers, timeout=timeout)
-    if response.status_code != 200:
-        raise Exception(f"HTTP {response.status_code}")
-    return response.json()
-
-def _extrair_valor_estatistica(valor):
-    """Extrai valor numérico de uma estatística"""
-    if valor is None:
-        return 0
-    if isinstance(valor, (int, float)):
-        return int(valor)
-    if isinstance(valor, str):
-        try:
-            return int(float(valor.strip()))
-        except:
-            return 0
-    return 0
+def fazer_requisicao(url, timeout=TIMEOUT_PADRAO, ttl=None):
+    """
+    Faz uma requisição HTTP com tratamento de erros (sessão compartilhada + cache).
+    Limite de taxa, 429/Retry-After e retentativas são tratados pelo cliente.
+    """
+    return obter_cliente().buscar_json(url, timeout=timeout, ttl=ttl)
 
 def obter_media_liga(liga_id):
     """Obtém médias baseline da liga"""
@@ -206,31 +164,14 @@ def obter_media_liga(liga_id):
 # v1.1: BUSCA INFO DO ESTÁDIO VIA API DO EVENTO
 # ============================================================================
 
-@retry_on_failure(max_attempts=2)
 def buscar_info_estadio_evento(event_id):
     """
     v1.1: Busca informações completas do estádio onde o jogo será realizado
+    (lidas do EventDetail da partida)
     """
     try:
-        url = f"{BASE_URL}/event/{event_id}"
-        data = fazer_requisicao_com_retry(url, timeout=TIMEOUT_PADRAO)
-        
-        event_info = data.get('event', {})
-        venue = event_info.get('venue', {})
-        
-        if not venue:
-            return None
-        
-        estadio_info = {
-            'nome': venue.get('stadium', {}).get('name', 'Estádio não informado'),
-            'cidade': venue.get('city', {}).get('name', 'Cidade não informada'),
-            'pais': venue.get('country', {}).get('name', ''),
-            'latitude': venue.get('latitude'),
-            'longitude': venue.get('longitude')
-        }
-        
-        return estadio_info
-        
+        detalhe = obter_detalhe_evento(event_id)
+        return detalhe.estadio if detalhe else None
     except Exception:
         return None
 
@@ -257,19 +198,16 @@ def buscar_partidas_do_dia(data_str):
         
         partidas = []
         
+        # Agenda completa do dia: baixada uma única vez e indexada por torneio
+        agenda = obter_agenda(data_api)
+        if agenda is None:
+            print(f"\n❌ Não foi possível obter a agenda de {data_str}")
+            return []
+        
         for liga_id, liga_nome in LIGAS_PRINCIPAIS.items():
             print(f"\n   🏆 {liga_nome}...")
             
-            url = f"{BASE_URL}/sport/football/scheduled-events/{data_api}"
-            data = fazer_requisicao(url)
-            
-            if not data or 'events' not in data:
-                continue
-            
-            eventos_liga = [
-                e for e in data['events'] 
-                if e.get('tournament', {}).get('uniqueTournament', {}).get('id') == liga_id
-            ]
+            eventos_liga = agenda.eventos_do_torneio(liga_id)
             
             if not eventos_liga:
                 print(f"      ℹ️ Nenhuma partida encontrada")
@@ -293,26 +231,7 @@ def buscar_partidas_do_dia(data_str):
                     torneio_nome = torneio.get('name', liga_nome)
                     
                     # Round/Fase
-                    round_info = evento.get('roundInfo', {})
-                    round_name = round_info.get('name', '')
-                    round_round = round_info.get('round', '')
-                    
-                    # Determina a fase/rodada
-                    fase = ''
-                    if round_name:
-                        round_lower = round_name.lower()
-                        if 'final' in round_lower and 'semi' not in round_lower and 'quarter' not in round_lower:
-                            fase = 'FINAL'
-                        elif 'semi' in round_lower:
-                            fase = 'SEMIFINAL'
-                        elif 'quarter' in round_lower or 'quartas' in round_lower:
-                            fase = 'QUARTAS'
-                        elif 'oitavas' in round_lower or 'round of 16' in round_lower:
-                            fase = 'OITAVAS'
-                        elif round_round:
-                            fase = f'{round_round}ª Rodada'
-                    elif round_round:
-                        fase = f'{round_round}ª Rodada'
+                    fase = fase_da_rodada(evento.get('roundInfo', {}))
                     
                     partida = {
                         'id': evento['id'],
@@ -348,83 +267,31 @@ def buscar_partidas_do_dia(data_str):
 # ============================================================================
 
 def buscar_arbitro_partida(partida_id):
-    """Busca informações do árbitro de uma partida específica"""
+    """Busca informações do árbitro de uma partida específica (lidas do EventDetail)"""
     try:
-        url = f"{BASE_URL}/event/{partida_id}"
-        data = fazer_requisicao(url)
-        
-        if not data or 'event' not in data:
-            return None
-        
-        evento = data['event']
-        
-        if 'referee' not in evento:
+        detalhe = obter_detalhe_evento(partida_id)
+        if not detalhe or not detalhe.arbitro:
             return None
         
-        arbitro = evento['referee']
-        
-        arbitro_info = {
-            'id': arbitro['id'],
-            'nome': arbitro['name'],
-            'pais': arbitro.get('country', {}).get('name', 'N/A'),
-            'pais_codigo': arbitro.get('country', {}).get('alpha2', 'N/A')
-        }
-        
+        arbitro_info = detalhe.arbitro
         print(f"         ⚖️ Árbitro: {arbitro_info['nome']} ({arbitro_info['pais']})")
         return arbitro_info
         
     except Exception as e:
         return None
 
-def _buscar_stats_evento_por_periodo(event_id, nome_keywords):
-    """Função genérica para ler estatísticas por período"""
-    periodos = {
-        "1ST": {"home": 0, "away": 0},
-        "2ND": {"home": 0, "away": 0},
-        "ALL": {"home": 0, "away": 0},
-    }
-    
-    try:
-        if not event_id:
-            return periodos
-        
-        url = f"{BASE_URL}/event/{event_id}/statistics"
-        data = fazer_requisicao(url)
-        
-        if not data:
-            return periodos
-        
-        statistics = data.get("statistics", [])
-        nome_keywords = [k.lower() for k in nome_keywords]
-        
-        for bloco in statistics:
-            period = bloco.get("period", "ALL")
-            if period not in periodos:
-                period = "ALL"
-            
-            grupos = bloco.get("groups", [])
-            
-            for grupo in grupos:
-                items = grupo.get("statisticsItems", [])
-                for item in items:
-                    nome_stat = (item.get("name", "") or "").lower()
-                    
-                    if any(kw in nome_stat for kw in nome_keywords):
-                        periodos[period]["home"] = _extrair_valor_estatistica(item.get("home", 0))
-                        periodos[period]["away"] = _extrair_valor_estatistica(item.get("away", 0))
-                        break
-        
-        return periodos
-        
-    except Exception:
-        return periodos
+def _estatisticas_evento(event_id, finalizada=False):
+    """EventStats do evento (uma requisição por execução); zeros se indisponível"""
+    return obter_estatisticas_evento(event_id, finalizada) or EventStats(event_id, None)
 
-def buscar_estatisticas_partida(partida_id):
+def buscar_estatisticas_partida(partida_id, finalizada=False):
     """Busca estatísticas detalhadas de uma partida"""
     try:
-        # Busca faltas
-        keywords_faltas = ["fouls", "fouls committed", "faltas", "faltas cometidas"]
-        flt = _buscar_stats_evento_por_periodo(partida_id, keywords_faltas)
+        # Uma única leitura de /statistics para faltas, amarelos e vermelhos
+        estatisticas = _estatisticas_evento(partida_id, finalizada)
+        
+        # Faltas
+        flt = estatisticas.periodos('faltas')
         
         # Qualidade do dado
         faltas_tempos_missing = False
@@ -437,11 +304,11 @@ def buscar_estatisticas_partida(partida_id):
             flt["2ND"]["home"] = None
             flt["2ND"]["away"] = None
         
-        # Busca cartões amarelos
-        amarelos = _buscar_stats_evento_por_periodo(partida_id, ["yellow card", "yellow cards"])
+        # Cartões amarelos
+        amarelos = estatisticas.periodos('amarelos')
         
-        # Busca cartões vermelhos
-        vermelhos = _buscar_stats_evento_por_periodo(partida_id, ["red card", "red cards"])
+        # Cartões vermelhos
+        vermelhos = estatisticas.periodos('vermelhos')
         
         stats = {
             # Faltas
@@ -510,14 +377,6 @@ def buscar_ultimas_partidas_arbitro(arbitro_id, quantidade=10, data_alvo=None):
     try:
         print(f"         🔍 Buscando últimas {quantidade} partidas...")
         
-        url = f"{BASE_URL}/referee/{arbitro_id}/events/last/0"
-        data = fazer_requisicao(url)
-        
-        if not data or 'events' not in data:
-            return []
-        
-        todos_eventos = data['events']
-        
         # Define a data limite (meia-noite do dia alvo)
         if data_alvo:
             if isinstance(data_alvo, str):
@@ -530,22 +389,9 @@ def buscar_ultimas_partidas_arbitro(arbitro_id, quantidade=10, data_alvo=None):
         else:
             timestamp_limite = datetime.now().timestamp()
         
-        # Filtra apenas partidas finalizadas E anteriores à data_alvo
-        eventos_finalizados = []
-        for evento in todos_eventos:
-            status_code = evento.get('status', {}).get('code')
-            status_type = evento.get('status', {}).get('type')
-            evento_timestamp = evento.get('startTimestamp', 0)
-            
-            # Só inclui se finalizado E antes da data limite
-            if (status_code == 100 or status_type == 'finished') and evento_timestamp < timestamp_limite:
-                eventos_finalizados.append(evento)
-        
-        # Ordena por timestamp DECRESCENTE
-        eventos_finalizados.sort(key=lambda x: x.get('startTimestamp', 0), reverse=True)
-        
-        # Pega as 10 mais recentes
-        eventos = eventos_finalizados[:quantidade]
+        # Partidas finalizadas antes da data limite, mais recentes primeiro
+        # (histórico incremental no banco local; páginas antigas só se preciso)
+        eventos = obter_historico_arbitro(arbitro_id, timestamp_limite, quantidade)
         partidas = []
         
         print(f"         ✅ {len(eventos)} partida(s) finalizada(s) encontrada(s)")
@@ -566,8 +412,8 @@ def buscar_ultimas_partidas_arbitro(arbitro_id, quantidade=10, data_alvo=None):
                     'data': datetime.fromtimestamp(evento['startTimestamp']).strftime('%d/%m/%Y'),
                 }
                 
-                # Busca estatísticas detalhadas da partida
-                stats = buscar_estatisticas_partida(evento['id'])
+                # Busca estatísticas detalhadas da partida (já finalizada)
+                stats = buscar_estatisticas_partida(evento['id'], finalizada=True)
                 if stats:
                     partida_info.update(stats)
                 
@@ -575,7 +421,6 @@ def buscar_ultimas_partidas_arbitro(arbitro_id, quantidade=10, data_alvo=None):
                 partida_info['fase'] = identificar_fase_partida(evento)
                 
                 partidas.append(partida_info)
-                time.sleep(0.3)
                 
             except Exception:
                 continue
@@ -589,11 +434,33 @@ def buscar_ultimas_partidas_arbitro(arbitro_id, quantidade=10, data_alvo=None):
 # v1.1: BUSCA DE NOTÍCIAS DO ÁRBITRO (PT + EN)
 # ============================================================================
 
+def _ler_feed_noticias(url):
+    """
+    Baixa o feed RSS pelo cliente compartilhado (pool, limitador, cache
+    com GET condicional e gravação/reprodução de cassetes) e só então
+    faz o parse.
+    """
+    conteudo = obter_cliente().buscar_conteudo(url)
+    if conteudo is None:
+        return feedparser.parse(b'')
+    return feedparser.parse(conteudo)
+
 def buscar_noticias_arbitro(nome_arbitro, pais_arbitro='', dias=90):
     """
     v1.1: Busca notícias recentes sobre o árbitro via Google News RSS
     Busca em PORTUGUÊS e INGLÊS para cobrir árbitros estrangeiros
+    
+    Os feeds são baixados ao mesmo tempo; a lista já filtrada e sem
+    duplicatas fica no banco local por VALIDADE_NOTICIAS.
     """
+    chave = f"{nome_arbitro}|{dias}"
+    banco = obter_banco_local()
+    guardadas = banco.noticias_arbitro(chave, time.time() - VALIDADE_NOTICIAS) if banco else None
+    if guardadas is not None:
+        for noticia in guardadas:
+            noticia['data'] = datetime.fromisoformat(noticia['data'])
+        return guardadas[:3]
+    
     noticias = []
     
     try:
@@ -610,41 +477,32 @@ def buscar_noticias_arbitro(nome_arbitro, pais_arbitro='', dias=90):
             f'{nome_arbitro} referee',
         ]
         
+        urls = (
+            [f"https://news.google.com/rss/search?q={quote(termo)}&hl=pt-BR&gl=BR&ceid=BR:pt-419" for termo in termos_pt] +
+            [f"https://news.google.com/rss/search?q={quote(termo)}&hl=en-US&gl=US&ceid=US:en" for termo in termos_en]
+        )
+        
+        # Todas as buscas ao mesmo tempo; o resultado volta na ordem de urls (PT primeiro)
+        with ThreadPoolExecutor(max_workers=len(urls)) as pool_feeds:
+            feeds = list(pool_feeds.map(_ler_feed_noticias, urls))
+        
         data_limite = datetime.now() - timedelta(days=dias)
         links_vistos = set()
         titulos_vistos = set()
         
-        # Busca em Português (Brasil)
-        for termo in termos_pt:
-            try:
-                url = f"https://news.google.com/rss/search?q={quote(termo)}&hl=pt-BR&gl=BR&ceid=BR:pt-419"
-                feed = feedparser.parse(url)
-                
-                for entry in feed.entries[:8]:
-                    noticia = _processar_noticia_entry(entry, nome_arbitro, data_limite, links_vistos, titulos_vistos)
-                    if noticia:
-                        noticias.append(noticia)
-                        
-            except Exception:
-                continue
-        
-        # Busca em Inglês (Internacional)
-        for termo in termos_en:
-            try:
-                url = f"https://news.google.com/rss/search?q={quote(termo)}&hl=en-US&gl=US&ceid=US:en"
-                feed = feedparser.parse(url)
-                
-                for entry in feed.entries[:8]:
-                    noticia = _processar_noticia_entry(entry, nome_arbitro, data_limite, links_vistos, titulos_vistos)
-                    if noticia:
-                        noticias.append(noticia)
-                        
-            except Exception:
-                continue
+        for feed in feeds:
+            for entry in feed.entries[:8]:
+                noticia = _processar_noticia_entry(entry, nome_arbitro, data_limite, links_vistos, titulos_vistos)
+                if noticia:
+                    noticias.append(noticia)
         
         # Ordena por data (mais recentes primeiro)
         noticias.sort(key=lambda x: x['data'], reverse=True)
         
+        # Só guarda se algum feed respondeu (falha de rede não vira "sem notícias")
+        if banco and any(feed.get('version') or feed.entries for feed in feeds):
+            banco.salvar_noticias_arbitro(chave, [dict(n, data=n['data'].isoformat()) for n in noticias])
+        
         # Retorna top 3
         return noticias[:3]
         
@@ -864,48 +722,10 @@ def calcular_metricas_arbitro(historico, liga_id_jogo):
 # BUSCA DE INFORMAÇÕES DOS TIMES
 # ============================================================================
 
-@retry_on_failure(max_attempts=2)
 def buscar_colocacao_time(team_id, liga_id):
-    """Busca colocação atual do time no campeonato"""
+    """Busca colocação atual do time no campeonato (tabela da liga baixada uma vez por execução)"""
     try:
-        # Busca temporada atual
-        url_tournament = f"{BASE_URL}/unique-tournament/{liga_id}/seasons"
-        seasons_data = fazer_requisicao_com_retry(url_tournament, timeout=TIMEOUT_PADRAO)
-        
-        seasons = seasons_data.get('seasons', [])
-        if not seasons:
-            return None
-        
-        season_id = seasons[0].get('id')
-        
-        # Busca tabela de classificação
-        url_standings = f"{BASE_URL}/unique-tournament/{liga_id}/season/{season_id}/standings/total"
-        standings_data = fazer_requisicao_com_retry(url_standings, timeout=TIMEOUT_PADRAO)
-        
-        standings = standings_data.get('standings', [])
-        if not standings:
-            return None
-        
-        # Procura o time na tabela
-        for standing_group in standings:
-            rows = standing_group.get('rows', [])
-            for row in rows:
-                team = row.get('team', {})
-                if team.get('id') == team_id:
-                    return {
-                        'posicao': row.get('position', 0),
-                        'pontos': row.get('points', 0),
-                        'jogos': row.get('matches', 0),
-                        'vitorias': row.get('wins', 0),
-                        'empates': row.get('draws', 0),
-                        'derrotas': row.get('losses', 0),
-                        'gols_pro': row.get('scoresFor', 0),
-                        'gols_contra': row.get('scoresAgainst', 0),
-                        'saldo_gols': row.get('scoresFor', 0) - row.get('scoresAgainst', 0),
-                    }
-        
-        return None
-        
+        return obter_servico_classificacao().colocacao(team_id, liga_id)
     except Exception:
         return None
 
@@ -913,7 +733,7 @@ def buscar_colocacao_time(team_id, liga_id):
 # v1.1: PRÓXIMOS JOGOS COM COLOCAÇÃO + COMPETIÇÃO
 # ============================================================================
 
-@retry_on_failure(max_attempts=2)
+@perfilado('proximos_jogos')
 def buscar_proximos_jogos(team_id, quantidade=3, data_alvo=None):
     """
     v1.4: Busca os próximos jogos do time APÓS a data_alvo.
@@ -933,54 +753,16 @@ def buscar_proximos_jogos(team_id, quantidade=3, data_alvo=None):
         else:
             timestamp_limite = datetime.now().timestamp()
         
-        todos_eventos = []
+        # Jogos APÓS a data_alvo, mais próximos primeiro (linha do tempo do time:
+        # next/0 e, se a data_alvo é no passado, também os jogos já disputados)
+        eventos_ordenados = obter_linha_do_tempo_time(team_id).depois_de(timestamp_limite, quantidade)
         
-        # Busca eventos futuros
-        try:
-            url_next = f"{BASE_URL}/team/{team_id}/events/next/0"
-            data_next = fazer_requisicao_com_retry(url_next, timeout=TIMEOUT_PADRAO)
-            if data_next and 'events' in data_next:
-                todos_eventos.extend(data_next['events'])
-        except:
-            pass
-        
-        # Se data_alvo é no passado, também busca eventos passados
-        # (pois os "próximos" jogos em relação a data_alvo podem já ter acontecido)
-        data_hoje = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        if timestamp_limite < data_hoje.timestamp():
-            try:
-                url_last = f"{BASE_URL}/team/{team_id}/events/last/0"
-                data_last = fazer_requisicao_com_retry(url_last, timeout=TIMEOUT_PADRAO)
-                if data_last and 'events' in data_last:
-                    todos_eventos.extend(data_last['events'])
-            except:
-                pass
-        
-        if not todos_eventos:
+        if not eventos_ordenados:
             return []
         
-        # Filtra apenas jogos APÓS a data_alvo
-        eventos_futuros = [
-            e for e in todos_eventos 
-            if e.get('startTimestamp', 0) > timestamp_limite
-        ]
-        
-        # Remove duplicados (mesmo evento pode aparecer em next e last)
-        eventos_unicos = {}
-        for e in eventos_futuros:
-            event_id = e.get('id')
-            if event_id and event_id not in eventos_unicos:
-                eventos_unicos[event_id] = e
-        
-        # Ordena por data (mais próximos primeiro)
-        eventos_ordenados = sorted(
-            eventos_unicos.values(),
-            key=lambda x: x.get('startTimestamp', 0)
-        )
-        
         proximos_jogos = []
         
-        for evento in eventos_ordenados[:quantidade]:
+        for evento in eventos_ordenados:
             try:
                 home_team = evento.get('homeTeam', {})
                 away_team = evento.get('awayTeam', {})
@@ -1043,20 +825,13 @@ def buscar_proximos_jogos(team_id, quantidade=3, data_alvo=None):
     except Exception:
         return []
 
-@retry_on_failure(max_attempts=2)
+@perfilado('ultimos_jogos_time')
 def buscar_ultimos_jogos_time(team_id, quantidade=5, data_alvo=None):
     """
     Busca últimos jogos do time ANTES da data_alvo com estatísticas de faltas e amarelos.
     Se data_alvo não for informada, usa a data atual.
     """
     try:
-        url = f"{BASE_URL}/team/{team_id}/events/last/0"
-        data = fazer_requisicao_com_retry(url, timeout=TIMEOUT_PADRAO)
-        
-        eventos = data.get('events', [])
-        if not eventos:
-            return None
-        
         # Define a data limite (meia-noite do dia alvo)
         if data_alvo:
             if isinstance(data_alvo, str):
@@ -1069,22 +844,15 @@ def buscar_ultimos_jogos_time(team_id, quantidade=5, data_alvo=None):
         else:
             timestamp_limite = datetime.now().timestamp()
         
-        # Filtra apenas jogos ANTERIORES à data_alvo
-        eventos_filtrados = [
-            e for e in eventos 
-            if e.get('startTimestamp', 0) < timestamp_limite
-        ]
-        
-        # Ordena por data (mais recentes primeiro)
-        eventos_ordenados = sorted(
-            eventos_filtrados,
-            key=lambda x: x.get('startTimestamp', 0),
-            reverse=True
-        )
+        # Jogos ANTERIORES à data_alvo, mais recentes primeiro
+        # (linha do tempo do time: banco local primeiro, API se preciso)
+        eventos_ordenados = obter_linha_do_tempo_time(team_id).antes_de(timestamp_limite, quantidade)
+        if not eventos_ordenados:
+            return None
         
         jogos = []
         
-        for evento in eventos_ordenados[:quantidade]:
+        for evento in eventos_ordenados:
             try:
                 home_team = evento.get('homeTeam', {})
                 away_team = evento.get('awayTeam', {})
@@ -1093,16 +861,18 @@ def buscar_ultimos_jogos_time(team_id, quantidade=5, data_alvo=None):
                 
                 eh_casa = (home_team.get('id') == team_id)
                 event_id = evento.get('id')
+                finalizada = evento.get('status', {}).get('type') == 'finished'
                 
                 adversario = away_team.get('name') if eh_casa else home_team.get('name')
                 
                 gols_feitos = home_score.get('current', 0) if eh_casa else away_score.get('current', 0)
                 gols_sofridos = away_score.get('current', 0) if eh_casa else home_score.get('current', 0)
                 
-                # Busca estatísticas
+                # Busca estatísticas (uma única leitura de /statistics)
+                estatisticas = _estatisticas_evento(event_id, finalizada)
+                
                 # Faltas
-                keywords_faltas = ["fouls", "fouls committed", "faltas"]
-                flt = _buscar_stats_evento_por_periodo(event_id, keywords_faltas)
+                flt = estatisticas.periodos('faltas')
                 
                 faltas_feitas_1t = flt["1ST"]["home"] if eh_casa else flt["1ST"]["away"]
                 faltas_sofridas_1t = flt["1ST"]["away"] if eh_casa else flt["1ST"]["home"]
@@ -1117,7 +887,7 @@ def buscar_ultimos_jogos_time(team_id, quantidade=5, data_alvo=None):
                     faltas_feitas_2t = None
                 
                 # Amarelos
-                cart = _buscar_stats_evento_por_periodo(event_id, ["yellow card", "yellow cards"])
+                cart = estatisticas.periodos('amarelos')
                 
                 amarelos_feitos_1t = cart["1ST"]["home"] if eh_casa else cart["1ST"]["away"]
                 amarelos_sofridos_1t = cart["1ST"]["away"] if eh_casa else cart["1ST"]["home"]
@@ -1150,7 +920,6 @@ def buscar_ultimos_jogos_time(team_id, quantidade=5, data_alvo=None):
                 }
                 
                 jogos.append(jogo_info)
-                time.sleep(0.3)
                 
             except Exception:
                 continue
@@ -1179,332 +948,1319 @@ def buscar_ultimos_jogos_time(team_id, quantidade=5, data_alvo=None):
 # GERAÇÃO DO HTML
 # ============================================================================
 
-def gerar_html_unificado(analises, timestamp, data_jogos):
-    """Gera o relatório HTML unificado"""
+def gerar_card_html(analise):
+    """
+    Gera o card de uma partida (árbitro, times e gráfico de amarelos).
+    O card fica entre os marcadores <!-- card:ID --> e <!-- /card:ID -->,
+    para que a atualização (--atualizar) troque só os cards que mudaram.
+    """
+    html = f"""
+        <!-- card:{analise['partida']['id']} -->"""
     
-    html = f"""<!DOCTYPE html>
-<html lang="pt-BR">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>RefStats - Jogos do Dia {data_jogos}</title>
-    <link rel="icon" href="./assets/img/favicon.ico">
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
-            padding: 20px;
-            padding-top: 100px;
-            min-height: 100vh;
-            color: #e0e0e0;
-        }}
-        
-        /* ========================================
-           NAVBAR (igual ao Home)
-           ======================================== */
-        .navbar {{
-            position: fixed;
-            top: 0;
-            left: 0;
-            right: 0;
-            z-index: 9997;
-            background-image:
-                linear-gradient(
-                    rgba(10, 15, 30, 0.85),
-                    rgba(10, 15, 30, 0.85)
-                ),
-                url("./assets/img/FundoMuroFundo.png");
-            background-size: cover;
-            background-position: center;
-            background-repeat: no-repeat;
-            padding: 15px 50px;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            box-shadow: 0 4px 20px rgba(0, 0, 0, 0.6);
-            border-bottom: 2px solid #e94560;
-            backdrop-filter: blur(2px);
-        }}
-        
-        .navbar-brand {{
-            display: flex;
-            align-items: center;
-            gap: 12px;
-            text-decoration: none;
-        }}
-        
-        .logo-img {{
-            height: 48px;
-            width: auto;
-            display: block;
-        }}
-        
-        .navbar-brand .brand-text {{
-            font-size: 1.8em;
-            font-weight: bold;
-            color: #e94560;
-        }}
-        
-        .navbar-brand .brand-text span {{
-            color: #3498db;
-        }}
-        
-        .navbar-menu {{
-            display: flex;
-            gap: 10px;
-        }}
-        
-        .navbar-menu a {{
-            color: #e0e0e0;
-            text-decoration: none;
-            padding: 10px 20px;
-            border-radius: 25px;
-            transition: all 0.3s;
-            font-weight: 500;
-            border: 1px solid transparent;
-        }}
+    partida = analise['partida']
+    arbitro = analise.get('arbitro')
+    metricas = analise.get('metricas')
+    noticias_arbitro = analise.get('noticias_arbitro', [])
+    historico = analise.get('historico', [])
+    stats_casa = analise.get('stats_casa')
+    stats_fora = analise.get('stats_fora')
+    colocacao_casa = analise.get('colocacao_casa')
+    colocacao_fora = analise.get('colocacao_fora')
+    proximos_casa = analise.get('proximos_casa', [])
+    proximos_fora = analise.get('proximos_fora', [])
+    estadio_info = analise.get('estadio_info')
+    secoes_puladas = analise.get('secoes_puladas', [])
+    
+    # Posições para o título
+    pos_casa = f" ({colocacao_casa['posicao']}º)" if colocacao_casa else ""
+    pos_fora = f" ({colocacao_fora['posicao']}º)" if colocacao_fora else ""
+    
+    # Info do estádio
+    estadio_nome = estadio_info.get('nome', 'Não informado') if estadio_info else 'Não informado'
+    estadio_cidade = estadio_info.get('cidade', '') if estadio_info else ''
+    estadio_pais = estadio_info.get('pais', '') if estadio_info else ''
+    
+    # Perfil do árbitro para filtro
+    perfil_arbitro = metricas.get('perfil', 'N/A') if metricas else 'N/A'
+    
+    html += f"""
+        <div class="jogo-card" data-perfil="{perfil_arbitro}">
+            <div class="jogo-header">
+                <div class="jogo-titulo">{partida['time_casa']}{pos_casa} vs {partida['time_fora']}{pos_fora}</div>
+                <div class="jogo-data">
+                    <div class="horario">{partida['horario']}</div>
+                    <div class="data">{partida['data']}</div>
+                </div>
+            </div>
+            
+            <div class="jogo-info-bar">
+                <span>
+                    <span class="info-label">🏆 Competição:</span>
+                    <span class="info-value">{partida['liga_nome']}</span>
+                </span>
+                <span>
+                    <span class="info-label">🏟️ Estádio:</span>
+                    <span class="info-value">{estadio_nome}</span>
+                </span>
+                <span>
+                    <span class="info-label">📍 Local:</span>
+                    <span class="info-value">{estadio_cidade}{', ' + estadio_pais if estadio_pais else ''}</span>
+                </span>
+                {f'<span><span class="info-label">📋 Fase:</span><span class="info-value">{partida["fase"]}</span></span>' if partida['fase'] else ""}
+            </div>
+            
+            <div class="jogo-content">
+"""
+    
+    # Seção do Árbitro
+    html += """
+                <div class="secao">
+                    <div class="secao-titulo">⚖️ Árbitro</div>
+"""
+    
+    if arbitro:
+        # Determina tipo de badge (Liga ou Copa)
+        liga_nome_lower = partida['liga_nome'].lower()
+        badge_tipo = 'badge-copa' if 'copa' in liga_nome_lower or 'cup' in liga_nome_lower else 'badge-liga'
+        badge_texto = 'Copa' if 'copa' in liga_nome_lower or 'cup' in liga_nome_lower else 'Liga'
         
-        .navbar-menu a:hover {{
-            background: rgba(233, 69, 96, 0.2);
-            border-color: #e94560;
-            color: #e94560;
-        }}
+        html += f"""
+                    <div class="arbitro-card">
+                        <div class="arbitro-nome">
+                            {arbitro['nome']}
+                            <span class="badge {badge_tipo}">{badge_texto}</span>
+                        </div>
+                        <div class="arbitro-pais">🌍 {arbitro['pais']}</div>
+"""
         
-        .navbar-menu a.active {{
-            background: linear-gradient(135deg, #e94560 0%, #0f3460 100%);
-            color: white;
-        }}
-        
-        .menu-toggle {{
-            display: none;
-            background: none;
-            border: none;
-            color: #e0e0e0;
-            font-size: 1.5em;
-            cursor: pointer;
-        }}
+        if metricas:
+            # Médias do Árbitro com tooltips
+            html += """
+                        <div class="metricas-grid">
+"""
+            html += f"""
+                            <div class="metrica-card">
+                                <div class="valor">{metricas['media_amarelos_10j']}</div>
+                                <div class="label">
+                                    📊 Média Amarelos (10j)
+                                    <span class="tooltip">
+                                        <span class="tooltip-icon">i</span>
+                                        <span class="tooltip-text">Média de cartões amarelos por jogo nos últimos 10 jogos apitados pelo árbitro (soma dos dois times).</span>
+                                    </span>
+                                </div>
+                            </div>
+                            <div class="metrica-card">
+                                <div class="valor">{metricas['media_amarelos_5j']}</div>
+                                <div class="label">
+                                    📊 Média Amarelos (5j)
+                                    <span class="tooltip">
+                                        <span class="tooltip-icon">i</span>
+                                        <span class="tooltip-text">Média de cartões amarelos por jogo nos últimos 5 jogos apitados. Amostra menor, mas mais recente.</span>
+                                    </span>
+                                </div>
+                            </div>
+                            <div class="metrica-card">
+                                <div class="valor">{metricas['media_amarelos_1t']}</div>
+                                <div class="label">
+                                    📊 Média Amarelos 1T
+                                    <span class="tooltip">
+                                        <span class="tooltip-icon">i</span>
+                                        <span class="tooltip-text">Média de cartões amarelos aplicados apenas no 1º tempo (primeiros 45 minutos).</span>
+                                    </span>
+                                </div>
+                            </div>
+                            <div class="metrica-card">
+                                <div class="valor">{metricas['media_amarelos_2t']}</div>
+                                <div class="label">
+                                    📊 Média Amarelos 2T
+                                    <span class="tooltip">
+                                        <span class="tooltip-icon">i</span>
+                                        <span class="tooltip-text">Média de cartões amarelos aplicados apenas no 2º tempo (após os 45 minutos).</span>
+                                    </span>
+                                </div>
+                            </div>
+                            <div class="metrica-card">
+                                <div class="valor">{metricas['media_faltas_10j']}</div>
+                                <div class="label">
+                                    📊 Média Faltas (10j)
+                                    <span class="tooltip">
+                                        <span class="tooltip-icon">i</span>
+                                        <span class="tooltip-text">Média total de faltas por jogo nos últimos 10 jogos (soma dos dois times).</span>
+                                    </span>
+                                </div>
+                            </div>
+                            <div class="metrica-card">
+                                <div class="valor">{metricas['media_faltas_5j']}</div>
+                                <div class="label">
+                                    📊 Média Faltas (5j)
+                                    <span class="tooltip">
+                                        <span class="tooltip-icon">i</span>
+                                        <span class="tooltip-text">Média de faltas nos últimos 5 jogos. Amostra mais recente.</span>
+                                    </span>
+                                </div>
+                            </div>
+                            <div class="metrica-card">
+                                <div class="valor">{metricas['media_faltas_1t']}</div>
+                                <div class="label">
+                                    📊 Média Faltas 1T
+                                    <span class="tooltip">
+                                        <span class="tooltip-icon">i</span>
+                                        <span class="tooltip-text">Média de faltas cometidas no 1º tempo.</span>
+                                    </span>
+                                </div>
+                            </div>
+                            <div class="metrica-card">
+                                <div class="valor">{metricas['media_faltas_2t']}</div>
+                                <div class="label">
+                                    📊 Média Faltas 2T
+                                    <span class="tooltip">
+                                        <span class="tooltip-icon">i</span>
+                                        <span class="tooltip-text">Média de faltas cometidas no 2º tempo.</span>
+                                    </span>
+                                </div>
+                            </div>
+                            <div class="metrica-card">
+                                <div class="valor">{metricas['media_vermelhos']}</div>
+                                <div class="label">
+                                    📊 Média Vermelhos
+                                    <span class="tooltip">
+                                        <span class="tooltip-icon">i</span>
+                                        <span class="tooltip-text">Média de cartões vermelhos por jogo nos últimos 10 jogos.</span>
+                                    </span>
+                                </div>
+                            </div>
+                        </div>
+"""
+            
+            # Perfil do Árbitro - MELHORADO
+            perfil = metricas['perfil']
+            # Mapeamento sem acentos para as classes CSS
+            perfil_classes = {
+                'Rigoroso': 'perfil-rigoroso',
+                'Médio': 'perfil-medio',
+                'Permissivo': 'perfil-permissivo'
+            }
+            perfil_class = perfil_classes.get(perfil, 'perfil-medio')
+            
+            # Descrições dos perfis
+            perfil_descricoes = {
+                'Rigoroso': 'Este árbitro aplica mais de 15% cartões amarelos acima da média da competição. Espere um jogo com mais cartões.',
+                'Médio': 'Este árbitro está na média da competição em termos de cartões amarelos. Comportamento equilibrado.',
+                'Permissivo': 'Este árbitro aplica mais de 15% menos cartões amarelos que a média da competição. Jogo pode ter menos cartões.'
+            }
+            
+            html += f"""
+                        <div class="perfil-section">
+                            <div class="perfil-header">
+                                <span class="perfil-titulo">📋 Perfil do Árbitro</span>
+                                <span class="tooltip">
+                                    <span class="tooltip-icon">i</span>
+                                    <span class="tooltip-text">O perfil é calculado comparando a média de amarelos do árbitro com a média da competição (baseline). Rigoroso: +15% acima da média. Permissivo: -15% abaixo da média.</span>
+                                </span>
+                            </div>
+                            <div class="perfil-badges">
+                                <span class="perfil-badge {perfil_class}">
+                                    {'🔴' if perfil == 'Rigoroso' else '🟡' if perfil == 'Médio' else '🟢'} {perfil}
+                                </span>
+"""
+            if metricas.get('pipoqueiro_1t'):
+                html += """
+                                <span class="perfil-badge perfil-pipoqueiro">
+                                    🍿 Pipoqueiro 1T
+                                    <span class="tooltip">
+                                        <span class="tooltip-icon">i</span>
+                                        <span class="tooltip-text">Mais de 50% dos cartões amarelos são aplicados no 1º tempo. Bom para apostas de cartões no 1T.</span>
+                                    </span>
+                                </span>
+"""
+            html += f"""
+                            </div>
+                            <div class="perfil-descricao">{perfil_descricoes.get(perfil, '')}</div>
+                        </div>
+"""
+            
+            # Baseline da Liga
+            baseline = metricas.get('baseline')
+            if baseline:
+                html += f"""
+                        <div class="baseline-section">
+                            <div class="baseline-titulo">
+                                📈 Baseline da Competição ({baseline.get('liga', partida['liga_nome'])})
+                                <span class="tooltip">
+                                    <span class="tooltip-icon">i</span>
+                                    <span class="tooltip-text">Valores médios históricos da competição. Usados como referência para classificar o perfil do árbitro.</span>
+                                </span>
+                            </div>
+                            <div class="baseline-valores">
+                                <div class="baseline-item">
+                                    <span>Média Amarelos:</span>
+                                    <span class="valor">{baseline.get('amarelos_total_jogo', '-')}</span>
+                                </div>
+                                <div class="baseline-item">
+                                    <span>Média Faltas:</span>
+                                    <span class="valor">{baseline.get('faltas_total_jogo', '-')}</span>
+                                </div>
+                            </div>
+                        </div>
+"""
+            
+            # Qualidade dos dados
+            html += f"""
+                        <div class="baseline-section">
+                            <div class="baseline-titulo">
+                                📉 Qualidade dos Dados
+                                <span class="tooltip">
+                                    <span class="tooltip-icon">i</span>
+                                    <span class="tooltip-text">Percentual de jogos dos últimos 10 que possuem dados de faltas por tempo (1T/2T). Quanto maior, mais confiáveis as médias por tempo.</span>
+                                </span>
+                            </div>
+                            <div class="baseline-valores">
+                                <div class="baseline-item">
+                                    <span>Disponibilidade Faltas 1T/2T:</span>
+                                    <span class="valor">{metricas['qualidade_faltas_1t']}%</span>
+                                </div>
+                            </div>
+                        </div>
+"""
+            
+            # Tendências
+            html += f"""
+                        <div class="tendencias">
+                            <div class="tendencia-item">
+                                <span>
+                                    % jogos com ≥5 amarelos (10j)
+                                    <span class="tooltip">
+                                        <span class="tooltip-icon">i</span>
+                                        <span class="tooltip-text">Percentual de jogos onde o total de amarelos foi 5 ou mais. Útil para mercado de Over 4.5 cartões.</span>
+                                    </span>
+                                </span>
+                                <span style="color: #e94560; font-weight: bold;">{metricas['pct_5mais_amarelos']}%</span>
+                            </div>
+                            <div class="tendencia-item">
+                                <span>
+                                    % jogos com ≥3 amarelos no 1T (10j)
+                                    <span class="tooltip">
+                                        <span class="tooltip-icon">i</span>
+                                        <span class="tooltip-text">Percentual de jogos onde foram aplicados 3+ amarelos no 1º tempo. Útil para mercado de cartões no 1T.</span>
+                                    </span>
+                                </span>
+                                <span style="color: #e94560; font-weight: bold;">{metricas['pct_3mais_amarelos_1t']}%</span>
+                            </div>
+                        </div>
+"""
         
-        .container {{
-            max-width: 1400px;
-            margin: 0 auto;
-            width: 100%;
-        }}
+        html += """
+                    </div>
+"""
         
-        .header {{
-            background: linear-gradient(135deg, #0f3460 0%, #1a1a2e 100%);
-            padding: 30px;
-            border-radius: 15px;
-            box-shadow: 0 10px 30px rgba(0,0,0,0.5);
-            margin-bottom: 30px;
-            text-align: center;
-            border: 1px solid #e94560;
-        }}
+        # Notícias do Árbitro
+        html += f"""
+                    <div class="secao-titulo" style="margin-top: 25px;">📰 Notícias recentes envolvendo {arbitro['nome']}</div>
+"""
         
-        .header h1 {{
-            color: #e94560;
-            font-size: 2.5em;
-            margin-bottom: 10px;
-        }}
+        if noticias_arbitro:
+            html += """
+                    <div class="noticias-lista">
+"""
+            for noticia in noticias_arbitro:
+                html += f"""
+                        <div class="noticia-card">
+                            <div class="noticia-titulo">{noticia['titulo']}</div>
+                            <div class="noticia-meta">
+                                <span>📰 {noticia['fonte']}</span>
+                                <span>📅 {noticia['data_formatada']}</span>
+                            </div>
+                            {f"<div class='noticia-resumo'>{noticia['resumo']}</div>" if noticia['resumo'] else ""}
+                            <a href="{noticia['link']}" target="_blank" class="noticia-link">Ler mais →</a>
+                        </div>
+"""
+            html += """
+                    </div>
+"""
+        elif 'noticias_arbitro' in secoes_puladas:
+            html += """
+                    <div class="sem-noticias secao-pulada">⏱️ Notícias não consultadas (prazo da execução esgotado)</div>
+"""
+        else:
+            html += """
+                    <div class="sem-noticias">ℹ️ Nenhuma notícia recente encontrada</div>
+"""
         
-        .header p {{
-            color: #a0a0a0;
-            font-size: 1.1em;
-        }}
-        
-        .jogo-card {{
-            background: linear-gradient(135deg, #16213e 0%, #1a1a2e 100%);
-            padding: 0;
-            border-radius: 15px;
-            box-shadow: 0 10px 30px rgba(0,0,0,0.5);
-            margin-bottom: 30px;
-            border: 1px solid #0f3460;
-            overflow: hidden;
-            width: 100%;
-            box-sizing: border-box;
-        }}
-        
-        .jogo-header {{
-            background: linear-gradient(135deg, #e94560 0%, #0f3460 100%);
-            padding: 25px 30px;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }}
-        
-        .jogo-titulo {{
-            font-size: 1.8em;
-            color: white;
-            font-weight: bold;
-        }}
-        
-        .jogo-data {{
-            text-align: right;
-            color: white;
-        }}
+        # Tabelas de Histórico do Árbitro
+        if historico:
+            jogos_mesma_liga = metricas.get('jogos_mesma_liga', []) if metricas else []
+            jogos_outras = metricas.get('jogos_outras_ligas', []) if metricas else []
+            
+            # Histórico - Mesma Liga
+            html += f"""
+                    <div class="secao-titulo" style="margin-top: 25px;">📊 Histórico — {partida['liga_nome']}</div>
+                    <div class="tabela-scroll">
+                    <table class="tabela">
+                        <thead>
+                            <tr>
+                                <th>Data</th>
+                                <th>Partida</th>
+                                <th>Placar</th>
+                                <th>Faltas 1T</th>
+                                <th>Faltas 2T</th>
+                                <th>Faltas Total</th>
+                                <th>Amarelos</th>
+                                <th>Vermelhos</th>
+                            </tr>
+                        </thead>
+                        <tbody>
+"""
+            
+            if jogos_mesma_liga:
+                for jogo in jogos_mesma_liga[:10]:
+                    f1c = jogo.get('faltas_1t_casa')
+                    f1f = jogo.get('faltas_1t_fora')
+                    f2c = jogo.get('faltas_2t_casa')
+                    f2f = jogo.get('faltas_2t_fora')
+                    ftc = jogo.get('faltas_total_casa')
+                    ftf = jogo.get('faltas_total_fora')
+                    
+                    faltas_1t = "—" if (f1c is None or f1f is None) else str((f1c or 0) + (f1f or 0))
+                    faltas_2t = "—" if (f2c is None or f2f is None) else str((f2c or 0) + (f2f or 0))
+                    faltas_total = "—" if (ftc is None or ftf is None) else str((ftc or 0) + (ftf or 0))
+                    
+                    amarelos = (jogo.get('amarelos_total_casa', 0) or 0) + (jogo.get('amarelos_total_fora', 0) or 0)
+                    vermelhos = (jogo.get('vermelhos_total_casa', 0) or 0) + (jogo.get('vermelhos_total_fora', 0) or 0)
+                    
+                    html += f"""
+                            <tr>
+                                <td>{jogo.get('data', '')}</td>
+                                <td>{jogo.get('time_casa', '')} vs {jogo.get('time_fora', '')}</td>
+                                <td style="font-weight: bold;">{jogo.get('placar_casa', 0)} - {jogo.get('placar_fora', 0)}</td>
+                                <td>{faltas_1t}</td>
+                                <td>{faltas_2t}</td>
+                                <td>{faltas_total}</td>
+                                <td><span class="stat-amarelo">{amarelos}</span></td>
+                                <td><span class="stat-vermelho">{vermelhos}</span></td>
+                            </tr>
+"""
+            else:
+                html += """
+                            <tr>
+                                <td colspan="8" style="text-align: center; color: #a0a0a0;">Nenhum jogo nesta competição</td>
+                            </tr>
+"""
+            
+            html += """
+                        </tbody>
+                    </table>
+                    </div>
+"""
+            
+            # Histórico - Outras Competições
+            html += """
+                    <div class="secao-titulo" style="margin-top: 25px;">📊 Histórico — Outras Competições</div>
+                    <div class="tabela-scroll">
+                    <table class="tabela">
+                        <thead>
+                            <tr>
+                                <th>Data</th>
+                                <th>Competição</th>
+                                <th>Partida</th>
+                                <th>Placar</th>
+                                <th>Faltas 1T</th>
+                                <th>Faltas 2T</th>
+                                <th>Faltas Total</th>
+                                <th>Amarelos</th>
+                                <th>Vermelhos</th>
+                            </tr>
+                        </thead>
+                        <tbody>
+"""
+            
+            if jogos_outras:
+                for jogo in jogos_outras[:10]:
+                    f1c = jogo.get('faltas_1t_casa')
+                    f1f = jogo.get('faltas_1t_fora')
+                    f2c = jogo.get('faltas_2t_casa')
+                    f2f = jogo.get('faltas_2t_fora')
+                    ftc = jogo.get('faltas_total_casa')
+                    ftf = jogo.get('faltas_total_fora')
+                    
+                    faltas_1t = "—" if (f1c is None or f1f is None) else str((f1c or 0) + (f1f or 0))
+                    faltas_2t = "—" if (f2c is None or f2f is None) else str((f2c or 0) + (f2f or 0))
+                    faltas_total = "—" if (ftc is None or ftf is None) else str((ftc or 0) + (ftf or 0))
+                    
+                    amarelos = (jogo.get('amarelos_total_casa', 0) or 0) + (jogo.get('amarelos_total_fora', 0) or 0)
+                    vermelhos = (jogo.get('vermelhos_total_casa', 0) or 0) + (jogo.get('vermelhos_total_fora', 0) or 0)
+                    
+                    html += f"""
+                            <tr>
+                                <td>{jogo.get('data', '')}</td>
+                                <td>{jogo.get('campeonato', '')}</td>
+                                <td>{jogo.get('time_casa', '')} vs {jogo.get('time_fora', '')}</td>
+                                <td style="font-weight: bold;">{jogo.get('placar_casa', 0)} - {jogo.get('placar_fora', 0)}</td>
+                                <td>{faltas_1t}</td>
+                                <td>{faltas_2t}</td>
+                                <td>{faltas_total}</td>
+                                <td><span class="stat-amarelo">{amarelos}</span></td>
+                                <td><span class="stat-vermelho">{vermelhos}</span></td>
+                            </tr>
+"""
+            else:
+                html += """
+                            <tr>
+                                <td colspan="9" style="text-align: center; color: #a0a0a0;">Nenhum jogo em outras competições</td>
+                            </tr>
+"""
+            
+            html += """
+                        </tbody>
+                    </table>
+                    </div>
+"""
+    
+    else:
+        html += """
+                    <div class="sem-noticias">⚠️ Árbitro não informado para esta partida</div>
+"""
+    
+    html += """
+                </div>
+"""
+    
+    # Seção dos Times
+    html += """
+                <div class="secao">
+                    <div class="secao-titulo">⚽ Times</div>
+                    <div class="times-grid">
+"""
+    
+    # Time da Casa
+    html += f"""
+                        <div class="time-card">
+                            <div class="time-header">
+                                <div class="time-nome">🏠 {partida['time_casa']}</div>
+                                {f"<div class='time-posicao'>{colocacao_casa['posicao']}º</div>" if colocacao_casa else ""}
+                            </div>
+                            <div class="time-content">
+"""
+    
+    # Próximos jogos - Casa (MELHORADO v1.1)
+    if proximos_casa:
+        html += """
+                                <div class="proximos-jogos">
+                                    <h5>📅 Próximos 3 Jogos</h5>
+"""
+        for jogo in proximos_casa:
+            pos_adv = jogo.get('colocacao_adversario')
+            pos_adv_html = f"<span class='adversario-pos'>{pos_adv['posicao']}º</span>" if pos_adv else ""
+            campeonato_html = f"<span class='campeonato'>{jogo['campeonato']}</span>" if jogo.get('campeonato') else ""
+            fase_html = f"<span style='color: #a0a0a0;'>({jogo['fase']})</span>" if jogo.get('fase') else ""
+            
+            html += f"""
+                                    <div class="proximo-jogo">
+                                        <span class="local">{jogo['local']}</span>
+                                        <span class="adversario-info">
+                                            {jogo['adversario']}
+                                            {pos_adv_html}
+                                        </span>
+                                        <span style="color: #a0a0a0;">{jogo['data']}</span>
+                                        {campeonato_html}
+                                        {fase_html}
+                                    </div>
+"""
+        html += """
+                                </div>
+"""
+    elif 'proximos_casa' in secoes_puladas:
+        html += """
+                                <div class="proximos-jogos secao-pulada">
+                                    <h5>📅 Próximos 3 Jogos</h5>
+                                    ⏱️ Não consultados (prazo da execução esgotado)
+                                </div>
+"""
+    
+    # Médias do Time Casa com tooltips
+    if stats_casa:
+        html += f"""
+                                <div class="medias-time">
+                                    <div class="media-item">
+                                        <div class="valor">{stats_casa['media_faltas_feitas']}</div>
+                                        <div class="label">
+                                            Faltas Pró
+                                            <span class="tooltip">
+                                                <span class="tooltip-icon">i</span>
+                                                <span class="tooltip-text">Média de faltas COMETIDAS pelo time nos últimos 5 jogos.</span>
+                                            </span>
+                                        </div>
+                                    </div>
+                                    <div class="media-item">
+                                        <div class="valor">{stats_casa['media_faltas_sofridas']}</div>
+                                        <div class="label">
+                                            Faltas Contra
+                                            <span class="tooltip">
+                                                <span class="tooltip-icon">i</span>
+                                                <span class="tooltip-text">Média de faltas SOFRIDAS pelo time nos últimos 5 jogos (cometidas pelo adversário).</span>
+                                            </span>
+                                        </div>
+                                    </div>
+                                    <div class="media-item">
+                                        <div class="valor">{stats_casa['media_amarelos_feitos']}</div>
+                                        <div class="label">
+                                            Amarelos Pró
+                                            <span class="tooltip">
+                                                <span class="tooltip-icon">i</span>
+                                                <span class="tooltip-text">Média de cartões amarelos RECEBIDOS pelo time nos últimos 5 jogos.</span>
+                                            </span>
+                                        </div>
+                                    </div>
+                                    <div class="media-item">
+                                        <div class="valor">{stats_casa['media_amarelos_sofridos']}</div>
+                                        <div class="label">
+                                            Amarelos Contra
+                                            <span class="tooltip">
+                                                <span class="tooltip-icon">i</span>
+                                                <span class="tooltip-text">Média de cartões amarelos do ADVERSÁRIO nos últimos 5 jogos.</span>
+                                            </span>
+                                        </div>
+                                    </div>
+                                </div>
+"""
         
-        .jogo-data .horario {{
-            font-size: 1.5em;
-            font-weight: bold;
-        }}
+        # Tabela de Faltas - Casa
+        html += """
+                                <div class="tabela-titulo">
+                                    📊 Faltas - Últimos 5 Jogos
+                                    <span class="tooltip">
+                                        <span class="tooltip-icon">i</span>
+                                        <span class="tooltip-text"><strong>Pró:</strong> Faltas cometidas pelo time.<br><strong>Contra:</strong> Faltas sofridas (cometidas pelo adversário).</span>
+                                    </span>
+                                </div>
+                                <table class="tabela-time">
+                                    <thead>
+                                        <tr>
+                                            <th>Adversário</th>
+                                            <th>Local</th>
+                                            <th>Pró</th>
+                                            <th>Contra</th>
+                                        </tr>
+                                    </thead>
+                                    <tbody>
+"""
+        for jogo in stats_casa['jogos'][:5]:
+            local = '🏠' if jogo['eh_casa'] else '✈️'
+            html += f"""
+                                        <tr>
+                                            <td>{jogo['adversario']}</td>
+                                            <td>{local}</td>
+                                            <td>{jogo['faltas_feitas_total']}</td>
+                                            <td>{jogo['faltas_sofridas_total']}</td>
+                                        </tr>
+"""
+        html += """
+                                    </tbody>
+                                </table>
+"""
         
-        .jogo-data .data {{
-            font-size: 1em;
-            opacity: 0.9;
-        }}
-        
-        .jogo-info-bar {{
-            background: #0f3460;
-            padding: 15px 30px;
-            display: flex;
-            gap: 25px;
-            flex-wrap: wrap;
-            font-size: 0.95em;
-            color: #c0c0c0;
-        }}
-        
-        .jogo-info-bar span {{
-            display: flex;
-            align-items: center;
-            gap: 8px;
-        }}
-        
-        .jogo-info-bar .info-label {{
-            color: #a0a0a0;
-            font-size: 0.85em;
-        }}
-        
-        .jogo-info-bar .info-value {{
-            color: white;
-            font-weight: 500;
-        }}
-        
-        .jogo-content {{
-            padding: 30px;
-            width: 100%;
-            box-sizing: border-box;
-            display: block;
-        }}
-        
-        /* Seções */
-        .secao {{
-            margin-bottom: 30px;
-            width: 100%;
-            box-sizing: border-box;
-            display: flex;
-            flex-direction: column;
-            align-items: stretch;
-        }}
-        
-        .secao-titulo {{
-            font-size: 1.4em;
-            color: #e94560;
-            margin-bottom: 20px;
-            padding-bottom: 10px;
-            border-bottom: 2px solid #e94560;
-            display: flex;
-            align-items: center;
-            gap: 10px;
-            width: 100%;
-            box-sizing: border-box;
-        }}
-        
-        /* Tooltips */
-        .tooltip {{
-            position: relative;
-            display: inline-flex;
-            align-items: center;
-            cursor: help;
-        }}
-        
-        .tooltip .tooltip-icon {{
-            display: inline-flex;
-            align-items: center;
-            justify-content: center;
-            width: 16px;
-            height: 16px;
-            background: #3498db;
-            color: white;
-            border-radius: 50%;
-            font-size: 10px;
-            font-weight: bold;
-            margin-left: 5px;
-            font-style: normal;
-        }}
+        # Tabela de Amarelos - Casa
+        html += """
+                                <div class="tabela-titulo">
+                                    📊 Amarelos - Últimos 5 Jogos
+                                    <span class="tooltip">
+                                        <span class="tooltip-icon">i</span>
+                                        <span class="tooltip-text"><strong>Pró:</strong> Cartões recebidos pelo time.<br><strong>Contra:</strong> Cartões recebidos pelo adversário.</span>
+                                    </span>
+                                </div>
+                                <table class="tabela-time">
+                                    <thead>
+                                        <tr>
+                                            <th>Adversário</th>
+                                            <th>Local</th>
+                                            <th>Pró</th>
+                                            <th>Contra</th>
+                                        </tr>
+                                    </thead>
+                                    <tbody>
+"""
+        for jogo in stats_casa['jogos'][:5]:
+            local = '🏠' if jogo['eh_casa'] else '✈️'
+            html += f"""
+                                        <tr>
+                                            <td>{jogo['adversario']}</td>
+                                            <td>{local}</td>
+                                            <td><span class="stat-amarelo">{jogo['amarelos_feitos_total']}</span></td>
+                                            <td><span class="stat-amarelo">{jogo['amarelos_sofridos_total']}</span></td>
+                                        </tr>
+"""
+        html += """
+                                    </tbody>
+                                </table>
+"""
+    
+    html += """
+                            </div>
+                        </div>
+"""
+    
+    # Time de Fora
+    html += f"""
+                        <div class="time-card">
+                            <div class="time-header">
+                                <div class="time-nome">✈️ {partida['time_fora']}</div>
+                                {f"<div class='time-posicao'>{colocacao_fora['posicao']}º</div>" if colocacao_fora else ""}
+                            </div>
+                            <div class="time-content">
+"""
+    
+    # Próximos jogos - Fora (MELHORADO v1.1)
+    if proximos_fora:
+        html += """
+                                <div class="proximos-jogos">
+                                    <h5>📅 Próximos 3 Jogos</h5>
+"""
+        for jogo in proximos_fora:
+            pos_adv = jogo.get('colocacao_adversario')
+            pos_adv_html = f"<span class='adversario-pos'>{pos_adv['posicao']}º</span>" if pos_adv else ""
+            campeonato_html = f"<span class='campeonato'>{jogo['campeonato']}</span>" if jogo.get('campeonato') else ""
+            fase_html = f"<span style='color: #a0a0a0;'>({jogo['fase']})</span>" if jogo.get('fase') else ""
+            
+            html += f"""
+                                    <div class="proximo-jogo">
+                                        <span class="local">{jogo['local']}</span>
+                                        <span class="adversario-info">
+                                            {jogo['adversario']}
+                                            {pos_adv_html}
+                                        </span>
+                                        <span style="color: #a0a0a0;">{jogo['data']}</span>
+                                        {campeonato_html}
+                                        {fase_html}
+                                    </div>
+"""
+        html += """
+                                </div>
+"""
+    elif 'proximos_fora' in secoes_puladas:
+        html += """
+                                <div class="proximos-jogos secao-pulada">
+                                    <h5>📅 Próximos 3 Jogos</h5>
+                                    ⏱️ Não consultados (prazo da execução esgotado)
+                                </div>
+"""
+    
+    # Médias do Time Fora com tooltips
+    if stats_fora:
+        html += f"""
+                                <div class="medias-time">
+                                    <div class="media-item">
+                                        <div class="valor">{stats_fora['media_faltas_feitas']}</div>
+                                        <div class="label">
+                                            Faltas Pró
+                                            <span class="tooltip">
+                                                <span class="tooltip-icon">i</span>
+                                                <span class="tooltip-text">Média de faltas COMETIDAS pelo time nos últimos 5 jogos.</span>
+                                            </span>
+                                        </div>
+                                    </div>
+                                    <div class="media-item">
+                                        <div class="valor">{stats_fora['media_faltas_sofridas']}</div>
+                                        <div class="label">
+                                            Faltas Contra
+                                            <span class="tooltip">
+                                                <span class="tooltip-icon">i</span>
+                                                <span class="tooltip-text">Média de faltas SOFRIDAS pelo time nos últimos 5 jogos (cometidas pelo adversário).</span>
+                                            </span>
+                                        </div>
+                                    </div>
+                                    <div class="media-item">
+                                        <div class="valor">{stats_fora['media_amarelos_feitos']}</div>
+                                        <div class="label">
+                                            Amarelos Pró
+                                            <span class="tooltip">
+                                                <span class="tooltip-icon">i</span>
+                                                <span class="tooltip-text">Média de cartões amarelos RECEBIDOS pelo time nos últimos 5 jogos.</span>
+                                            </span>
+                                        </div>
+                                    </div>
+                                    <div class="media-item">
+                                        <div class="valor">{stats_fora['media_amarelos_sofridos']}</div>
+                                        <div class="label">
+                                            Amarelos Contra
+                                            <span class="tooltip">
+                                                <span class="tooltip-icon">i</span>
+                                                <span class="tooltip-text">Média de cartões amarelos do ADVERSÁRIO nos últimos 5 jogos.</span>
+                                            </span>
+                                        </div>
+                                    </div>
+                                </div>
+"""
         
-        .tooltip .tooltip-text {{
-            visibility: hidden;
-            width: 280px;
-            background-color: #1a1a2e;
-            color: #e0e0e0;
-            text-align: left;
-            border-radius: 8px;
-            padding: 12px;
-            position: absolute;
-            z-index: 1000;
-            bottom: 125%;
-            left: 50%;
-            margin-left: -140px;
-            opacity: 0;
-            transition: opacity 0.3s;
-            font-size: 0.85em;
-            line-height: 1.5;
-            border: 1px solid #3498db;
-            box-shadow: 0 5px 15px rgba(0,0,0,0.4);
-        }}
+        # Tabela de Faltas - Fora
+        html += """
+                                <div class="tabela-titulo">
+                                    📊 Faltas - Últimos 5 Jogos
+                                    <span class="tooltip">
+                                        <span class="tooltip-icon">i</span>
+                                        <span class="tooltip-text"><strong>Pró:</strong> Faltas cometidas pelo time.<br><strong>Contra:</strong> Faltas sofridas (cometidas pelo adversário).</span>
+                                    </span>
+                                </div>
+                                <table class="tabela-time">
+                                    <thead>
+                                        <tr>
+                                            <th>Adversário</th>
+                                            <th>Local</th>
+                                            <th>Pró</th>
+                                            <th>Contra</th>
+                                        </tr>
+                                    </thead>
+                                    <tbody>
+"""
+        for jogo in stats_fora['jogos'][:5]:
+            local = '🏠' if jogo['eh_casa'] else '✈️'
+            html += f"""
+                                        <tr>
+                                            <td>{jogo['adversario']}</td>
+                                            <td>{local}</td>
+                                            <td>{jogo['faltas_feitas_total']}</td>
+                                            <td>{jogo['faltas_sofridas_total']}</td>
+                                        </tr>
+"""
+        html += """
+                                    </tbody>
+                                </table>
+"""
         
-        .tooltip .tooltip-text::after {{
-            content: "";
-            position: absolute;
-            top: 100%;
-            left: 50%;
-            margin-left: -5px;
-            border-width: 5px;
-            border-style: solid;
-            border-color: #3498db transparent transparent transparent;
+        # Tabela de Amarelos - Fora
+        html += """
+                                <div class="tabela-titulo">
+                                    📊 Amarelos - Últimos 5 Jogos
+                                    <span class="tooltip">
+                                        <span class="tooltip-icon">i</span>
+                                        <span class="tooltip-text"><strong>Pró:</strong> Cartões recebidos pelo time.<br><strong>Contra:</strong> Cartões recebidos pelo adversário.</span>
+                                    </span>
+                                </div>
+                                <table class="tabela-time">
+                                    <thead>
+                                        <tr>
+                                            <th>Adversário</th>
+                                            <th>Local</th>
+                                            <th>Pró</th>
+                                            <th>Contra</th>
+                                        </tr>
+                                    </thead>
+                                    <tbody>
+"""
+        for jogo in stats_fora['jogos'][:5]:
+            local = '🏠' if jogo['eh_casa'] else '✈️'
+            html += f"""
+                                        <tr>
+                                            <td>{jogo['adversario']}</td>
+                                            <td>{local}</td>
+                                            <td><span class="stat-amarelo">{jogo['amarelos_feitos_total']}</span></td>
+                                            <td><span class="stat-amarelo">{jogo['amarelos_sofridos_total']}</span></td>
+                                        </tr>
+"""
+        html += """
+                                    </tbody>
+                                </table>
+"""
+    
+    # Fecha a seção dos Times
+    html += """
+                            </div>
+                        </div>
+                    </div>
+                </div>
+            </div>
+"""
+    
+    # ====== NOVA SEÇÃO: Gráfico Comparativo de Amarelos ======
+    # Coleta dados para o gráfico
+    grafico_id = f"grafico_{partida['id']}"
+    
+    # Dados do árbitro - verifica se tem 5 jogos na liga
+    amarelos_arbitro = []
+    arbitro_fonte = "geral"  # padrão
+    
+    if metricas:
+        amarelos_liga = metricas.get('amarelos_5j_liga', [])
+        amarelos_geral = metricas.get('amarelos_5j_geral', [])
+        
+        # Se tem 5 jogos na liga, usa dados da liga
+        if len(amarelos_liga) >= 5:
+            amarelos_arbitro = amarelos_liga[:5]
+            arbitro_fonte = "na liga"
+        else:
+            # Caso contrário, usa dados gerais
+            amarelos_arbitro = amarelos_geral[:5] if amarelos_geral else []
+            arbitro_fonte = "geral"
+    
+    # Preenche com 0 se tiver menos de 5 jogos
+    while len(amarelos_arbitro) < 5:
+        amarelos_arbitro.append(0)
+    # Inverte para mostrar do mais antigo ao mais recente
+    amarelos_arbitro = amarelos_arbitro[::-1]
+    
+    # Dados do time da casa (últimos 5 jogos)
+    amarelos_casa = []
+    if stats_casa and stats_casa.get('jogos'):
+        for jogo in stats_casa['jogos'][:5]:
+            amarelos_casa.append(jogo.get('amarelos_feitos_total', 0))
+    while len(amarelos_casa) < 5:
+        amarelos_casa.append(0)
+    amarelos_casa = amarelos_casa[::-1]
+    
+    # Dados do time de fora (últimos 5 jogos)
+    amarelos_fora = []
+    if stats_fora and stats_fora.get('jogos'):
+        for jogo in stats_fora['jogos'][:5]:
+            amarelos_fora.append(jogo.get('amarelos_feitos_total', 0))
+    while len(amarelos_fora) < 5:
+        amarelos_fora.append(0)
+    amarelos_fora = amarelos_fora[::-1]
+    
+    html += f"""
+                <!-- Seção Comparativo de Amarelos -->
+                <div class="secao">
+                    <div class="secao-titulo">📊 Comparativo de Amarelos - Últimos 5 Jogos</div>
+                    <div class="grafico-comparativo">
+                        <div class="grafico-container">
+                            <canvas id="{grafico_id}"></canvas>
+                        </div>
+                        <div class="grafico-legenda">
+                            <div class="legenda-item">
+                                <div class="legenda-cor" style="background: #e94560;"></div>
+                                <span>🗣️ Árbitro <small style="color: #a0a0a0;">({arbitro_fonte})</small></span>
+                            </div>
+                            <div class="legenda-item">
+                                <div class="legenda-cor" style="background: #3498db;"></div>
+                                <span>🏠 {partida['time_casa']}</span>
+                            </div>
+                            <div class="legenda-item">
+                                <div class="legenda-cor" style="background: #2ecc71;"></div>
+                                <span>✈️ {partida['time_fora']}</span>
+                            </div>
+                        </div>
+                    </div>
+                    <script>
+                    (function() {{
+                        const ctx = document.getElementById('{grafico_id}').getContext('2d');
+                        new Chart(ctx, {{
+                            type: 'line',
+                            data: {{
+                                labels: ['Jogo 1', 'Jogo 2', 'Jogo 3', 'Jogo 4', 'Jogo 5'],
+                                datasets: [
+                                    {{
+                                        label: 'Árbitro',
+                                        data: {amarelos_arbitro},
+                                        borderColor: '#e94560',
+                                        backgroundColor: 'rgba(233, 69, 96, 0.1)',
+                                        borderWidth: 3,
+                                        pointRadius: 5,
+                                        pointBackgroundColor: '#e94560',
+                                        tension: 0.3,
+                                        fill: false
+                                    }},
+                                    {{
+                                        label: 'Time Casa',
+                                        data: {amarelos_casa},
+                                        borderColor: '#3498db',
+                                        backgroundColor: 'rgba(52, 152, 219, 0.1)',
+                                        borderWidth: 3,
+                                        pointRadius: 5,
+                                        pointBackgroundColor: '#3498db',
+                                        tension: 0.3,
+                                        fill: false
+                                    }},
+                                    {{
+                                        label: 'Time Fora',
+                                        data: {amarelos_fora},
+                                        borderColor: '#2ecc71',
+                                        backgroundColor: 'rgba(46, 204, 113, 0.1)',
+                                        borderWidth: 3,
+                                        pointRadius: 5,
+                                        pointBackgroundColor: '#2ecc71',
+                                        tension: 0.3,
+                                        fill: false
+                                    }}
+                                ]
+                            }},
+                            options: {{
+                                responsive: true,
+                                maintainAspectRatio: false,
+                                plugins: {{
+                                    legend: {{
+                                        display: false
+                                    }},
+                                    tooltip: {{
+                                        backgroundColor: '#1a1a2e',
+                                        titleColor: '#e94560',
+                                        bodyColor: '#e0e0e0',
+                                        borderColor: '#0f3460',
+                                        borderWidth: 1,
+                                        padding: 10,
+                                        displayColors: true
+                                    }}
+                                }},
+                                scales: {{
+                                    y: {{
+                                        beginAtZero: true,
+                                        max: 10,
+                                        ticks: {{
+                                            color: '#a0a0a0',
+                                            stepSize: 2
+                                        }},
+                                        grid: {{
+                                            color: 'rgba(255, 255, 255, 0.1)'
+                                        }}
+                                    }},
+                                    x: {{
+                                        ticks: {{
+                                            color: '#a0a0a0'
+                                        }},
+                                        grid: {{
+                                            color: 'rgba(255, 255, 255, 0.1)'
+                                        }}
+                                    }}
+                                }}
+                            }}
+                        }});
+                    }})();
+                    </script>
+"""
+    
+    # Fecha seção do gráfico, jogo-content e jogo-card
+    html += """
+                </div>
+            </div>
+        </div>
+"""
+    
+    html += f"""        <!-- /card:{analise['partida']['id']} -->
+"""
+    return html
+
+def gerar_html_unificado(analises, timestamp, data_jogos):
+    """Gera o relatório HTML unificado"""
+    
+    html = f"""<!DOCTYPE html>
+<html lang="pt-BR">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>RefStats - Jogos do Dia {data_jogos}</title>
+    <link rel="icon" href="./assets/img/favicon.ico">
+    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
         }}
         
-        .tooltip:hover .tooltip-text {{
-            visibility: visible;
-            opacity: 1;
+        body {{
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
+            padding: 20px;
+            padding-top: 100px;
+            min-height: 100vh;
+            color: #e0e0e0;
         }}
         
-        /* Árbitro */
-        .arbitro-card {{
-            background: #0f3460;
-            padding: 25px;
-            border-radius: 12px;
-            margin-bottom: 20px;
-            width: 100%;
-            box-sizing: border-box;
+        /* ========================================
+           NAVBAR (igual ao Home)
+           ======================================== */
+        .navbar {{
+            position: fixed;
+            top: 0;
+            left: 0;
+            right: 0;
+            z-index: 9997;
+            background-image:
+                linear-gradient(
+                    rgba(10, 15, 30, 0.85),
+                    rgba(10, 15, 30, 0.85)
+                ),
+                url("./assets/img/FundoMuroFundo.png");
+            background-size: cover;
+            background-position: center;
+            background-repeat: no-repeat;
+            padding: 15px 50px;
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            box-shadow: 0 4px 20px rgba(0, 0, 0, 0.6);
+            border-bottom: 2px solid #e94560;
+            backdrop-filter: blur(2px);
         }}
         
-        .arbitro-nome {{
-            font-size: 1.5em;
-            color: white;
-            font-weight: bold;
-            margin-bottom: 5px;
+        .navbar-brand {{
+            display: flex;
+            align-items: center;
+            gap: 12px;
+            text-decoration: none;
         }}
         
-        .arbitro-pais {{
-            color: #a0a0a0;
-            font-size: 1.1em;
-            margin-bottom: 15px;
+        .logo-img {{
+            height: 48px;
+            width: auto;
+            display: block;
         }}
         
-        .badge {{
-            display: inline-block;
-            padding: 4px 12px;
-            border-radius: 20px;
-            font-size: 0.85em;
-            font-weight: 600;
-            margin-left: 10px;
+        .navbar-brand .brand-text {{
+            font-size: 1.8em;
+            font-weight: bold;
+            color: #e94560;
+        }}
+        
+        .navbar-brand .brand-text span {{
+            color: #3498db;
+        }}
+        
+        .navbar-menu {{
+            display: flex;
+            gap: 10px;
+        }}
+        
+        .navbar-menu a {{
+            color: #e0e0e0;
+            text-decoration: none;
+            padding: 10px 20px;
+            border-radius: 25px;
+            transition: all 0.3s;
+            font-weight: 500;
+            border: 1px solid transparent;
+        }}
+        
+        .navbar-menu a:hover {{
+            background: rgba(233, 69, 96, 0.2);
+            border-color: #e94560;
+            color: #e94560;
+        }}
+        
+        .navbar-menu a.active {{
+            background: linear-gradient(135deg, #e94560 0%, #0f3460 100%);
+            color: white;
+        }}
+        
+        .menu-toggle {{
+            display: none;
+            background: none;
+            border: none;
+            color: #e0e0e0;
+            font-size: 1.5em;
+            cursor: pointer;
+        }}
+        
+        .container {{
+            max-width: 1400px;
+            margin: 0 auto;
+            width: 100%;
+        }}
+        
+        .header {{
+            background: linear-gradient(135deg, #0f3460 0%, #1a1a2e 100%);
+            padding: 30px;
+            border-radius: 15px;
+            box-shadow: 0 10px 30px rgba(0,0,0,0.5);
+            margin-bottom: 30px;
+            text-align: center;
+            border: 1px solid #e94560;
+        }}
+        
+        .header h1 {{
+            color: #e94560;
+            font-size: 2.5em;
+            margin-bottom: 10px;
+        }}
+        
+        .header p {{
+            color: #a0a0a0;
+            font-size: 1.1em;
+        }}
+        
+        .jogo-card {{
+            background: linear-gradient(135deg, #16213e 0%, #1a1a2e 100%);
+            padding: 0;
+            border-radius: 15px;
+            box-shadow: 0 10px 30px rgba(0,0,0,0.5);
+            margin-bottom: 30px;
+            border: 1px solid #0f3460;
+            overflow: hidden;
+            width: 100%;
+            box-sizing: border-box;
+        }}
+        
+        .jogo-header {{
+            background: linear-gradient(135deg, #e94560 0%, #0f3460 100%);
+            padding: 25px 30px;
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+        }}
+        
+        .jogo-titulo {{
+            font-size: 1.8em;
+            color: white;
+            font-weight: bold;
+        }}
+        
+        .jogo-data {{
+            text-align: right;
+            color: white;
+        }}
+        
+        .jogo-data .horario {{
+            font-size: 1.5em;
+            font-weight: bold;
+        }}
+        
+        .jogo-data .data {{
+            font-size: 1em;
+            opacity: 0.9;
+        }}
+        
+        .jogo-info-bar {{
+            background: #0f3460;
+            padding: 15px 30px;
+            display: flex;
+            gap: 25px;
+            flex-wrap: wrap;
+            font-size: 0.95em;
+            color: #c0c0c0;
+        }}
+        
+        .jogo-info-bar span {{
+            display: flex;
+            align-items: center;
+            gap: 8px;
+        }}
+        
+        .jogo-info-bar .info-label {{
+            color: #a0a0a0;
+            font-size: 0.85em;
+        }}
+        
+        .jogo-info-bar .info-value {{
+            color: white;
+            font-weight: 500;
+        }}
+        
+        .jogo-content {{
+            padding: 30px;
+            width: 100%;
+            box-sizing: border-box;
+            display: block;
+        }}
+        
+        /* Seções */
+        .secao {{
+            margin-bottom: 30px;
+            width: 100%;
+            box-sizing: border-box;
+            display: flex;
+            flex-direction: column;
+            align-items: stretch;
+        }}
+        
+        .secao-titulo {{
+            font-size: 1.4em;
+            color: #e94560;
+            margin-bottom: 20px;
+            padding-bottom: 10px;
+            border-bottom: 2px solid #e94560;
+            display: flex;
+            align-items: center;
+            gap: 10px;
+            width: 100%;
+            box-sizing: border-box;
+        }}
+        
+        /* Tooltips */
+        .tooltip {{
+            position: relative;
+            display: inline-flex;
+            align-items: center;
+            cursor: help;
+        }}
+        
+        .tooltip .tooltip-icon {{
+            display: inline-flex;
+            align-items: center;
+            justify-content: center;
+            width: 16px;
+            height: 16px;
+            background: #3498db;
+            color: white;
+            border-radius: 50%;
+            font-size: 10px;
+            font-weight: bold;
+            margin-left: 5px;
+            font-style: normal;
+        }}
+        
+        .tooltip .tooltip-text {{
+            visibility: hidden;
+            width: 280px;
+            background-color: #1a1a2e;
+            color: #e0e0e0;
+            text-align: left;
+            border-radius: 8px;
+            padding: 12px;
+            position: absolute;
+            z-index: 1000;
+            bottom: 125%;
+            left: 50%;
+            margin-left: -140px;
+            opacity: 0;
+            transition: opacity 0.3s;
+            font-size: 0.85em;
+            line-height: 1.5;
+            border: 1px solid #3498db;
+            box-shadow: 0 5px 15px rgba(0,0,0,0.4);
+        }}
+        
+        .tooltip .tooltip-text::after {{
+            content: "";
+            position: absolute;
+            top: 100%;
+            left: 50%;
+            margin-left: -5px;
+            border-width: 5px;
+            border-style: solid;
+            border-color: #3498db transparent transparent transparent;
+        }}
+        
+        .tooltip:hover .tooltip-text {{
+            visibility: visible;
+            opacity: 1;
+        }}
+        
+        /* Árbitro */
+        .arbitro-card {{
+            background: #0f3460;
+            padding: 25px;
+            border-radius: 12px;
+            margin-bottom: 20px;
+            width: 100%;
+            box-sizing: border-box;
+        }}
+        
+        .arbitro-nome {{
+            font-size: 1.5em;
+            color: white;
+            font-weight: bold;
+            margin-bottom: 5px;
+        }}
+        
+        .arbitro-pais {{
+            color: #a0a0a0;
+            font-size: 1.1em;
+            margin-bottom: 15px;
+        }}
+        
+        .badge {{
+            display: inline-block;
+            padding: 4px 12px;
+            border-radius: 20px;
+            font-size: 0.85em;
+            font-weight: 600;
+            margin-left: 10px;
         }}
         
         .badge-liga {{
@@ -1748,7 +2504,12 @@ def gerar_html_unificado(analises, timestamp, data_jogos):
             box-sizing: border-box;
         }}
         
-        /* Container para scroll horizontal em tabelas (mobile) */
+        .secao-pulada {{
+            color: #f0ad4e;
+            font-style: italic;
+        }}
+        
+        /* Container para scroll horizontal em tabelas (mobile) */
         .tabela-scroll {{
             width: 100%;
             overflow-x: auto;
@@ -2165,1375 +2926,422 @@ def gerar_html_unificado(analises, timestamp, data_jogos):
         }}
         .social-links a:hover {{
             background: #e94560;
-            color: white;
-            transform: scale(1.1);
-            
-        }}
-
-        
-        /* ========================================
-           BARRA DE PESQUISA ESTILO CTRL+F v1.4
-           ======================================== */
-        .search-bar {{
-            position: fixed;
-            top: 0;
-            left: 0;
-            right: 0;
-            z-index: 9999;
-            background: linear-gradient(135deg, #1a1a2e 0%, #0f3460 100%);
-            padding: 12px 20px;
-            display: flex;
-            justify-content: center;
-            align-items: center;
-            gap: 12px;
-            box-shadow: 0 4px 20px rgba(0, 0, 0, 0.5);
-            border-bottom: 2px solid #e94560;
-            transform: translateY(-100%);
-            transition: transform 0.3s ease;
-            pointer-events: none;
-        }}
-        
-        .search-bar.active {{
-            transform: translateY(0);
-            pointer-events: auto;
-        }}
-        
-        body.search-active {{
-            padding-top: 70px;
-        }}
-        
-        .search-container {{
-            display: flex;
-            align-items: center;
-            gap: 8px;
-            background: #16213e;
-            border-radius: 25px;
-            padding: 6px 15px;
-            border: 1px solid #3498db;
-            max-width: 400px;
-            flex: 1;
-        }}
-        
-        .search-container:focus-within {{
-            border-color: #e94560;
-            box-shadow: 0 0 10px rgba(233, 69, 96, 0.3);
-        }}
-        
-        .search-icon {{
-            color: #a0a0a0;
-            font-size: 16px;
-        }}
-        
-        .search-input {{
-            flex: 1;
-            background: transparent;
-            border: none;
-            outline: none;
-            color: white;
-            font-size: 14px;
-            padding: 8px 0;
-        }}
-        
-        .search-input::placeholder {{
-            color: #606060;
-        }}
-        
-        .search-counter {{
-            color: #a0a0a0;
-            font-size: 13px;
-            min-width: 60px;
-            text-align: center;
-            white-space: nowrap;
-        }}
-        
-        .search-nav {{
-            display: flex;
-            gap: 4px;
-        }}
-        
-        .search-nav button {{
-            background: #0f3460;
-            border: 1px solid #3498db;
-            color: white;
-            width: 32px;
-            height: 32px;
-            border-radius: 50%;
-            cursor: pointer;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            transition: all 0.2s;
-            font-size: 14px;
-        }}
-        
-        .search-nav button:hover:not(:disabled) {{
-            background: #e94560;
-            border-color: #e94560;
-            transform: scale(1.1);
-        }}
-        
-        .search-nav button:disabled {{
-            opacity: 0.3;
-            cursor: not-allowed;
-        }}
-        
-        .search-close {{
-            background: transparent;
-            border: none;
-            color: #a0a0a0;
-            cursor: pointer;
-            font-size: 20px;
-            padding: 5px;
-            transition: color 0.2s;
-            margin-left: 5px;
-        }}
-        
-        .search-close:hover {{
-            color: #e94560;
-        }}
-        
-        .search-toggle {{
-            position: fixed;
-            top: 20px;
-            right: 20px;
-            z-index: 9998;
-            background: linear-gradient(135deg, #e94560 0%, #0f3460 100%);
-            border: none;
-            color: white;
-            width: 50px;
-            height: 50px;
-            border-radius: 50%;
-            cursor: pointer;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            box-shadow: 0 4px 15px rgba(233, 69, 96, 0.4);
-            transition: all 0.3s;
-            font-size: 20px;
-        }}
-        
-        .search-toggle:hover {{
-            transform: scale(1.1);
-            box-shadow: 0 6px 25px rgba(233, 69, 96, 0.6);
-        }}
-        
-        .search-toggle.hidden {{
-            opacity: 0;
-            pointer-events: none;
-        }}
-        
-        /* Highlight dos resultados */
-        .search-highlight {{
-            background: linear-gradient(135deg, #f6e05e 0%, #ecc94b 100%);
-            color: #1a1a2e;
-            padding: 2px 4px;
-            border-radius: 3px;
-            font-weight: bold;
-            box-shadow: 0 2px 8px rgba(246, 224, 94, 0.4);
-        }}
-        
-        .search-highlight.current {{
-            background: linear-gradient(135deg, #e94560 0%, #ff6b6b 100%);
-            color: white;
-            box-shadow: 0 2px 12px rgba(233, 69, 96, 0.6);
-            animation: pulse 1s infinite;
-        }}
-        
-        @keyframes pulse {{
-            0%, 100% {{ box-shadow: 0 2px 12px rgba(233, 69, 96, 0.6); }}
-            50% {{ box-shadow: 0 2px 20px rgba(233, 69, 96, 0.9); }}
-        }}
-        
-        /* Filtros de Perfil do Árbitro */
-        .filter-container {{
-            display: flex;
-            align-items: center;
-            gap: 6px;
-            margin-left: 10px;
-            padding-left: 10px;
-            border-left: 1px solid #3498db;
-        }}
-        
-        .filter-label {{
-            color: #a0a0a0;
-            font-size: 12px;
-            margin-right: 4px;
-        }}
-        
-        .filter-btn {{
-            padding: 4px 10px;
-            border: 1px solid #3498db;
-            background: transparent;
-            color: #a0a0a0;
-            border-radius: 15px;
-            cursor: pointer;
-            font-size: 11px;
-            transition: all 0.2s;
-            white-space: nowrap;
-        }}
-        
-        .filter-btn:hover {{
-            background: rgba(52, 152, 219, 0.2);
-            color: #e0e0e0;
-        }}
-        
-        .filter-btn.active {{
-            background: #3498db;
-            color: white;
-            border-color: #3498db;
-        }}
-        
-        .filter-btn.rigoroso.active {{
-            background: #e94560;
-            border-color: #e94560;
-        }}
-        
-        .filter-btn.medio.active {{
-            background: #f6e05e;
-            border-color: #f6e05e;
-            color: #1a1a2e;
-        }}
-        
-        .filter-btn.permissivo.active {{
-            background: #2ecc71;
-            border-color: #2ecc71;
-        }}
-        
-        .filter-clear {{
-            padding: 4px 8px;
-            border: none;
-            background: transparent;
-            color: #e94560;
-            cursor: pointer;
-            font-size: 14px;
-            transition: all 0.2s;
-        }}
-        
-        .filter-clear:hover {{
-            color: #ff6b6b;
-            transform: scale(1.1);
-        }}
-        
-        .filter-clear.hidden {{
-            display: none;
-        }}
-        
-        /* Card oculto pelo filtro */
-        .jogo-card.filtered-out {{
-            display: none;
-        }}
-        
-        /* Contador de filtro */
-        .filter-counter {{
-            color: #a0a0a0;
-            font-size: 11px;
-            margin-left: 6px;
-        }}
-        
-        /* Responsivo - filtros em tela pequena */
-        @media (max-width: 768px) {{
-            .navbar {{
-                padding: 15px 20px;
-            }}
-            
-            .navbar-menu {{
-                position: fixed;
-                top: 70px;
-                left: 0;
-                right: 0;
-                background: linear-gradient(135deg, #0f3460 0%, #1a1a2e 100%);
-                flex-direction: column;
-                padding: 20px;
-                gap: 10px;
-                transform: translateY(-150%);
-                transition: transform 0.3s;
-                border-bottom: 2px solid #e94560;
-                z-index: 9996;
-            }}
-            
-            .navbar-menu.active {{
-                transform: translateY(0);
-            }}
-            
-            .menu-toggle {{
-                display: block;
-            }}
-            
-            .logo-img {{
-                height: 36px;
-            }}
-            
-            body {{
-                padding-top: 90px;
-            }}
-            
-            /* Lupa no canto inferior direito no mobile */
-            .search-toggle {{
-                top: auto;
-                bottom: 20px;
-                right: 20px;
-            }}
-            
-            .search-bar {{
-                flex-wrap: wrap;
-                padding: 10px;
-                gap: 8px;
-            }}
-            
-            .filter-container {{
-                width: 100%;
-                justify-content: center;
-                border-left: none;
-                padding-left: 0;
-                margin-left: 0;
-                padding-top: 8px;
-                border-top: 1px solid #3498db;
-            }}
-        }}
-        
-        /* Tooltip da barra de pesquisa */
-        .search-hint {{
-            position: fixed;
-            bottom: 20px;
-            right: 20px;
-            background: #1a1a2e;
-            color: #a0a0a0;
-            padding: 10px 15px;
-            border-radius: 8px;
-            font-size: 12px;
-            border: 1px solid #0f3460;
-            opacity: 0;
-            transition: opacity 0.3s;
-            pointer-events: none;
-        }}
-        
-        .search-hint.visible {{
-            opacity: 1;
-        }}
-        
-        .search-hint kbd {{
-            background: #0f3460;
-            padding: 2px 6px;
-            border-radius: 4px;
-            font-family: monospace;
-            color: #e94560;
-        }}
-    </style>
-    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-</head>
-<body>
-    <!-- Navbar (igual ao Home) -->
-    <nav class="navbar">
-        <a href="index.html" class="navbar-brand">
-            <img src="./assets/img/LogoINICIO.png" alt="RefStats" class="logo-img">
-        </a>
-        
-        <button class="menu-toggle" onclick="document.getElementById('navMenu').classList.toggle('active')" aria-label="Menu">
-            ☰
-        </button>
-        
-        <div class="navbar-menu" id="navMenu">
-            <a href="index.html">INÍCIO</a>
-            <a href="#" class="active">JOGOS DO DIA</a>
-            <a href="refstats_historico.html">HISTÓRICO</a>
-            <a href="refstats_contato.html">CONTATO</a>
-        </div>
-    </nav>
-    
-    <!-- Barra de Pesquisa v1.4 -->
-    <div class="search-bar" id="searchBar">
-        <div class="search-container">
-            <span class="search-icon">🔍</span>
-            <input type="text" class="search-input" id="searchInput" placeholder="Pesquisar na página..." autocomplete="off">
-            <span class="search-counter" id="searchCounter"></span>
-        </div>
-        <div class="search-nav">
-            <button id="searchPrev" title="Anterior (↑)" disabled>▲</button>
-            <button id="searchNext" title="Próximo (↓)" disabled>▼</button>
-        </div>
-        <div class="filter-container">
-            <span class="filter-label">Perfil:</span>
-            <button class="filter-btn rigoroso" data-filter="Rigoroso" title="Mostrar árbitros rigorosos">🔴 Rigoroso</button>
-            <button class="filter-btn medio" data-filter="Médio" title="Mostrar árbitros médios">🟡 Médio</button>
-            <button class="filter-btn permissivo" data-filter="Permissivo" title="Mostrar árbitros permissivos">🟢 Permissivo</button>
-            <button class="filter-clear hidden" id="filterClear" title="Limpar filtro">✕</button>
-            <span class="filter-counter" id="filterCounter"></span>
-        </div>
-        <button class="search-close" id="searchClose" title="Fechar (Esc)">✕</button>
-    </div>
-    
-    <!-- Botão flutuante para abrir pesquisa -->
-    <button class="search-toggle" id="searchToggle" title="Pesquisar (Ctrl+F)">🔍</button>
-    
-    <!-- Dica de atalho -->
-    <div class="search-hint" id="searchHint">
-        Pressione <kbd>Ctrl</kbd> + <kbd>F</kbd> para pesquisar
-    </div>
-    
-    <div class="container">
-        <div class="header">
-            <h1>⚽ Jogos do Dia</h1>
-            <p>📅 {data_jogos} • {len(analises)} partida(s) analisada(s)</p>
-        </div>
-"""
-    
-    # Gera card para cada jogo
-    for analise in analises:
-        partida = analise['partida']
-        arbitro = analise.get('arbitro')
-        metricas = analise.get('metricas')
-        noticias_arbitro = analise.get('noticias_arbitro', [])
-        historico = analise.get('historico', [])
-        stats_casa = analise.get('stats_casa')
-        stats_fora = analise.get('stats_fora')
-        colocacao_casa = analise.get('colocacao_casa')
-        colocacao_fora = analise.get('colocacao_fora')
-        proximos_casa = analise.get('proximos_casa', [])
-        proximos_fora = analise.get('proximos_fora', [])
-        estadio_info = analise.get('estadio_info')
-        
-        # Posições para o título
-        pos_casa = f" ({colocacao_casa['posicao']}º)" if colocacao_casa else ""
-        pos_fora = f" ({colocacao_fora['posicao']}º)" if colocacao_fora else ""
-        
-        # Info do estádio
-        estadio_nome = estadio_info.get('nome', 'Não informado') if estadio_info else 'Não informado'
-        estadio_cidade = estadio_info.get('cidade', '') if estadio_info else ''
-        estadio_pais = estadio_info.get('pais', '') if estadio_info else ''
-        
-        # Perfil do árbitro para filtro
-        perfil_arbitro = metricas.get('perfil', 'N/A') if metricas else 'N/A'
-        
-        html += f"""
-        <div class="jogo-card" data-perfil="{perfil_arbitro}">
-            <div class="jogo-header">
-                <div class="jogo-titulo">{partida['time_casa']}{pos_casa} vs {partida['time_fora']}{pos_fora}</div>
-                <div class="jogo-data">
-                    <div class="horario">{partida['horario']}</div>
-                    <div class="data">{partida['data']}</div>
-                </div>
-            </div>
-            
-            <div class="jogo-info-bar">
-                <span>
-                    <span class="info-label">🏆 Competição:</span>
-                    <span class="info-value">{partida['liga_nome']}</span>
-                </span>
-                <span>
-                    <span class="info-label">🏟️ Estádio:</span>
-                    <span class="info-value">{estadio_nome}</span>
-                </span>
-                <span>
-                    <span class="info-label">📍 Local:</span>
-                    <span class="info-value">{estadio_cidade}{', ' + estadio_pais if estadio_pais else ''}</span>
-                </span>
-                {f'<span><span class="info-label">📋 Fase:</span><span class="info-value">{partida["fase"]}</span></span>' if partida['fase'] else ""}
-            </div>
-            
-            <div class="jogo-content">
-"""
-        
-        # Seção do Árbitro
-        html += """
-                <div class="secao">
-                    <div class="secao-titulo">⚖️ Árbitro</div>
-"""
-        
-        if arbitro:
-            # Determina tipo de badge (Liga ou Copa)
-            liga_nome_lower = partida['liga_nome'].lower()
-            badge_tipo = 'badge-copa' if 'copa' in liga_nome_lower or 'cup' in liga_nome_lower else 'badge-liga'
-            badge_texto = 'Copa' if 'copa' in liga_nome_lower or 'cup' in liga_nome_lower else 'Liga'
-            
-            html += f"""
-                    <div class="arbitro-card">
-                        <div class="arbitro-nome">
-                            {arbitro['nome']}
-                            <span class="badge {badge_tipo}">{badge_texto}</span>
-                        </div>
-                        <div class="arbitro-pais">🌍 {arbitro['pais']}</div>
-"""
-            
-            if metricas:
-                # Médias do Árbitro com tooltips
-                html += """
-                        <div class="metricas-grid">
-"""
-                html += f"""
-                            <div class="metrica-card">
-                                <div class="valor">{metricas['media_amarelos_10j']}</div>
-                                <div class="label">
-                                    📊 Média Amarelos (10j)
-                                    <span class="tooltip">
-                                        <span class="tooltip-icon">i</span>
-                                        <span class="tooltip-text">Média de cartões amarelos por jogo nos últimos 10 jogos apitados pelo árbitro (soma dos dois times).</span>
-                                    </span>
-                                </div>
-                            </div>
-                            <div class="metrica-card">
-                                <div class="valor">{metricas['media_amarelos_5j']}</div>
-                                <div class="label">
-                                    📊 Média Amarelos (5j)
-                                    <span class="tooltip">
-                                        <span class="tooltip-icon">i</span>
-                                        <span class="tooltip-text">Média de cartões amarelos por jogo nos últimos 5 jogos apitados. Amostra menor, mas mais recente.</span>
-                                    </span>
-                                </div>
-                            </div>
-                            <div class="metrica-card">
-                                <div class="valor">{metricas['media_amarelos_1t']}</div>
-                                <div class="label">
-                                    📊 Média Amarelos 1T
-                                    <span class="tooltip">
-                                        <span class="tooltip-icon">i</span>
-                                        <span class="tooltip-text">Média de cartões amarelos aplicados apenas no 1º tempo (primeiros 45 minutos).</span>
-                                    </span>
-                                </div>
-                            </div>
-                            <div class="metrica-card">
-                                <div class="valor">{metricas['media_amarelos_2t']}</div>
-                                <div class="label">
-                                    📊 Média Amarelos 2T
-                                    <span class="tooltip">
-                                        <span class="tooltip-icon">i</span>
-                                        <span class="tooltip-text">Média de cartões amarelos aplicados apenas no 2º tempo (após os 45 minutos).</span>
-                                    </span>
-                                </div>
-                            </div>
-                            <div class="metrica-card">
-                                <div class="valor">{metricas['media_faltas_10j']}</div>
-                                <div class="label">
-                                    📊 Média Faltas (10j)
-                                    <span class="tooltip">
-                                        <span class="tooltip-icon">i</span>
-                                        <span class="tooltip-text">Média total de faltas por jogo nos últimos 10 jogos (soma dos dois times).</span>
-                                    </span>
-                                </div>
-                            </div>
-                            <div class="metrica-card">
-                                <div class="valor">{metricas['media_faltas_5j']}</div>
-                                <div class="label">
-                                    📊 Média Faltas (5j)
-                                    <span class="tooltip">
-                                        <span class="tooltip-icon">i</span>
-                                        <span class="tooltip-text">Média de faltas nos últimos 5 jogos. Amostra mais recente.</span>
-                                    </span>
-                                </div>
-                            </div>
-                            <div class="metrica-card">
-                                <div class="valor">{metricas['media_faltas_1t']}</div>
-                                <div class="label">
-                                    📊 Média Faltas 1T
-                                    <span class="tooltip">
-                                        <span class="tooltip-icon">i</span>
-                                        <span class="tooltip-text">Média de faltas cometidas no 1º tempo.</span>
-                                    </span>
-                                </div>
-                            </div>
-                            <div class="metrica-card">
-                                <div class="valor">{metricas['media_faltas_2t']}</div>
-                                <div class="label">
-                                    📊 Média Faltas 2T
-                                    <span class="tooltip">
-                                        <span class="tooltip-icon">i</span>
-                                        <span class="tooltip-text">Média de faltas cometidas no 2º tempo.</span>
-                                    </span>
-                                </div>
-                            </div>
-                            <div class="metrica-card">
-                                <div class="valor">{metricas['media_vermelhos']}</div>
-                                <div class="label">
-                                    📊 Média Vermelhos
-                                    <span class="tooltip">
-                                        <span class="tooltip-icon">i</span>
-                                        <span class="tooltip-text">Média de cartões vermelhos por jogo nos últimos 10 jogos.</span>
-                                    </span>
-                                </div>
-                            </div>
-                        </div>
-"""
-                
-                # Perfil do Árbitro - MELHORADO
-                perfil = metricas['perfil']
-                # Mapeamento sem acentos para as classes CSS
-                perfil_classes = {
-                    'Rigoroso': 'perfil-rigoroso',
-                    'Médio': 'perfil-medio',
-                    'Permissivo': 'perfil-permissivo'
-                }
-                perfil_class = perfil_classes.get(perfil, 'perfil-medio')
-                
-                # Descrições dos perfis
-                perfil_descricoes = {
-                    'Rigoroso': 'Este árbitro aplica mais de 15% cartões amarelos acima da média da competição. Espere um jogo com mais cartões.',
-                    'Médio': 'Este árbitro está na média da competição em termos de cartões amarelos. Comportamento equilibrado.',
-                    'Permissivo': 'Este árbitro aplica mais de 15% menos cartões amarelos que a média da competição. Jogo pode ter menos cartões.'
-                }
-                
-                html += f"""
-                        <div class="perfil-section">
-                            <div class="perfil-header">
-                                <span class="perfil-titulo">📋 Perfil do Árbitro</span>
-                                <span class="tooltip">
-                                    <span class="tooltip-icon">i</span>
-                                    <span class="tooltip-text">O perfil é calculado comparando a média de amarelos do árbitro com a média da competição (baseline). Rigoroso: +15% acima da média. Permissivo: -15% abaixo da média.</span>
-                                </span>
-                            </div>
-                            <div class="perfil-badges">
-                                <span class="perfil-badge {perfil_class}">
-                                    {'🔴' if perfil == 'Rigoroso' else '🟡' if perfil == 'Médio' else '🟢'} {perfil}
-                                </span>
-"""
-                if metricas.get('pipoqueiro_1t'):
-                    html += """
-                                <span class="perfil-badge perfil-pipoqueiro">
-                                    🍿 Pipoqueiro 1T
-                                    <span class="tooltip">
-                                        <span class="tooltip-icon">i</span>
-                                        <span class="tooltip-text">Mais de 50% dos cartões amarelos são aplicados no 1º tempo. Bom para apostas de cartões no 1T.</span>
-                                    </span>
-                                </span>
-"""
-                html += f"""
-                            </div>
-                            <div class="perfil-descricao">{perfil_descricoes.get(perfil, '')}</div>
-                        </div>
-"""
-                
-                # Baseline da Liga
-                baseline = metricas.get('baseline')
-                if baseline:
-                    html += f"""
-                        <div class="baseline-section">
-                            <div class="baseline-titulo">
-                                📈 Baseline da Competição ({baseline.get('liga', partida['liga_nome'])})
-                                <span class="tooltip">
-                                    <span class="tooltip-icon">i</span>
-                                    <span class="tooltip-text">Valores médios históricos da competição. Usados como referência para classificar o perfil do árbitro.</span>
-                                </span>
-                            </div>
-                            <div class="baseline-valores">
-                                <div class="baseline-item">
-                                    <span>Média Amarelos:</span>
-                                    <span class="valor">{baseline.get('amarelos_total_jogo', '-')}</span>
-                                </div>
-                                <div class="baseline-item">
-                                    <span>Média Faltas:</span>
-                                    <span class="valor">{baseline.get('faltas_total_jogo', '-')}</span>
-                                </div>
-                            </div>
-                        </div>
-"""
-                
-                # Qualidade dos dados
-                html += f"""
-                        <div class="baseline-section">
-                            <div class="baseline-titulo">
-                                📉 Qualidade dos Dados
-                                <span class="tooltip">
-                                    <span class="tooltip-icon">i</span>
-                                    <span class="tooltip-text">Percentual de jogos dos últimos 10 que possuem dados de faltas por tempo (1T/2T). Quanto maior, mais confiáveis as médias por tempo.</span>
-                                </span>
-                            </div>
-                            <div class="baseline-valores">
-                                <div class="baseline-item">
-                                    <span>Disponibilidade Faltas 1T/2T:</span>
-                                    <span class="valor">{metricas['qualidade_faltas_1t']}%</span>
-                                </div>
-                            </div>
-                        </div>
-"""
-                
-                # Tendências
-                html += f"""
-                        <div class="tendencias">
-                            <div class="tendencia-item">
-                                <span>
-                                    % jogos com ≥5 amarelos (10j)
-                                    <span class="tooltip">
-                                        <span class="tooltip-icon">i</span>
-                                        <span class="tooltip-text">Percentual de jogos onde o total de amarelos foi 5 ou mais. Útil para mercado de Over 4.5 cartões.</span>
-                                    </span>
-                                </span>
-                                <span style="color: #e94560; font-weight: bold;">{metricas['pct_5mais_amarelos']}%</span>
-                            </div>
-                            <div class="tendencia-item">
-                                <span>
-                                    % jogos com ≥3 amarelos no 1T (10j)
-                                    <span class="tooltip">
-                                        <span class="tooltip-icon">i</span>
-                                        <span class="tooltip-text">Percentual de jogos onde foram aplicados 3+ amarelos no 1º tempo. Útil para mercado de cartões no 1T.</span>
-                                    </span>
-                                </span>
-                                <span style="color: #e94560; font-weight: bold;">{metricas['pct_3mais_amarelos_1t']}%</span>
-                            </div>
-                        </div>
-"""
-            
-            html += """
-                    </div>
-"""
-            
-            # Notícias do Árbitro
-            html += f"""
-                    <div class="secao-titulo" style="margin-top: 25px;">📰 Notícias recentes envolvendo {arbitro['nome']}</div>
-"""
-            
-            if noticias_arbitro:
-                html += """
-                    <div class="noticias-lista">
-"""
-                for noticia in noticias_arbitro:
-                    html += f"""
-                        <div class="noticia-card">
-                            <div class="noticia-titulo">{noticia['titulo']}</div>
-                            <div class="noticia-meta">
-                                <span>📰 {noticia['fonte']}</span>
-                                <span>📅 {noticia['data_formatada']}</span>
-                            </div>
-                            {f"<div class='noticia-resumo'>{noticia['resumo']}</div>" if noticia['resumo'] else ""}
-                            <a href="{noticia['link']}" target="_blank" class="noticia-link">Ler mais →</a>
-                        </div>
-"""
-                html += """
-                    </div>
-"""
-            else:
-                html += """
-                    <div class="sem-noticias">ℹ️ Nenhuma notícia recente encontrada</div>
-"""
-            
-            # Tabelas de Histórico do Árbitro
-            if historico:
-                jogos_mesma_liga = metricas.get('jogos_mesma_liga', []) if metricas else []
-                jogos_outras = metricas.get('jogos_outras_ligas', []) if metricas else []
-                
-                # Histórico - Mesma Liga
-                html += f"""
-                    <div class="secao-titulo" style="margin-top: 25px;">📊 Histórico — {partida['liga_nome']}</div>
-                    <div class="tabela-scroll">
-                    <table class="tabela">
-                        <thead>
-                            <tr>
-                                <th>Data</th>
-                                <th>Partida</th>
-                                <th>Placar</th>
-                                <th>Faltas 1T</th>
-                                <th>Faltas 2T</th>
-                                <th>Faltas Total</th>
-                                <th>Amarelos</th>
-                                <th>Vermelhos</th>
-                            </tr>
-                        </thead>
-                        <tbody>
-"""
-                
-                if jogos_mesma_liga:
-                    for jogo in jogos_mesma_liga[:10]:
-                        f1c = jogo.get('faltas_1t_casa')
-                        f1f = jogo.get('faltas_1t_fora')
-                        f2c = jogo.get('faltas_2t_casa')
-                        f2f = jogo.get('faltas_2t_fora')
-                        ftc = jogo.get('faltas_total_casa')
-                        ftf = jogo.get('faltas_total_fora')
-                        
-                        faltas_1t = "—" if (f1c is None or f1f is None) else str((f1c or 0) + (f1f or 0))
-                        faltas_2t = "—" if (f2c is None or f2f is None) else str((f2c or 0) + (f2f or 0))
-                        faltas_total = "—" if (ftc is None or ftf is None) else str((ftc or 0) + (ftf or 0))
-                        
-                        amarelos = (jogo.get('amarelos_total_casa', 0) or 0) + (jogo.get('amarelos_total_fora', 0) or 0)
-                        vermelhos = (jogo.get('vermelhos_total_casa', 0) or 0) + (jogo.get('vermelhos_total_fora', 0) or 0)
-                        
-                        html += f"""
-                            <tr>
-                                <td>{jogo.get('data', '')}</td>
-                                <td>{jogo.get('time_casa', '')} vs {jogo.get('time_fora', '')}</td>
-                                <td style="font-weight: bold;">{jogo.get('placar_casa', 0)} - {jogo.get('placar_fora', 0)}</td>
-                                <td>{faltas_1t}</td>
-                                <td>{faltas_2t}</td>
-                                <td>{faltas_total}</td>
-                                <td><span class="stat-amarelo">{amarelos}</span></td>
-                                <td><span class="stat-vermelho">{vermelhos}</span></td>
-                            </tr>
-"""
-                else:
-                    html += """
-                            <tr>
-                                <td colspan="8" style="text-align: center; color: #a0a0a0;">Nenhum jogo nesta competição</td>
-                            </tr>
-"""
-                
-                html += """
-                        </tbody>
-                    </table>
-                    </div>
-"""
-                
-                # Histórico - Outras Competições
-                html += """
-                    <div class="secao-titulo" style="margin-top: 25px;">📊 Histórico — Outras Competições</div>
-                    <div class="tabela-scroll">
-                    <table class="tabela">
-                        <thead>
-                            <tr>
-                                <th>Data</th>
-                                <th>Competição</th>
-                                <th>Partida</th>
-                                <th>Placar</th>
-                                <th>Faltas 1T</th>
-                                <th>Faltas 2T</th>
-                                <th>Faltas Total</th>
-                                <th>Amarelos</th>
-                                <th>Vermelhos</th>
-                            </tr>
-                        </thead>
-                        <tbody>
-"""
-                
-                if jogos_outras:
-                    for jogo in jogos_outras[:10]:
-                        f1c = jogo.get('faltas_1t_casa')
-                        f1f = jogo.get('faltas_1t_fora')
-                        f2c = jogo.get('faltas_2t_casa')
-                        f2f = jogo.get('faltas_2t_fora')
-                        ftc = jogo.get('faltas_total_casa')
-                        ftf = jogo.get('faltas_total_fora')
-                        
-                        faltas_1t = "—" if (f1c is None or f1f is None) else str((f1c or 0) + (f1f or 0))
-                        faltas_2t = "—" if (f2c is None or f2f is None) else str((f2c or 0) + (f2f or 0))
-                        faltas_total = "—" if (ftc is None or ftf is None) else str((ftc or 0) + (ftf or 0))
-                        
-                        amarelos = (jogo.get('amarelos_total_casa', 0) or 0) + (jogo.get('amarelos_total_fora', 0) or 0)
-                        vermelhos = (jogo.get('vermelhos_total_casa', 0) or 0) + (jogo.get('vermelhos_total_fora', 0) or 0)
-                        
-                        html += f"""
-                            <tr>
-                                <td>{jogo.get('data', '')}</td>
-                                <td>{jogo.get('campeonato', '')}</td>
-                                <td>{jogo.get('time_casa', '')} vs {jogo.get('time_fora', '')}</td>
-                                <td style="font-weight: bold;">{jogo.get('placar_casa', 0)} - {jogo.get('placar_fora', 0)}</td>
-                                <td>{faltas_1t}</td>
-                                <td>{faltas_2t}</td>
-                                <td>{faltas_total}</td>
-                                <td><span class="stat-amarelo">{amarelos}</span></td>
-                                <td><span class="stat-vermelho">{vermelhos}</span></td>
-                            </tr>
-"""
-                else:
-                    html += """
-                            <tr>
-                                <td colspan="9" style="text-align: center; color: #a0a0a0;">Nenhum jogo em outras competições</td>
-                            </tr>
-"""
-                
-                html += """
-                        </tbody>
-                    </table>
-                    </div>
-"""
+            color: white;
+            transform: scale(1.1);
+            
+        }}
+
         
-        else:
-            html += """
-                    <div class="sem-noticias">⚠️ Árbitro não informado para esta partida</div>
-"""
+        /* ========================================
+           BARRA DE PESQUISA ESTILO CTRL+F v1.4
+           ======================================== */
+        .search-bar {{
+            position: fixed;
+            top: 0;
+            left: 0;
+            right: 0;
+            z-index: 9999;
+            background: linear-gradient(135deg, #1a1a2e 0%, #0f3460 100%);
+            padding: 12px 20px;
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            gap: 12px;
+            box-shadow: 0 4px 20px rgba(0, 0, 0, 0.5);
+            border-bottom: 2px solid #e94560;
+            transform: translateY(-100%);
+            transition: transform 0.3s ease;
+            pointer-events: none;
+        }}
         
-        html += """
-                </div>
-"""
+        .search-bar.active {{
+            transform: translateY(0);
+            pointer-events: auto;
+        }}
         
-        # Seção dos Times
-        html += """
-                <div class="secao">
-                    <div class="secao-titulo">⚽ Times</div>
-                    <div class="times-grid">
-"""
+        body.search-active {{
+            padding-top: 70px;
+        }}
         
-        # Time da Casa
-        html += f"""
-                        <div class="time-card">
-                            <div class="time-header">
-                                <div class="time-nome">🏠 {partida['time_casa']}</div>
-                                {f"<div class='time-posicao'>{colocacao_casa['posicao']}º</div>" if colocacao_casa else ""}
-                            </div>
-                            <div class="time-content">
-"""
+        .search-container {{
+            display: flex;
+            align-items: center;
+            gap: 8px;
+            background: #16213e;
+            border-radius: 25px;
+            padding: 6px 15px;
+            border: 1px solid #3498db;
+            max-width: 400px;
+            flex: 1;
+        }}
         
-        # Próximos jogos - Casa (MELHORADO v1.1)
-        if proximos_casa:
-            html += """
-                                <div class="proximos-jogos">
-                                    <h5>📅 Próximos 3 Jogos</h5>
-"""
-            for jogo in proximos_casa:
-                pos_adv = jogo.get('colocacao_adversario')
-                pos_adv_html = f"<span class='adversario-pos'>{pos_adv['posicao']}º</span>" if pos_adv else ""
-                campeonato_html = f"<span class='campeonato'>{jogo['campeonato']}</span>" if jogo.get('campeonato') else ""
-                fase_html = f"<span style='color: #a0a0a0;'>({jogo['fase']})</span>" if jogo.get('fase') else ""
-                
-                html += f"""
-                                    <div class="proximo-jogo">
-                                        <span class="local">{jogo['local']}</span>
-                                        <span class="adversario-info">
-                                            {jogo['adversario']}
-                                            {pos_adv_html}
-                                        </span>
-                                        <span style="color: #a0a0a0;">{jogo['data']}</span>
-                                        {campeonato_html}
-                                        {fase_html}
-                                    </div>
-"""
-            html += """
-                                </div>
-"""
+        .search-container:focus-within {{
+            border-color: #e94560;
+            box-shadow: 0 0 10px rgba(233, 69, 96, 0.3);
+        }}
         
-        # Médias do Time Casa com tooltips
-        if stats_casa:
-            html += f"""
-                                <div class="medias-time">
-                                    <div class="media-item">
-                                        <div class="valor">{stats_casa['media_faltas_feitas']}</div>
-                                        <div class="label">
-                                            Faltas Pró
-                                            <span class="tooltip">
-                                                <span class="tooltip-icon">i</span>
-                                                <span class="tooltip-text">Média de faltas COMETIDAS pelo time nos últimos 5 jogos.</span>
-                                            </span>
-                                        </div>
-                                    </div>
-                                    <div class="media-item">
-                                        <div class="valor">{stats_casa['media_faltas_sofridas']}</div>
-                                        <div class="label">
-                                            Faltas Contra
-                                            <span class="tooltip">
-                                                <span class="tooltip-icon">i</span>
-                                                <span class="tooltip-text">Média de faltas SOFRIDAS pelo time nos últimos 5 jogos (cometidas pelo adversário).</span>
-                                            </span>
-                                        </div>
-                                    </div>
-                                    <div class="media-item">
-                                        <div class="valor">{stats_casa['media_amarelos_feitos']}</div>
-                                        <div class="label">
-                                            Amarelos Pró
-                                            <span class="tooltip">
-                                                <span class="tooltip-icon">i</span>
-                                                <span class="tooltip-text">Média de cartões amarelos RECEBIDOS pelo time nos últimos 5 jogos.</span>
-                                            </span>
-                                        </div>
-                                    </div>
-                                    <div class="media-item">
-                                        <div class="valor">{stats_casa['media_amarelos_sofridos']}</div>
-                                        <div class="label">
-                                            Amarelos Contra
-                                            <span class="tooltip">
-                                                <span class="tooltip-icon">i</span>
-                                                <span class="tooltip-text">Média de cartões amarelos do ADVERSÁRIO nos últimos 5 jogos.</span>
-                                            </span>
-                                        </div>
-                                    </div>
-                                </div>
-"""
-            
-            # Tabela de Faltas - Casa
-            html += """
-                                <div class="tabela-titulo">
-                                    📊 Faltas - Últimos 5 Jogos
-                                    <span class="tooltip">
-                                        <span class="tooltip-icon">i</span>
-                                        <span class="tooltip-text"><strong>Pró:</strong> Faltas cometidas pelo time.<br><strong>Contra:</strong> Faltas sofridas (cometidas pelo adversário).</span>
-                                    </span>
-                                </div>
-                                <table class="tabela-time">
-                                    <thead>
-                                        <tr>
-                                            <th>Adversário</th>
-                                            <th>Local</th>
-                                            <th>Pró</th>
-                                            <th>Contra</th>
-                                        </tr>
-                                    </thead>
-                                    <tbody>
-"""
-            for jogo in stats_casa['jogos'][:5]:
-                local = '🏠' if jogo['eh_casa'] else '✈️'
-                html += f"""
-                                        <tr>
-                                            <td>{jogo['adversario']}</td>
-                                            <td>{local}</td>
-                                            <td>{jogo['faltas_feitas_total']}</td>
-                                            <td>{jogo['faltas_sofridas_total']}</td>
-                                        </tr>
-"""
-            html += """
-                                    </tbody>
-                                </table>
-"""
-            
-            # Tabela de Amarelos - Casa
-            html += """
-                                <div class="tabela-titulo">
-                                    📊 Amarelos - Últimos 5 Jogos
-                                    <span class="tooltip">
-                                        <span class="tooltip-icon">i</span>
-                                        <span class="tooltip-text"><strong>Pró:</strong> Cartões recebidos pelo time.<br><strong>Contra:</strong> Cartões recebidos pelo adversário.</span>
-                                    </span>
-                                </div>
-                                <table class="tabela-time">
-                                    <thead>
-                                        <tr>
-                                            <th>Adversário</th>
-                                            <th>Local</th>
-                                            <th>Pró</th>
-                                            <th>Contra</th>
-                                        </tr>
-                                    </thead>
-                                    <tbody>
-"""
-            for jogo in stats_casa['jogos'][:5]:
-                local = '🏠' if jogo['eh_casa'] else '✈️'
-                html += f"""
-                                        <tr>
-                                            <td>{jogo['adversario']}</td>
-                                            <td>{local}</td>
-                                            <td><span class="stat-amarelo">{jogo['amarelos_feitos_total']}</span></td>
-                                            <td><span class="stat-amarelo">{jogo['amarelos_sofridos_total']}</span></td>
-                                        </tr>
-"""
-            html += """
-                                    </tbody>
-                                </table>
-"""
+        .search-icon {{
+            color: #a0a0a0;
+            font-size: 16px;
+        }}
+        
+        .search-input {{
+            flex: 1;
+            background: transparent;
+            border: none;
+            outline: none;
+            color: white;
+            font-size: 14px;
+            padding: 8px 0;
+        }}
+        
+        .search-input::placeholder {{
+            color: #606060;
+        }}
+        
+        .search-counter {{
+            color: #a0a0a0;
+            font-size: 13px;
+            min-width: 60px;
+            text-align: center;
+            white-space: nowrap;
+        }}
+        
+        .search-nav {{
+            display: flex;
+            gap: 4px;
+        }}
+        
+        .search-nav button {{
+            background: #0f3460;
+            border: 1px solid #3498db;
+            color: white;
+            width: 32px;
+            height: 32px;
+            border-radius: 50%;
+            cursor: pointer;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            transition: all 0.2s;
+            font-size: 14px;
+        }}
+        
+        .search-nav button:hover:not(:disabled) {{
+            background: #e94560;
+            border-color: #e94560;
+            transform: scale(1.1);
+        }}
+        
+        .search-nav button:disabled {{
+            opacity: 0.3;
+            cursor: not-allowed;
+        }}
+        
+        .search-close {{
+            background: transparent;
+            border: none;
+            color: #a0a0a0;
+            cursor: pointer;
+            font-size: 20px;
+            padding: 5px;
+            transition: color 0.2s;
+            margin-left: 5px;
+        }}
         
-        html += """
-                            </div>
-                        </div>
-"""
+        .search-close:hover {{
+            color: #e94560;
+        }}
         
-        # Time de Fora
-        html += f"""
-                        <div class="time-card">
-                            <div class="time-header">
-                                <div class="time-nome">✈️ {partida['time_fora']}</div>
-                                {f"<div class='time-posicao'>{colocacao_fora['posicao']}º</div>" if colocacao_fora else ""}
-                            </div>
-                            <div class="time-content">
-"""
+        .search-toggle {{
+            position: fixed;
+            top: 20px;
+            right: 20px;
+            z-index: 9998;
+            background: linear-gradient(135deg, #e94560 0%, #0f3460 100%);
+            border: none;
+            color: white;
+            width: 50px;
+            height: 50px;
+            border-radius: 50%;
+            cursor: pointer;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            box-shadow: 0 4px 15px rgba(233, 69, 96, 0.4);
+            transition: all 0.3s;
+            font-size: 20px;
+        }}
         
-        # Próximos jogos - Fora (MELHORADO v1.1)
-        if proximos_fora:
-            html += """
-                                <div class="proximos-jogos">
-                                    <h5>📅 Próximos 3 Jogos</h5>
-"""
-            for jogo in proximos_fora:
-                pos_adv = jogo.get('colocacao_adversario')
-                pos_adv_html = f"<span class='adversario-pos'>{pos_adv['posicao']}º</span>" if pos_adv else ""
-                campeonato_html = f"<span class='campeonato'>{jogo['campeonato']}</span>" if jogo.get('campeonato') else ""
-                fase_html = f"<span style='color: #a0a0a0;'>({jogo['fase']})</span>" if jogo.get('fase') else ""
-                
-                html += f"""
-                                    <div class="proximo-jogo">
-                                        <span class="local">{jogo['local']}</span>
-                                        <span class="adversario-info">
-                                            {jogo['adversario']}
-                                            {pos_adv_html}
-                                        </span>
-                                        <span style="color: #a0a0a0;">{jogo['data']}</span>
-                                        {campeonato_html}
-                                        {fase_html}
-                                    </div>
-"""
-            html += """
-                                </div>
-"""
+        .search-toggle:hover {{
+            transform: scale(1.1);
+            box-shadow: 0 6px 25px rgba(233, 69, 96, 0.6);
+        }}
         
-        # Médias do Time Fora com tooltips
-        if stats_fora:
-            html += f"""
-                                <div class="medias-time">
-                                    <div class="media-item">
-                                        <div class="valor">{stats_fora['media_faltas_feitas']}</div>
-                                        <div class="label">
-                                            Faltas Pró
-                                            <span class="tooltip">
-                                                <span class="tooltip-icon">i</span>
-                                                <span class="tooltip-text">Média de faltas COMETIDAS pelo time nos últimos 5 jogos.</span>
-                                            </span>
-                                        </div>
-                                    </div>
-                                    <div class="media-item">
-                                        <div class="valor">{stats_fora['media_faltas_sofridas']}</div>
-                                        <div class="label">
-                                            Faltas Contra
-                                            <span class="tooltip">
-                                                <span class="tooltip-icon">i</span>
-                                                <span class="tooltip-text">Média de faltas SOFRIDAS pelo time nos últimos 5 jogos (cometidas pelo adversário).</span>
-                                            </span>
-                                        </div>
-                                    </div>
-                                    <div class="media-item">
-                                        <div class="valor">{stats_fora['media_amarelos_feitos']}</div>
-                                        <div class="label">
-                                            Amarelos Pró
-                                            <span class="tooltip">
-                                                <span class="tooltip-icon">i</span>
-                                                <span class="tooltip-text">Média de cartões amarelos RECEBIDOS pelo time nos últimos 5 jogos.</span>
-                                            </span>
-                                        </div>
-                                    </div>
-                                    <div class="media-item">
-                                        <div class="valor">{stats_fora['media_amarelos_sofridos']}</div>
-                                        <div class="label">
-                                            Amarelos Contra
-                                            <span class="tooltip">
-                                                <span class="tooltip-icon">i</span>
-                                                <span class="tooltip-text">Média de cartões amarelos do ADVERSÁRIO nos últimos 5 jogos.</span>
-                                            </span>
-                                        </div>
-                                    </div>
-                                </div>
-"""
-            
-            # Tabela de Faltas - Fora
-            html += """
-                                <div class="tabela-titulo">
-                                    📊 Faltas - Últimos 5 Jogos
-                                    <span class="tooltip">
-                                        <span class="tooltip-icon">i</span>
-                                        <span class="tooltip-text"><strong>Pró:</strong> Faltas cometidas pelo time.<br><strong>Contra:</strong> Faltas sofridas (cometidas pelo adversário).</span>
-                                    </span>
-                                </div>
-                                <table class="tabela-time">
-                                    <thead>
-                                        <tr>
-                                            <th>Adversário</th>
-                                            <th>Local</th>
-                                            <th>Pró</th>
-                                            <th>Contra</th>
-                                        </tr>
-                                    </thead>
-                                    <tbody>
-"""
-            for jogo in stats_fora['jogos'][:5]:
-                local = '🏠' if jogo['eh_casa'] else '✈️'
-                html += f"""
-                                        <tr>
-                                            <td>{jogo['adversario']}</td>
-                                            <td>{local}</td>
-                                            <td>{jogo['faltas_feitas_total']}</td>
-                                            <td>{jogo['faltas_sofridas_total']}</td>
-                                        </tr>
-"""
-            html += """
-                                    </tbody>
-                                </table>
-"""
-            
-            # Tabela de Amarelos - Fora
-            html += """
-                                <div class="tabela-titulo">
-                                    📊 Amarelos - Últimos 5 Jogos
-                                    <span class="tooltip">
-                                        <span class="tooltip-icon">i</span>
-                                        <span class="tooltip-text"><strong>Pró:</strong> Cartões recebidos pelo time.<br><strong>Contra:</strong> Cartões recebidos pelo adversário.</span>
-                                    </span>
-                                </div>
-                                <table class="tabela-time">
-                                    <thead>
-                                        <tr>
-                                            <th>Adversário</th>
-                                            <th>Local</th>
-                                            <th>Pró</th>
-                                            <th>Contra</th>
-                                        </tr>
-                                    </thead>
-                                    <tbody>
-"""
-            for jogo in stats_fora['jogos'][:5]:
-                local = '🏠' if jogo['eh_casa'] else '✈️'
-                html += f"""
-                                        <tr>
-                                            <td>{jogo['adversario']}</td>
-                                            <td>{local}</td>
-                                            <td><span class="stat-amarelo">{jogo['amarelos_feitos_total']}</span></td>
-                                            <td><span class="stat-amarelo">{jogo['amarelos_sofridos_total']}</span></td>
-                                        </tr>
-"""
-            html += """
-                                    </tbody>
-                                </table>
-"""
+        .search-toggle.hidden {{
+            opacity: 0;
+            pointer-events: none;
+        }}
+        
+        /* Highlight dos resultados */
+        .search-highlight {{
+            background: linear-gradient(135deg, #f6e05e 0%, #ecc94b 100%);
+            color: #1a1a2e;
+            padding: 2px 4px;
+            border-radius: 3px;
+            font-weight: bold;
+            box-shadow: 0 2px 8px rgba(246, 224, 94, 0.4);
+        }}
+        
+        .search-highlight.current {{
+            background: linear-gradient(135deg, #e94560 0%, #ff6b6b 100%);
+            color: white;
+            box-shadow: 0 2px 12px rgba(233, 69, 96, 0.6);
+            animation: pulse 1s infinite;
+        }}
+        
+        @keyframes pulse {{
+            0%, 100% {{ box-shadow: 0 2px 12px rgba(233, 69, 96, 0.6); }}
+            50% {{ box-shadow: 0 2px 20px rgba(233, 69, 96, 0.9); }}
+        }}
+        
+        /* Filtros de Perfil do Árbitro */
+        .filter-container {{
+            display: flex;
+            align-items: center;
+            gap: 6px;
+            margin-left: 10px;
+            padding-left: 10px;
+            border-left: 1px solid #3498db;
+        }}
+        
+        .filter-label {{
+            color: #a0a0a0;
+            font-size: 12px;
+            margin-right: 4px;
+        }}
+        
+        .filter-btn {{
+            padding: 4px 10px;
+            border: 1px solid #3498db;
+            background: transparent;
+            color: #a0a0a0;
+            border-radius: 15px;
+            cursor: pointer;
+            font-size: 11px;
+            transition: all 0.2s;
+            white-space: nowrap;
+        }}
+        
+        .filter-btn:hover {{
+            background: rgba(52, 152, 219, 0.2);
+            color: #e0e0e0;
+        }}
+        
+        .filter-btn.active {{
+            background: #3498db;
+            color: white;
+            border-color: #3498db;
+        }}
+        
+        .filter-btn.rigoroso.active {{
+            background: #e94560;
+            border-color: #e94560;
+        }}
+        
+        .filter-btn.medio.active {{
+            background: #f6e05e;
+            border-color: #f6e05e;
+            color: #1a1a2e;
+        }}
+        
+        .filter-btn.permissivo.active {{
+            background: #2ecc71;
+            border-color: #2ecc71;
+        }}
+        
+        .filter-clear {{
+            padding: 4px 8px;
+            border: none;
+            background: transparent;
+            color: #e94560;
+            cursor: pointer;
+            font-size: 14px;
+            transition: all 0.2s;
+        }}
         
-        # Fecha a seção dos Times
-        html += """
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            </div>
-"""
+        .filter-clear:hover {{
+            color: #ff6b6b;
+            transform: scale(1.1);
+        }}
         
-        # ====== NOVA SEÇÃO: Gráfico Comparativo de Amarelos ======
-        # Coleta dados para o gráfico
-        grafico_id = f"grafico_{partida['id']}"
+        .filter-clear.hidden {{
+            display: none;
+        }}
         
-        # Dados do árbitro - verifica se tem 5 jogos na liga
-        amarelos_arbitro = []
-        arbitro_fonte = "geral"  # padrão
+        /* Card oculto pelo filtro */
+        .jogo-card.filtered-out {{
+            display: none;
+        }}
         
-        if metricas:
-            amarelos_liga = metricas.get('amarelos_5j_liga', [])
-            amarelos_geral = metricas.get('amarelos_5j_geral', [])
+        /* Contador de filtro */
+        .filter-counter {{
+            color: #a0a0a0;
+            font-size: 11px;
+            margin-left: 6px;
+        }}
+        
+        /* Responsivo - filtros em tela pequena */
+        @media (max-width: 768px) {{
+            .navbar {{
+                padding: 15px 20px;
+            }}
             
-            # Se tem 5 jogos na liga, usa dados da liga
-            if len(amarelos_liga) >= 5:
-                amarelos_arbitro = amarelos_liga[:5]
-                arbitro_fonte = "na liga"
-            else:
-                # Caso contrário, usa dados gerais
-                amarelos_arbitro = amarelos_geral[:5] if amarelos_geral else []
-                arbitro_fonte = "geral"
-        
-        # Preenche com 0 se tiver menos de 5 jogos
-        while len(amarelos_arbitro) < 5:
-            amarelos_arbitro.append(0)
-        # Inverte para mostrar do mais antigo ao mais recente
-        amarelos_arbitro = amarelos_arbitro[::-1]
-        
-        # Dados do time da casa (últimos 5 jogos)
-        amarelos_casa = []
-        if stats_casa and stats_casa.get('jogos'):
-            for jogo in stats_casa['jogos'][:5]:
-                amarelos_casa.append(jogo.get('amarelos_feitos_total', 0))
-        while len(amarelos_casa) < 5:
-            amarelos_casa.append(0)
-        amarelos_casa = amarelos_casa[::-1]
-        
-        # Dados do time de fora (últimos 5 jogos)
-        amarelos_fora = []
-        if stats_fora and stats_fora.get('jogos'):
-            for jogo in stats_fora['jogos'][:5]:
-                amarelos_fora.append(jogo.get('amarelos_feitos_total', 0))
-        while len(amarelos_fora) < 5:
-            amarelos_fora.append(0)
-        amarelos_fora = amarelos_fora[::-1]
+            .navbar-menu {{
+                position: fixed;
+                top: 70px;
+                left: 0;
+                right: 0;
+                background: linear-gradient(135deg, #0f3460 0%, #1a1a2e 100%);
+                flex-direction: column;
+                padding: 20px;
+                gap: 10px;
+                transform: translateY(-150%);
+                transition: transform 0.3s;
+                border-bottom: 2px solid #e94560;
+                z-index: 9996;
+            }}
+            
+            .navbar-menu.active {{
+                transform: translateY(0);
+            }}
+            
+            .menu-toggle {{
+                display: block;
+            }}
+            
+            .logo-img {{
+                height: 36px;
+            }}
+            
+            body {{
+                padding-top: 90px;
+            }}
+            
+            /* Lupa no canto inferior direito no mobile */
+            .search-toggle {{
+                top: auto;
+                bottom: 20px;
+                right: 20px;
+            }}
+            
+            .search-bar {{
+                flex-wrap: wrap;
+                padding: 10px;
+                gap: 8px;
+            }}
+            
+            .filter-container {{
+                width: 100%;
+                justify-content: center;
+                border-left: none;
+                padding-left: 0;
+                margin-left: 0;
+                padding-top: 8px;
+                border-top: 1px solid #3498db;
+            }}
+        }}
         
-        html += f"""
-                <!-- Seção Comparativo de Amarelos -->
-                <div class="secao">
-                    <div class="secao-titulo">📊 Comparativo de Amarelos - Últimos 5 Jogos</div>
-                    <div class="grafico-comparativo">
-                        <div class="grafico-container">
-                            <canvas id="{grafico_id}"></canvas>
-                        </div>
-                        <div class="grafico-legenda">
-                            <div class="legenda-item">
-                                <div class="legenda-cor" style="background: #e94560;"></div>
-                                <span>🗣️ Árbitro <small style="color: #a0a0a0;">({arbitro_fonte})</small></span>
-                            </div>
-                            <div class="legenda-item">
-                                <div class="legenda-cor" style="background: #3498db;"></div>
-                                <span>🏠 {partida['time_casa']}</span>
-                            </div>
-                            <div class="legenda-item">
-                                <div class="legenda-cor" style="background: #2ecc71;"></div>
-                                <span>✈️ {partida['time_fora']}</span>
-                            </div>
-                        </div>
-                    </div>
-                    <script>
-                    (function() {{
-                        const ctx = document.getElementById('{grafico_id}').getContext('2d');
-                        new Chart(ctx, {{
-                            type: 'line',
-                            data: {{
-                                labels: ['Jogo 1', 'Jogo 2', 'Jogo 3', 'Jogo 4', 'Jogo 5'],
-                                datasets: [
-                                    {{
-                                        label: 'Árbitro',
-                                        data: {amarelos_arbitro},
-                                        borderColor: '#e94560',
-                                        backgroundColor: 'rgba(233, 69, 96, 0.1)',
-                                        borderWidth: 3,
-                                        pointRadius: 5,
-                                        pointBackgroundColor: '#e94560',
-                                        tension: 0.3,
-                                        fill: false
-                                    }},
-                                    {{
-                                        label: 'Time Casa',
-                                        data: {amarelos_casa},
-                                        borderColor: '#3498db',
-                                        backgroundColor: 'rgba(52, 152, 219, 0.1)',
-                                        borderWidth: 3,
-                                        pointRadius: 5,
-                                        pointBackgroundColor: '#3498db',
-                                        tension: 0.3,
-                                        fill: false
-                                    }},
-                                    {{
-                                        label: 'Time Fora',
-                                        data: {amarelos_fora},
-                                        borderColor: '#2ecc71',
-                                        backgroundColor: 'rgba(46, 204, 113, 0.1)',
-                                        borderWidth: 3,
-                                        pointRadius: 5,
-                                        pointBackgroundColor: '#2ecc71',
-                                        tension: 0.3,
-                                        fill: false
-                                    }}
-                                ]
-                            }},
-                            options: {{
-                                responsive: true,
-                                maintainAspectRatio: false,
-                                plugins: {{
-                                    legend: {{
-                                        display: false
-                                    }},
-                                    tooltip: {{
-                                        backgroundColor: '#1a1a2e',
-                                        titleColor: '#e94560',
-                                        bodyColor: '#e0e0e0',
-                                        borderColor: '#0f3460',
-                                        borderWidth: 1,
-                                        padding: 10,
-                                        displayColors: true
-                                    }}
-                                }},
-                                scales: {{
-                                    y: {{
-                                        beginAtZero: true,
-                                        max: 10,
-                                        ticks: {{
-                                            color: '#a0a0a0',
-                                            stepSize: 2
-                                        }},
-                                        grid: {{
-                                            color: 'rgba(255, 255, 255, 0.1)'
-                                        }}
-                                    }},
-                                    x: {{
-                                        ticks: {{
-                                            color: '#a0a0a0'
-                                        }},
-                                        grid: {{
-                                            color: 'rgba(255, 255, 255, 0.1)'
-                                        }}
-                                    }}
-                                }}
-                            }}
-                        }});
-                    }})();
-                    </script>
-"""
+        /* Tooltip da barra de pesquisa */
+        .search-hint {{
+            position: fixed;
+            bottom: 20px;
+            right: 20px;
+            background: #1a1a2e;
+            color: #a0a0a0;
+            padding: 10px 15px;
+            border-radius: 8px;
+            font-size: 12px;
+            border: 1px solid #0f3460;
+            opacity: 0;
+            transition: opacity 0.3s;
+            pointer-events: none;
+        }}
         
-        # Fecha seção do gráfico, jogo-content e jogo-card
-        html += """
-                </div>
-            </div>
+        .search-hint.visible {{
+            opacity: 1;
+        }}
+        
+        .search-hint kbd {{
+            background: #0f3460;
+            padding: 2px 6px;
+            border-radius: 4px;
+            font-family: monospace;
+            color: #e94560;
+        }}
+    </style>
+    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
+</head>
+<body>
+    <!-- Navbar (igual ao Home) -->
+    <nav class="navbar">
+        <a href="index.html" class="navbar-brand">
+            <img src="./assets/img/LogoINICIO.png" alt="RefStats" class="logo-img">
+        </a>
+        
+        <button class="menu-toggle" onclick="document.getElementById('navMenu').classList.toggle('active')" aria-label="Menu">
+            ☰
+        </button>
+        
+        <div class="navbar-menu" id="navMenu">
+            <a href="index.html">INÍCIO</a>
+            <a href="#" class="active">JOGOS DO DIA</a>
+            <a href="refstats_historico.html">HISTÓRICO</a>
+            <a href="refstats_contato.html">CONTATO</a>
+        </div>
+    </nav>
+    
+    <!-- Barra de Pesquisa v1.4 -->
+    <div class="search-bar" id="searchBar">
+        <div class="search-container">
+            <span class="search-icon">🔍</span>
+            <input type="text" class="search-input" id="searchInput" placeholder="Pesquisar na página..." autocomplete="off">
+            <span class="search-counter" id="searchCounter"></span>
+        </div>
+        <div class="search-nav">
+            <button id="searchPrev" title="Anterior (↑)" disabled>▲</button>
+            <button id="searchNext" title="Próximo (↓)" disabled>▼</button>
+        </div>
+        <div class="filter-container">
+            <span class="filter-label">Perfil:</span>
+            <button class="filter-btn rigoroso" data-filter="Rigoroso" title="Mostrar árbitros rigorosos">🔴 Rigoroso</button>
+            <button class="filter-btn medio" data-filter="Médio" title="Mostrar árbitros médios">🟡 Médio</button>
+            <button class="filter-btn permissivo" data-filter="Permissivo" title="Mostrar árbitros permissivos">🟢 Permissivo</button>
+            <button class="filter-clear hidden" id="filterClear" title="Limpar filtro">✕</button>
+            <span class="filter-counter" id="filterCounter"></span>
+        </div>
+        <button class="search-close" id="searchClose" title="Fechar (Esc)">✕</button>
+    </div>
+    
+    <!-- Botão flutuante para abrir pesquisa -->
+    <button class="search-toggle" id="searchToggle" title="Pesquisar (Ctrl+F)">🔍</button>
+    
+    <!-- Dica de atalho -->
+    <div class="search-hint" id="searchHint">
+        Pressione <kbd>Ctrl</kbd> + <kbd>F</kbd> para pesquisar
+    </div>
+    
+    <div class="container">
+        <div class="header">
+            <h1>⚽ Jogos do Dia</h1>
+            <p>📅 {data_jogos} • {len(analises)} partida(s) analisada(s)</p>
         </div>
 """
     
+    # Gera card para cada jogo
+    for analise in analises:
+        html += gerar_card_html(analise)
+    
     # Card de Doação
     html += """
         <!-- Card de Doação -->
@@ -3916,155 +3724,687 @@ def gerar_html_unificado(analises, timestamp, data_jogos):
     return html
 
 # ============================================================================
-# FUNÇÃO PRINCIPAL
+# ANÁLISE DAS PARTIDAS (CONCORRENTE)
 # ============================================================================
 
-def main():
-    """Função principal do sistema"""
-    print("=" * 70)
-    print("  ⚽ REFSTATS - JOGOS DO DIA v1.5")
-    print("  Análise de Árbitros + Times")
-    print("=" * 70)
-    print()
+def _resultado_ou_padrao(futuro, padrao=None):
+    """Resultado de uma consulta em paralelo; falhas viram o valor padrão"""
+    try:
+        return futuro.result()
+    except Exception:
+        return padrao
+
+class PrazoExecucao:
+    """
+    Orçamento de tempo de uma data (--deadline). Dados essenciais vêm
+    primeiro; as seções opcionais usam só o que sobrar do prazo, e uma
+    partida cujos dados essenciais não ficarem prontos nele sai sem eles.
+    """
     
-    # Solicita a data
-    data_str = input("📅 Digite a data das partidas (DD/MM/YYYY) [ENTER para hoje]: ").strip()
+    def __init__(self, segundos):
+        self.segundos = segundos
+        self.fim = time.monotonic() + segundos
     
-    if not data_str:
-        data_str = datetime.now().strftime('%d/%m/%Y')
-        print(f"   ➡️ Usando data de hoje: {data_str}")
+    def restante(self):
+        return max(0.0, self.fim - time.monotonic())
+
+# Seções que enriquecem o card mas não são essenciais (puladas se o prazo acabar)
+SECOES_OPCIONAIS = ('noticias_arbitro', 'proximos_casa', 'proximos_fora')
+
+# Seções da fase essencial (puladas só se nem elas couberem no prazo)
+SECOES_ESSENCIAIS = ('arbitro', 'colocacao_casa', 'colocacao_fora', 'stats_casa', 'stats_fora')
+
+@perfilado('analisar_arbitro')
+def _analisar_arbitro(partida, arbitro, data_str, incluir_noticias=True):
+    """Histórico → métricas → notícias do árbitro (etapas dependentes entre si)"""
+    resultado = {'arbitro': arbitro}
+    
+    if arbitro:
+        print(f"         ⚖️ Árbitro: {arbitro['nome']} ({arbitro['pais']})")
+        historico = buscar_ultimas_partidas_arbitro(arbitro['id'], quantidade=10, data_alvo=data_str)
+        resultado['historico'] = historico
+        
+        if historico:
+            resultado['metricas'] = calcular_metricas_arbitro(historico, partida['liga_id'])
+        
+        if incluir_noticias:
+            resultado['noticias_arbitro'] = buscar_noticias_arbitro(arbitro['nome'], arbitro.get('pais', ''))
+    
+    return resultado
+
+@perfilado('analisar_partida')
+def analisar_partida_completa(partida, data_str, pool_consultas, opcionais=True):
+    """
+    Monta a análise completa de uma partida.
+    O detalhe do evento (/event/{id}) é lido uma vez; as consultas
+    independentes (árbitro, colocações, próximos jogos, estatísticas dos
+    times) são disparadas em paralelo no pool_consultas.
+    Com opcionais=False, só os dados essenciais (SECOES_OPCIONAIS ficam
+    para completar_opcionais).
+    """
+    analise = {'partida': partida}
+    
+    futuros = {
+        'colocacao_casa': pool_consultas.submit(buscar_colocacao_time, partida['time_casa_id'], partida['liga_id']),
+        'colocacao_fora': pool_consultas.submit(buscar_colocacao_time, partida['time_fora_id'], partida['liga_id']),
+        'stats_casa': pool_consultas.submit(buscar_ultimos_jogos_time, partida['time_casa_id'], data_alvo=data_str),
+        'stats_fora': pool_consultas.submit(buscar_ultimos_jogos_time, partida['time_fora_id'], data_alvo=data_str),
+    }
+    if opcionais:
+        futuros['proximos_casa'] = pool_consultas.submit(buscar_proximos_jogos, partida['time_casa_id'], data_alvo=data_str)
+        futuros['proximos_fora'] = pool_consultas.submit(buscar_proximos_jogos, partida['time_fora_id'], data_alvo=data_str)
+    
+    # /event/{id} uma única vez: estádio, árbitro, fase e status vêm daqui
+    detalhe = obter_detalhe_evento(partida['id'])
+    arbitro = detalhe.arbitro if detalhe else None
+    analise['estadio_info'] = detalhe.estadio if detalhe else None
+    if detalhe:
+        partida['status'] = detalhe.status_descricao or partida.get('status', '')
+        if not partida.get('fase'):
+            partida['fase'] = detalhe.fase
+    
+    futuros['arbitro'] = pool_consultas.submit(_analisar_arbitro, partida, arbitro, data_str, opcionais)
+    
+    analise.update(_resultado_ou_padrao(futuros['arbitro'], {'arbitro': None}))
+    analise['colocacao_casa'] = _resultado_ou_padrao(futuros['colocacao_casa'])
+    analise['colocacao_fora'] = _resultado_ou_padrao(futuros['colocacao_fora'])
+    if opcionais:
+        analise['proximos_casa'] = _resultado_ou_padrao(futuros['proximos_casa'], [])
+        analise['proximos_fora'] = _resultado_ou_padrao(futuros['proximos_fora'], [])
+    else:
+        # Ainda a buscar (completar_opcionais); fica no diário se a execução cair antes
+        analise['secoes_puladas'] = [secao for secao in SECOES_OPCIONAIS
+                                     if secao != 'noticias_arbitro' or analise.get('arbitro')]
+    analise['stats_casa'] = _resultado_ou_padrao(futuros['stats_casa'])
+    analise['stats_fora'] = _resultado_ou_padrao(futuros['stats_fora'])
+    
+    return analise
+
+def completar_opcionais(analises, indices, data_str, pool_consultas, prazo=None):
+    """
+    Busca as seções listadas em analise['secoes_puladas'] (notícias do
+    árbitro, próximos jogos) das análises em `indices` até o fim do prazo
+    (sem prazo, espera todas), começando pelos jogos mais cedo. O que não
+    terminar a tempo continua em analise['secoes_puladas'].
+    Retorna quantas seções foram puladas.
+    """
+    futuros = {}
+    for idx in sorted(indices, key=lambda i: analises[i]['partida'].get('horario', '')):
+        analise = analises[idx]
+        partida = analise['partida']
+        arbitro = analise.get('arbitro')
+        secoes = analise.pop('secoes_puladas', [])
+        
+        for secao, lado in (('proximos_casa', 'time_casa_id'), ('proximos_fora', 'time_fora_id')):
+            if secao in secoes:
+                futuros[pool_consultas.submit(buscar_proximos_jogos, partida[lado], data_alvo=data_str)] = (idx, secao)
+        if arbitro and 'noticias_arbitro' in secoes:
+            futuros[pool_consultas.submit(buscar_noticias_arbitro, arbitro['nome'], arbitro.get('pais', ''))] = (idx, 'noticias_arbitro')
+    
+    if not futuros:
+        return 0
+    concluidos, pendentes = wait(futuros, timeout=prazo.restante() if prazo else None)
+    
+    for futuro in concluidos:
+        idx, secao = futuros[futuro]
+        analises[idx][secao] = _resultado_ou_padrao(futuro, [])
+    
+    for futuro in pendentes:
+        futuro.cancel()
+        idx, secao = futuros[futuro]
+        analises[idx][secao] = []
+        analises[idx].setdefault('secoes_puladas', []).append(secao)
+    
+    return len(pendentes)
+
+def analisar_partidas(partidas, data_str, max_partidas=MAX_PARTIDAS_SIMULTANEAS, diario=None, concluidas=None,
+                      prazo=None):
+    """
+    Analisa várias partidas ao mesmo tempo (até max_partidas) e devolve
+    as análises na mesma ordem de `partidas`.
+    
+    diario: DiarioPartidas onde cada partida concluída é registrada na hora
+            (com prazo, de novo depois das seções opcionais)
+    concluidas: análises já prontas por event_id (retomada); não são refeitas,
+                só as seções que tinham ficado em secoes_puladas
+    prazo: PrazoExecucao; primeiro os dados essenciais de todas as partidas,
+           depois as seções opcionais com o tempo que sobrar. Partidas sem
+           os dados essenciais quando o prazo acaba entram só com a partida
+           (todas as seções em secoes_puladas) e ficam fora do diário, para
+           uma retomada refazê-las por inteiro.
+    
+    Com prazo, consultas ainda em andamento quando ele acaba são
+    abandonadas (as que estão na fila são canceladas). As threads dos pools
+    não são daemon: o Python ainda espera por elas ao encerrar o processo,
+    o que atrasa só a saída (cada consulta é limitada pelo timeout e pelas
+    retentativas do cliente), nunca a página, que já foi gravada.
+    """
+    total = len(partidas)
+    analises = [None] * total
+    max_partidas = max(1, max_partidas)
+    concluidas = concluidas or {}
+    opcionais = prazo is None
+    
+    pendentes = []
+    for idx, partida in enumerate(partidas):
+        if partida['id'] in concluidas:
+            analises[idx] = concluidas[partida['id']]
+        else:
+            pendentes.append(idx)
+    
+    contador = total - len(pendentes)
+    if contador:
+        print(f"\n   ♻️ {contador} partida(s) retomada(s) do diário, {len(pendentes)} a analisar")
+    
+    pool_consultas = ThreadPoolExecutor(max_workers=max_partidas * CONSULTAS_POR_PARTIDA)
+    pool_partidas = ThreadPoolExecutor(max_workers=max_partidas)
+    atrasadas = []
+    
+    def _concluir(futuro, idx):
+        nonlocal contador
+        partida = partidas[idx]
+        contador += 1
+        
+        try:
+            analise = futuro.result()
+            if diario:
+                diario.registrar(analise)
+        except Exception as e:
+            print(f"\n   ⚠️ Erro ao analisar {partida['time_casa']} vs {partida['time_fora']}: {e}")
+            analise = {'partida': partida, 'arbitro': None}
+        
+        analises[idx] = analise
+        
+        arbitro = analise.get('arbitro')
+        arbitro_txt = f"⚖️ {arbitro['nome']}" if arbitro else "⚖️ árbitro não definido"
+        print(f"\n   [{contador}/{total}] ✅ {partida['time_casa']} vs {partida['time_fora']} "
+              f"({partida['liga_nome']}) - {arbitro_txt}")
     
-    # Valida o formato da data
     try:
-        datetime.strptime(data_str, '%d/%m/%Y')
-    except ValueError:
-        print("\n❌ Formato de data inválido! Use DD/MM/YYYY")
-        return
+        futuros = {
+            pool_partidas.submit(analisar_partida_completa, partidas[idx], data_str, pool_consultas, opcionais): idx
+            for idx in pendentes
+        }
+        
+        try:
+            for futuro in as_completed(futuros, timeout=prazo.restante() if prazo else None):
+                _concluir(futuro, futuros[futuro])
+        except TempoEsgotado:
+            for futuro, idx in futuros.items():
+                if analises[idx] is not None:
+                    continue
+                if futuro.done():
+                    _concluir(futuro, idx)
+                    continue
+                futuro.cancel()
+                atrasadas.append(idx)
+                analises[idx] = {'partida': partidas[idx], 'arbitro': None,
+                                 'secoes_puladas': list(SECOES_ESSENCIAIS + SECOES_OPCIONAIS)}
+            if atrasadas:
+                print(f"\n   ⏱️ Prazo esgotado na fase essencial: {len(atrasadas)} partida(s) "
+                      f"sem dados, marcada(s) na página")
+        
+        # Com prazo, as recém-analisadas; em retomadas, o que tinha ficado pulado
+        incompletas = [idx for idx, analise in enumerate(analises)
+                       if analise.get('secoes_puladas') and idx not in atrasadas]
+        if incompletas:
+            if prazo is not None and not atrasadas:
+                print(f"\n   ⏱️ Dados essenciais prontos; {prazo.restante():.0f}s do prazo para notícias e próximos jogos")
+            puladas = completar_opcionais(analises, incompletas, data_str, pool_consultas, prazo)
+            if puladas:
+                print(f"   ⏱️ Prazo esgotado: {puladas} seção(ões) opcional(is) pulada(s) e marcada(s) na página")
+            if diario:
+                for idx in incompletas:
+                    diario.registrar(analises[idx])
+    finally:
+        # Com prazo, análises e consultas ainda em andamento não seguram a página
+        pool_partidas.shutdown(wait=prazo is None, cancel_futures=prazo is not None)
+        pool_consultas.shutdown(wait=prazo is None, cancel_futures=prazo is not None)
     
-    print()
-    print("=" * 70)
+    return analises
+
+# ============================================================================
+# FUNÇÃO PRINCIPAL
+# ============================================================================
+
+def _ajustar_links_historico(html_content):
+    """Para o histórico, ajusta os links para usar ../ (voltar uma pasta)"""
+    html_historico = html_content.replace('href="index.html', 'href="../index.html')
+    html_historico = html_historico.replace('href="JOGOS_DO_DIA.html', 'href="../JOGOS_DO_DIA.html')
+    html_historico = html_historico.replace('href="refstats_historico.html', 'href="../refstats_historico.html')
+    html_historico = html_historico.replace('href="refstats_contato.html', 'href="../refstats_contato.html')
+    html_historico = html_historico.replace('href="refstats_termos.html', 'href="../refstats_termos.html')
+    html_historico = html_historico.replace('href="refstats_privacidade.html', 'href="../refstats_privacidade.html')
+    html_historico = html_historico.replace('href="refstats_aviso_legal.html', 'href="../refstats_aviso_legal.html')
+    html_historico = html_historico.replace('href="refstats_faq.html', 'href="../refstats_faq.html')
+    html_historico = html_historico.replace('src="./assets/img/LogoINICIO.png', 'src="../assets/img/LogoINICIO.png')
+    html_historico = html_historico.replace('url("./assets/img/FundoMuroFundo.png")', 'url("../assets/img/FundoMuroFundo.png")')
+    return html_historico
+
+def caminho_historico(data_str):
+    """Historico/JOGOS_DO_DIA_DDMMYYYY.html da data (DD/MM/YYYY)"""
+    return os.path.join(HISTORICO_DIR, f"JOGOS_DO_DIA_{data_str.replace('/', '')}.html")
+
+def processar_data(data_str, paralelo=MAX_PARTIDAS_SIMULTANEAS, atualizar_pagina_atual=True, retomar=False,
+                   deadline=None):
+    """
+    Gera os jogos de uma data: busca as partidas, analisa, gera o HTML e
+    salva Historico/JOGOS_DO_DIA_DDMMYYYY.html + sidecar JSON.
+    Com atualizar_pagina_atual, também sobrescreve JOGOS_DO_DIA.html na raiz.
+    Com retomar, reaproveita as partidas já registradas no diário da data.
+    Com deadline (segundos), as seções opcionais só usam o tempo que sobrar.
+    Retorna o resumo da data (None se não houver partidas).
+    """
+    coletor = obter_coletor()
+    prazo = PrazoExecucao(deadline) if deadline else None
     
     # Busca partidas do dia
-    partidas = buscar_partidas_do_dia(data_str)
+    with coletor.etapa('partidas', data_str), etapa_perfilada('partidas'):
+        partidas = buscar_partidas_do_dia(data_str)
     
     if not partidas:
-        print("\n⚠️ Nenhuma partida encontrada para esta data")
-        return
+        print(f"\n⚠️ Nenhuma partida encontrada para {data_str}")
+        return None
     
     # Analisa cada partida
     print("\n" + "=" * 70)
-    print("  🔍 ANALISANDO PARTIDAS")
+    print(f"  🔍 ANALISANDO PARTIDAS - {data_str}")
     print("=" * 70)
     
-    analises = []
+    print(f"   ⚡ {max(1, paralelo)} partida(s) em paralelo")
+    if prazo:
+        print(f"   ⏱️ Prazo: {prazo.restante():.0f}s (dados essenciais primeiro)")
     
-    for idx, partida in enumerate(partidas, 1):
-        print(f"\n[{idx}/{len(partidas)}] {partida['time_casa']} vs {partida['time_fora']}")
-        print(f"      🏆 {partida['liga_nome']}")
-        
-        analise = {'partida': partida}
-        
-        # 0. Busca info do estádio via API (v1.1)
-        print(f"      🏟️ Buscando informações do estádio...")
-        try:
-            estadio_info = buscar_info_estadio_evento(partida['id'])
-            analise['estadio_info'] = estadio_info
-            if estadio_info:
-                print(f"         ✅ {estadio_info['nome']} - {estadio_info['cidade']}")
-        except:
-            analise['estadio_info'] = None
-        
-        # 1. Busca árbitro
-        print(f"      🔍 Buscando árbitro...")
-        arbitro = buscar_arbitro_partida(partida['id'])
-        analise['arbitro'] = arbitro
-        
-        if arbitro:
-            # 2. Busca histórico do árbitro (ANTES da data_alvo)
-            print(f"      📊 Analisando histórico do árbitro...")
-            historico = buscar_ultimas_partidas_arbitro(arbitro['id'], quantidade=10, data_alvo=data_str)
-            analise['historico'] = historico
-            
-            # 3. Calcula métricas do árbitro
-            if historico:
-                metricas = calcular_metricas_arbitro(historico, partida['liga_id'])
-                analise['metricas'] = metricas
-            
-            # 4. Busca notícias do árbitro (v1.1: PT + EN)
-            print(f"      📰 Buscando notícias sobre o árbitro (PT + EN)...")
-            noticias = buscar_noticias_arbitro(arbitro['nome'], arbitro.get('pais', ''))
-            analise['noticias_arbitro'] = noticias
-            print(f"         ✅ {len(noticias)} notícia(s) encontrada(s)")
-        
-        # 5. Busca colocação dos times
-        print(f"      📊 Buscando colocação de {partida['time_casa']}...")
-        colocacao_casa = buscar_colocacao_time(partida['time_casa_id'], partida['liga_id'])
-        analise['colocacao_casa'] = colocacao_casa
-        if colocacao_casa:
-            print(f"         ✅ {colocacao_casa['posicao']}º lugar")
-        
-        print(f"      📊 Buscando colocação de {partida['time_fora']}...")
-        colocacao_fora = buscar_colocacao_time(partida['time_fora_id'], partida['liga_id'])
-        analise['colocacao_fora'] = colocacao_fora
-        if colocacao_fora:
-            print(f"         ✅ {colocacao_fora['posicao']}º lugar")
-        
-        # 6. Busca próximos jogos (APÓS a data_alvo)
-        print(f"      📅 Buscando próximos jogos...")
-        proximos_casa = buscar_proximos_jogos(partida['time_casa_id'], data_alvo=data_str)
-        proximos_fora = buscar_proximos_jogos(partida['time_fora_id'], data_alvo=data_str)
-        analise['proximos_casa'] = proximos_casa
-        analise['proximos_fora'] = proximos_fora
-        
-        # 7. Busca estatísticas dos times (ANTES da data_alvo)
-        print(f"      📊 Buscando estatísticas de {partida['time_casa']}...")
-        stats_casa = buscar_ultimos_jogos_time(partida['time_casa_id'], data_alvo=data_str)
-        analise['stats_casa'] = stats_casa
-        
-        print(f"      📊 Buscando estatísticas de {partida['time_fora']}...")
-        stats_fora = buscar_ultimos_jogos_time(partida['time_fora_id'], data_alvo=data_str)
-        analise['stats_fora'] = stats_fora
-        
-        analises.append(analise)
-        
-        print()
-        time.sleep(1)  # Delay para não sobrecarregar API
+    diario = DiarioPartidas(data_str)
+    concluidas = diario.carregar() if retomar else {}
+    diario.abrir(retomar=retomar)
+    try:
+        with coletor.etapa('analise', data_str), etapa_perfilada('analise'):
+            analises = analisar_partidas(partidas, data_str, max_partidas=paralelo,
+                                         diario=diario, concluidas=concluidas, prazo=prazo)
+    finally:
+        diario.fechar()
     
     # Gera relatório
     print("\n" + "=" * 70)
-    print("  📄 GERANDO RELATÓRIO HTML")
+    print(f"  📄 GERANDO RELATÓRIO HTML - {data_str}")
     print("=" * 70)
     
     timestamp = datetime.now().strftime('%Y%m%d_%H%M')
-    html_content = gerar_html_unificado(analises, timestamp, data_str)
+    with coletor.etapa('html', data_str), etapa_perfilada('gerar_html_unificado'):
+        html_content = gerar_html_unificado(analises, timestamp, data_str)
     
     # Garante que as pastas existem
     os.makedirs(OUTPUT_DIR, exist_ok=True)
-    historico_dir = os.path.join("Historico")
-    os.makedirs(historico_dir, exist_ok=True)
+    os.makedirs(HISTORICO_DIR, exist_ok=True)
     
-    # Salva como JOGOS_DO_DIA.html (link fixo para o Home) - pasta raiz
-    filename_atual = os.path.join("JOGOS_DO_DIA.html")
-    with open(filename_atual, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    arquivos = []
     
-    # Para o histórico, ajusta os links para usar ../ (voltar uma pasta)
-    html_historico = html_content.replace('href="index.html', 'href="../index.html')
-    html_historico = html_historico.replace('href="JOGOS_DO_DIA.html', 'href="../JOGOS_DO_DIA.html')
-    html_historico = html_historico.replace('href="refstats_historico.html', 'href="../refstats_historico.html')
-    html_historico = html_historico.replace('href="refstats_contato.html', 'href="../refstats_contato.html')
-    html_historico = html_historico.replace('href="refstats_termos.html', 'href="../refstats_termos.html')
-    html_historico = html_historico.replace('href="refstats_privacidade.html', 'href="../refstats_privacidade.html')
-    html_historico = html_historico.replace('href="refstats_aviso_legal.html', 'href="../refstats_aviso_legal.html')
-    html_historico = html_historico.replace('href="refstats_faq.html', 'href="../refstats_faq.html')
-    html_historico = html_historico.replace('src="./assets/img/LogoINICIO.png', 'src="../assets/img/LogoINICIO.png')
-    html_historico = html_historico.replace('url("./assets/img/FundoMuroFundo.png")', 'url("../assets/img/FundoMuroFundo.png")')
+    # Salva como JOGOS_DO_DIA.html (link fixo para o Home) - pasta raiz
+    if atualizar_pagina_atual:
+        filename_atual = os.path.join("JOGOS_DO_DIA.html")
+        with open(filename_atual, 'w', encoding='utf-8') as f:
+            f.write(html_content)
+        arquivos.append(f"{filename_atual} (página atual)")
     
     # Salva arquivo com data na pasta Historico/
-    data_arquivo = data_str.replace('/', '')
-    filename_historico = os.path.join(historico_dir, f"JOGOS_DO_DIA_{data_arquivo}.html")
+    filename_historico = caminho_historico(data_str)
     with open(filename_historico, 'w', encoding='utf-8') as f:
-        f.write(html_historico)
+        f.write(_ajustar_links_historico(html_content))
+    arquivos.append(f"{filename_historico} (histórico)")
+    
+    # Análises estruturadas ao lado do HTML (lidas pela Probabilidade)
+    with coletor.etapa('sidecar', data_str), etapa_perfilada('sidecar'):
+        filename_sidecar = salvar_sidecar(filename_historico, analises, data_str)
+    arquivos.append(f"{filename_sidecar} (dados estruturados)")
+    
+    return {
+        'data': data_str,
+        'partidas': len(analises),
+        'arbitros': sum(1 for a in analises if a.get('arbitro')),
+        'arquivos': arquivos,
+    }
+
+def _atualizar_analise(analise, data_str):
+    """
+    Consulta de novo /event/{id} (sem cache) e, se o árbitro ou o status
+    mudaram, refaz histórico, métricas e notícias do árbitro.
+    Retorna True se a análise foi alterada.
+    """
+    partida = analise['partida']
+    detalhe = obter_detalhe_evento(partida['id'], atualizar=True)
+    if not detalhe:
+        return False
+    
+    arbitro = detalhe.arbitro
+    arbitro_anterior = analise.get('arbitro')
+    status = detalhe.status_descricao or partida.get('status', '')
+    
+    mudou_arbitro = (arbitro or {}).get('id') != (arbitro_anterior or {}).get('id')
+    mudou_status = status != partida.get('status')
+    if not (mudou_arbitro or mudou_status):
+        return False
+    
+    partida['status'] = status
+    if detalhe.estadio:
+        analise['estadio_info'] = detalhe.estadio
+    
+    for chave in ('historico', 'metricas', 'noticias_arbitro'):
+        analise.pop(chave, None)
+    analise.update(_analisar_arbitro(partida, arbitro, data_str))
+    
+    anterior_txt = arbitro_anterior['nome'] if arbitro_anterior else "sem árbitro"
+    atual_txt = arbitro['nome'] if arbitro else "sem árbitro"
+    print(f"\n   🔄 {partida['time_casa']} vs {partida['time_fora']}: "
+          f"{anterior_txt} → {atual_txt} ({status})")
+    return True
+
+def substituir_cards(html_content, cards):
+    """
+    Troca no HTML os cards {event_id: card_html} pelos novos (entre os
+    marcadores de gerar_card_html). Retorna None se algum card não existir
+    na página (página antiga, sem marcadores).
+    """
+    for event_id, card in cards.items():
+        inicio = html_content.find(f"\n        <!-- card:{event_id} -->")
+        marcador_fim = f"        <!-- /card:{event_id} -->\n"
+        fim = html_content.find(marcador_fim, inicio)
+        if inicio < 0 or fim < 0:
+            return None
+        html_content = html_content[:inicio] + card + html_content[fim + len(marcador_fim):]
+    return html_content
+
+def atualizar_data(data_str, paralelo=MAX_PARTIDAS_SIMULTANEAS, atualizar_pagina_atual=True):
+    """
+    Atualização rápida de uma data já gerada (--atualizar): carrega o sidecar,
+    consulta só /event/{id} de cada partida e refaz o árbitro apenas onde o
+    árbitro ou o status mudou. Só os cards alterados são trocados no HTML.
+    Sem sidecar, gera a data do zero.
+    """
+    filename_historico = caminho_historico(data_str)
+    documento = carregar_sidecar(filename_historico) if os.path.exists(filename_historico) else None
+    if not documento:
+        print(f"\n⚠️ Nenhuma análise salva para {data_str}; gerando a data completa")
+        return processar_data(data_str, paralelo, atualizar_pagina_atual)
+    
+    analises = documento['analises']
+    
+    print("\n" + "=" * 70)
+    print(f"  🔄 ATUALIZANDO ÁRBITROS E STATUS - {data_str}")
+    print("=" * 70)
+    print(f"   • {len(analises)} partida(s) salvas")
+    
+    with obter_coletor().etapa('atualizacao', data_str), \
+         ThreadPoolExecutor(max_workers=max(1, paralelo) * CONSULTAS_POR_PARTIDA) as pool:
+        alteradas = [
+            analise for analise, alterada in zip(analises, pool.map(lambda a: _atualizar_analise(a, data_str), analises))
+            if alterada
+        ]
+    
+    arquivos = []
+    if alteradas:
+        cards = {a['partida']['id']: gerar_card_html(a) for a in alteradas}
+        
+        with open(filename_historico, 'r', encoding='utf-8') as f:
+            html_historico = substituir_cards(f.read(), {k: _ajustar_links_historico(v) for k, v in cards.items()})
+        if html_historico is None:
+            # Página sem marcadores de card: gera a página inteira de novo
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M')
+            html_historico = _ajustar_links_historico(gerar_html_unificado(analises, timestamp, data_str))
+        with open(filename_historico, 'w', encoding='utf-8') as f:
+            f.write(html_historico)
+        arquivos.append(f"{filename_historico} (histórico)")
+        
+        # A página atual só é tocada se for desta mesma data
+        filename_atual = os.path.join("JOGOS_DO_DIA.html")
+        if atualizar_pagina_atual and os.path.exists(filename_atual):
+            with open(filename_atual, 'r', encoding='utf-8') as f:
+                html_atual = substituir_cards(f.read(), cards)
+            if html_atual is not None:
+                with open(filename_atual, 'w', encoding='utf-8') as f:
+                    f.write(html_atual)
+                arquivos.append(f"{filename_atual} (página atual)")
+        
+        filename_sidecar = salvar_sidecar(filename_historico, analises, data_str)
+        arquivos.append(f"{filename_sidecar} (dados estruturados)")
+    
+    return {
+        'data': data_str,
+        'partidas': len(analises),
+        'arbitros': sum(1 for a in analises if a.get('arbitro')),
+        'alteradas': len(alteradas),
+        'arquivos': arquivos,
+    }
+
+def _datas_do_intervalo(de_str, ate_str):
+    """Lista de datas DD/MM/YYYY de de_str até ate_str (inclusive)"""
+    inicio = datetime.strptime(de_str, '%d/%m/%Y')
+    fim = datetime.strptime(ate_str, '%d/%m/%Y')
+    if fim < inicio:
+        inicio, fim = fim, inicio
+    return [(inicio + timedelta(days=i)).strftime('%d/%m/%Y') for i in range((fim - inicio).days + 1)]
+
+def executar_backfill(de_str, ate_str, forcar=False, dias_paralelo=DIAS_SIMULTANEOS_BACKFILL,
+                      paralelo=MAX_PARTIDAS_SIMULTANEAS, retomar=False, deadline=None):
+    """
+    Reconstrói o Historico/ de um intervalo de datas, sem perguntas.
+    Vários dias em paralelo; cliente HTTP, cache, banco local e
+    classificações são compartilhados entre os dias. Datas que já têm
+    JOGOS_DO_DIA_DDMMYYYY.html são puladas (a menos que forcar=True).
+    JOGOS_DO_DIA.html da raiz não é alterado.
+    deadline (segundos) vale para cada data.
+    """
+    datas = _datas_do_intervalo(de_str, ate_str)
+    pendentes = [d for d in datas if forcar or not os.path.exists(caminho_historico(d))]
+    puladas = len(datas) - len(pendentes)
+    
+    print("=" * 70)
+    print(f"  📚 BACKFILL {datas[0]} → {datas[-1]}")
+    print("=" * 70)
+    print(f"   • {len(datas)} data(s) no intervalo, {puladas} já existente(s) pulada(s)")
+    print(f"   • {max(1, dias_paralelo)} dia(s) em paralelo, {max(1, paralelo)} partida(s) por dia")
+    
+    resultados = {}
+    with ThreadPoolExecutor(max_workers=max(1, dias_paralelo)) as pool_dias:
+        futuros = {pool_dias.submit(processar_data, d, paralelo, False, retomar, deadline): d for d in pendentes}
+        for futuro in as_completed(futuros):
+            data_str = futuros[futuro]
+            try:
+                resultados[data_str] = futuro.result()
+            except Exception as e:
+                print(f"\n❌ Erro ao processar {data_str}: {e}")
+                resultados[data_str] = e
+    
+    print()
+    print("=" * 70)
+    print("  ✅ BACKFILL CONCLUÍDO!")
+    print("=" * 70)
+    for data_str in datas:
+        if data_str not in resultados:
+            print(f"   ⏭️ {data_str}: já existia")
+        elif isinstance(resultados[data_str], Exception):
+            print(f"   ❌ {data_str}: erro ({resultados[data_str]})")
+        elif resultados[data_str] is None:
+            print(f"   ⚠️ {data_str}: sem partidas")
+        else:
+            print(f"   ✅ {data_str}: {resultados[data_str]['partidas']} partida(s)")
+    print()
+    
+    return resultados
+
+def salvar_relatorio_execucao(sufixo=''):
+    """Grava o relatório de métricas da execução em OUTPUT_DIR e mostra o resumo"""
+    coletor = obter_coletor()
+    relatorio = coletor.relatorio()
+    coletor.exibir_resumo(relatorio)
+    caminho = coletor.salvar(OUTPUT_DIR, sufixo)
+    print(f"   • Relatório completo: {caminho}")
+    print()
+    return caminho
+
+def aquecer_cache(data_str, paralelo=MAX_PARTIDAS_SIMULTANEAS):
+    """
+    Pré-carrega no cache persistente e no banco local tudo o que a execução
+    de data_str vai pedir (agenda, detalhe dos eventos, histórico dos
+    árbitros já definidos, classificações, jogos e estatísticas dos times,
+    notícias), sem gerar páginas. Para rodar de madrugada (--warmup).
+    
+    O que é baixado vale até a data começar: as respostas ficam no cache
+    até lá, e a execução da data aceita as listas de jogos e classificações
+    sincronizadas pelo aquecimento em vez de baixá-las de novo.
+    Retorna o resumo da data (None se não houver partidas).
+    """
+    coletor = obter_coletor()
+    inicio = time.time()
+    valido_ate = datetime.strptime(data_str, '%d/%m/%Y').timestamp()
+    cliente = obter_cliente()
+    cliente.validade_minima = valido_ate
+    try:
+        with coletor.etapa('partidas', data_str), etapa_perfilada('partidas'):
+            partidas = buscar_partidas_do_dia(data_str)
+        
+        if partidas:
+            print("\n" + "=" * 70)
+            print(f"  🔥 AQUECENDO CACHE - {data_str}")
+            print("=" * 70)
+            
+            with coletor.etapa('aquecimento', data_str), etapa_perfilada('aquecimento'):
+                analises = analisar_partidas(partidas, data_str, max_partidas=paralelo)
+    finally:
+        cliente.validade_minima = None
+    
+    if not partidas:
+        print(f"\n⚠️ Nenhuma partida encontrada para {data_str}")
+        return None
+    
+    banco = obter_banco_local()
+    if banco is not None:
+        banco.registrar_aquecimento(data_str, inicio, valido_ate)
+    
+    return {
+        'data': data_str,
+        'partidas': len(partidas),
+        'arbitros': sum(1 for a in analises if a.get('arbitro')),
+        'arquivos': [],
+    }
+
+def duracao_em_segundos(texto):
+    """'20m', '90s', '1h' ou só segundos ('300') → segundos (argparse)"""
+    texto = texto.strip().lower()
+    multiplicador = {'s': 1, 'm': 60, 'h': 3600}.get(texto[-1:], None)
+    numero = texto[:-1] if multiplicador else texto
+    try:
+        segundos = float(numero) * (multiplicador or 1)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"duração inválida: {texto!r} (ex.: 20m, 90s, 1h)")
+    if segundos <= 0:
+        raise argparse.ArgumentTypeError("a duração deve ser maior que zero")
+    return segundos
+
+def criar_parser():
+    """Argumentos de linha de comando do sistema"""
+    parser = argparse.ArgumentParser(description="RefStats - Jogos do Dia")
+    parser.add_argument('--paralelo', type=int, default=MAX_PARTIDAS_SIMULTANEAS,
+                        help=f"partidas analisadas ao mesmo tempo (padrão: {MAX_PARTIDAS_SIMULTANEAS}; 1 = uma por vez)")
+    parser.add_argument('--data', help="data das partidas (DD/MM/YYYY), sem perguntar")
+    parser.add_argument('--de', help="backfill: data inicial (DD/MM/YYYY)")
+    parser.add_argument('--ate', help="backfill: data final (DD/MM/YYYY; padrão: --de)")
+    parser.add_argument('--forcar', action='store_true',
+                        help="backfill: refaz datas que já têm JOGOS_DO_DIA_DDMMYYYY.html")
+    parser.add_argument('--dias-paralelo', type=int, default=DIAS_SIMULTANEOS_BACKFILL,
+                        help=f"backfill: dias processados ao mesmo tempo (padrão: {DIAS_SIMULTANEOS_BACKFILL})")
+    parser.add_argument('--retomar', '--resume', dest='retomar', action='store_true',
+                        help="reaproveita as partidas já analisadas no diário da data (execução interrompida)")
+    parser.add_argument('--atualizar', action='store_true',
+                        help="atualiza uma data já gerada: só árbitros/status que mudaram")
+    parser.add_argument('--deadline', type=duracao_em_segundos,
+                        help="prazo por data (ex.: 20m): dados essenciais primeiro, notícias e "
+                             "próximos jogos só com o tempo que sobrar")
+    parser.add_argument('--warmup', action='store_true',
+                        help="só aquece o cache para a data (padrão: amanhã), sem gerar páginas; "
+                             "para rodar de madrugada")
+    parser.add_argument('--profile', action='store_true',
+                        help="perfila as etapas (cProfile + tracemalloc) em perfis/; ou REFSTATS_PROFILE=1")
+    return parser
+
+def execucao_interativa(args):
+    """True quando o sistema foi aberto para uso manual (pergunta a data, pausa no fim)"""
+    return not (args.de or args.data or args.warmup) and sys.stdin.isatty()
+
+def executar_aquecimento(args):
+    """--warmup: aquece o cache da data pedida (padrão: amanhã) e resume o que falta"""
+    data_str = args.data or (datetime.now() + timedelta(days=1)).strftime('%d/%m/%Y')
+    try:
+        datetime.strptime(data_str, '%d/%m/%Y')
+    except ValueError:
+        print("\n❌ Formato de data inválido! Use DD/MM/YYYY")
+        return
+    
+    resumo = aquecer_cache(data_str, args.paralelo)
+    if resumo:
+        sem_arbitro = resumo['partidas'] - resumo['arbitros']
+        print()
+        print("=" * 70)
+        print("  ✅ CACHE AQUECIDO!")
+        print("=" * 70)
+        print()
+        print(f"   • Partidas: {resumo['partidas']}")
+        print(f"   • Árbitros já definidos: {resumo['arbitros']}")
+        if sem_arbitro:
+            print(f"   ℹ️ {sem_arbitro} partida(s) ainda sem árbitro; rode --warmup de novo mais tarde "
+                  f"para trazer o histórico deles")
+        print()
+    salvar_relatorio_execucao('warmup')
+
+def main(args=None):
+    """Função principal do sistema"""
+    if args is None:
+        args = criar_parser().parse_args()
+    
+    print("=" * 70)
+    print("  ⚽ REFSTATS - JOGOS DO DIA v1.5")
+    print("  Análise de Árbitros + Times")
+    print("=" * 70)
+    print()
+    
+    if args.de:
+        try:
+            executar_backfill(args.de, args.ate or args.de, forcar=args.forcar,
+                              dias_paralelo=args.dias_paralelo, paralelo=args.paralelo, retomar=args.retomar,
+                              deadline=args.deadline)
+        except ValueError:
+            print("\n❌ Formato de data inválido! Use DD/MM/YYYY")
+            return
+        salvar_relatorio_execucao('backfill')
+        return
+    
+    if args.warmup:
+        executar_aquecimento(args)
+        return
+    
+    # Solicita a data
+    data_str = args.data or input("📅 Digite a data das partidas (DD/MM/YYYY) [ENTER para hoje]: ").strip()
+    
+    if not data_str:
+        data_str = datetime.now().strftime('%d/%m/%Y')
+        print(f"   ➡️ Usando data de hoje: {data_str}")
+    
+    # Valida o formato da data
+    try:
+        datetime.strptime(data_str, '%d/%m/%Y')
+    except ValueError:
+        print("\n❌ Formato de data inválido! Use DD/MM/YYYY")
+        return
+    
+    print()
+    print("=" * 70)
+    
+    if args.atualizar:
+        resumo = atualizar_data(data_str, args.paralelo)
+    else:
+        resumo = processar_data(data_str, args.paralelo, retomar=args.retomar, deadline=args.deadline)
+    if not resumo:
+        return
     
     # Resumo final
     print()
@@ -4073,13 +4413,18 @@ def main():
     print("=" * 70)
     print()
     print("📊 RESUMO:")
-    print(f"   • Partidas analisadas: {len(analises)}")
-    print(f"   • Árbitros identificados: {sum(1 for a in analises if a.get('arbitro'))}")
+    print(f"   • Partidas analisadas: {resumo['partidas']}")
+    print(f"   • Árbitros identificados: {resumo['arbitros']}")
+    if 'alteradas' in resumo:
+        print(f"   • Partidas atualizadas: {resumo['alteradas']}")
     print()
     print("📄 Arquivos salvos:")
-    print(f"   • {filename_atual} (página atual)")
-    print(f"   • {filename_historico} (histórico)")
+    for arquivo in resumo['arquivos']:
+        print(f"   • {arquivo}")
+    if not resumo['arquivos']:
+        print("   • nenhum (nada mudou)")
     print()
+    salvar_relatorio_execucao(data_str.replace('/', ''))
     print("🆕 NOVIDADES v1.5:")
     print("   ✅ Navbar integrada com Home do RefStats")
     print("   ✅ Título 'Jogos do Dia' com data consultada")
@@ -4090,12 +4435,16 @@ def main():
     print()
 
 if __name__ == "__main__":
+    args = criar_parser().parse_args()
+    if perfilador_solicitado() or args.profile:
+        iniciar_perfilador('sistema_unificado')
     try:
-        main()
+        main(args)
     except Exception as e:
         print("\n❌ ERRO FATAL:")
         print(e)
         import traceback
         traceback.print_exc()
     finally:
-        input("\nPressione ENTER para fechar...")
\ No newline at end of file
+        if execucao_interativa(args):
+            input("\nPressione ENTER para fechar...")
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""Diário de partidas (sidecar_jogos.DiarioPartidas): retomada após queda."""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sidecar_jogos import DiarioPartidas
+
+
+def _analise(event_id: int) -> dict:
+    return {'partida': {'id': event_id, 'liga_id': 17}, 'arbitro': None}
+
+
+class TestDiarioPartidas(unittest.TestCase):
+
+    def setUp(self):
+        self._pasta = tempfile.TemporaryDirectory()
+        self.pasta = self._pasta.name
+
+    def tearDown(self):
+        self._pasta.cleanup()
+
+    def test_linha_incompleta_seguida_de_acrescimo(self):
+        diario = DiarioPartidas('04/12/2025', self.pasta).abrir()
+        diario.registrar(_analise(1))
+        diario.fechar()
+
+        # Queda no meio da escrita da partida 2
+        with open(diario.caminho, 'a', encoding='utf-8') as f:
+            f.write('{"versao":1,"event_id":2,"analise":{"parti')
+
+        diario = DiarioPartidas('04/12/2025', self.pasta)
+        self.assertEqual(list(diario.carregar()), [1])
+        diario.abrir(retomar=True)
+        diario.registrar(_analise(3))
+        diario.fechar()
+
+        self.assertEqual(sorted(diario.carregar()), [1, 3])
+        with open(diario.caminho, 'r', encoding='utf-8') as f:
+            self.assertTrue(f.read().endswith("\n"))
+
+    def test_retomar_diario_sem_linha_completa(self):
+        diario = DiarioPartidas('04/12/2025', self.pasta)
+        os.makedirs(os.path.dirname(diario.caminho), exist_ok=True)
+        with open(diario.caminho, 'w', encoding='utf-8') as f:
+            f.write('{"versao":1,"event_')
+
+        diario.abrir(retomar=True)
+        diario.registrar(_analise(5))
+        diario.fechar()
+
+        self.assertEqual(list(diario.carregar()), [5])
+
+    def test_retomar_preserva_diario_integro(self):
+        diario = DiarioPartidas('04/12/2025', self.pasta).abrir()
+        diario.registrar(_analise(1))
+        diario.registrar(_analise(2))
+        diario.fechar()
+
+        diario.abrir(retomar=True)
+        diario.registrar(_analise(3))
+        diario.fechar()
+
+        self.assertEqual(sorted(diario.carregar()), [1, 2, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()
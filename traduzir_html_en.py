@@ -22,6 +22,8 @@ import re
 import glob
 from datetime import datetime
 
+from perfilador import perfilado, perfilador_solicitado, iniciar_perfilador
+
 # =============================================================================
 # DICIONÁRIO DE TRADUÇÃO
 # =============================================================================
@@ -467,6 +469,7 @@ def traduzir_html(conteudo: str) -> str:
     return resultado
 
 
+@perfilado('traduzir_arquivo')
 def traduzir_arquivo(caminho_entrada: str, caminho_saida: str) -> bool:
     """Traduz um arquivo HTML e salva no destino."""
     
@@ -625,4 +628,6 @@ def main():
 
 
 if __name__ == "__main__":
+    if perfilador_solicitado():
+        iniciar_perfilador('traduzir_html_en')
     main()
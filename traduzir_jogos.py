@@ -15,6 +15,8 @@ import re
 import glob
 from datetime import datetime
 
+from perfilador import perfilado, perfilador_solicitado, iniciar_perfilador
+
 # ========================================
 # CONFIGURAÇÃO
 # ========================================
@@ -335,6 +337,7 @@ def corrigir_caminhos_history(conteudo: str) -> str:
     return conteudo
 
 
+@perfilado('traduzir_arquivo')
 def traduzir_arquivo(caminho_origem: str, caminho_destino: str, is_history: bool = False) -> bool:
     """
     Traduz um arquivo HTML do português para inglês.
@@ -448,4 +451,6 @@ def main():
 
 
 if __name__ == "__main__":
+    if perfilador_solicitado():
+        iniciar_perfilador('traduzir_jogos')
     main()
@@ -38,13 +38,18 @@ import re
 import glob
 import json
 import math
-import time
-import requests
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Tuple
 from bs4 import BeautifulSoup
 from collections import defaultdict
+from functools import lru_cache
+
+from cliente_sofascore import BASE_URL, obter_cliente
+from cache_respostas import SEM_EXPIRACAO
+from dados_sofascore import obter_agenda, obter_estatisticas_evento
+from banco_local import obter_banco_local
+from perfilador import perfilado, perfilador_solicitado, iniciar_perfilador
 
 # Importa módulo de aprendizado
 try:
@@ -65,22 +70,6 @@ except ImportError:
     print("⚠️ Módulo de aprendizado não encontrado. Funcionalidade limitada.")
 
 
-# =============================================================================
-# CONFIGURAÇÕES
-# =============================================================================
-
-BASE_URL = 'https://api.sofascore.com/api/v1'
-
-HEADERS = {
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-    'Accept': 'application/json',
-    'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
-    'Referer': 'https://www.sofascore.com/'
-}
-
-REQUEST_DELAY = 1.0
-
-
 # =============================================================================
 # CLASSES DE DADOS
 # =============================================================================
@@ -351,6 +340,7 @@ def extrair_previsoes_v2(card) -> List[PrevisaoMercadoV2]:
     return previsoes
 
 
+@perfilado('extrair_cards')
 def extrair_partidas_v2(html_path: str) -> List[PartidaPrevisaoV2]:
     """Extrai todas as partidas de um arquivo HTML V2.0."""
     partidas = []
@@ -559,19 +549,14 @@ def extrair_partidas_v2(html_path: str) -> List[PartidaPrevisaoV2]:
 # FUNÇÕES DE BUSCA NA API
 # =============================================================================
 
-def fazer_requisicao(url: str) -> Optional[dict]:
-    """Faz uma requisição à API com tratamento de erros."""
-    try:
-        response = requests.get(url, headers=HEADERS, timeout=10)
-        if response.status_code == 200:
-            return response.json()
-        return None
-    except Exception:
-        return None
+def fazer_requisicao(url: str, ttl: float = None) -> Optional[dict]:
+    """Faz uma requisição à API com tratamento de erros (sessão compartilhada + cache)."""
+    return obter_cliente().buscar_json(url, ttl=ttl)
 
 
+@lru_cache(maxsize=None)
 def normalizar_nome_time(nome: str) -> str:
-    """Normaliza o nome do time para comparação."""
+    """Normaliza o nome do time para comparação (memoizado: a agenda repete os nomes)."""
     import unicodedata
     
     nome = unicodedata.normalize('NFKD', nome)
@@ -588,16 +573,17 @@ def normalizar_nome_time(nome: str) -> str:
     return ' '.join(palavras).strip()
 
 
+@perfilado('buscar_partida_sofascore')
 def buscar_partida_sofascore(time_mandante: str, time_visitante: str, data: str) -> Optional[dict]:
     """Busca uma partida na API do SofaScore."""
     try:
         data_obj = datetime.strptime(data, '%d/%m/%Y')
         data_api = data_obj.strftime('%Y-%m-%d')
         
-        url = f"{BASE_URL}/sport/football/scheduled-events/{data_api}"
-        dados = fazer_requisicao(url)
+        # Agenda do dia compartilhada entre todas as partidas da mesma data
+        agenda = obter_agenda(data_api)
         
-        if not dados or 'events' not in dados:
+        if agenda is None:
             return None
         
         mandante_norm = normalizar_nome_time(time_mandante)
@@ -606,7 +592,7 @@ def buscar_partida_sofascore(time_mandante: str, time_visitante: str, data: str)
         melhor_match = None
         melhor_score = 0
         
-        for evento in dados['events']:
+        for evento in agenda.eventos:
             home_team = evento.get('homeTeam', {}).get('name', '')
             away_team = evento.get('awayTeam', {}).get('name', '')
             
@@ -646,25 +632,42 @@ def buscar_partida_sofascore(time_mandante: str, time_visitante: str, data: str)
         return None
 
 
+@perfilado('buscar_cartoes')
 def buscar_cartoes_partida(event_id: int) -> Optional[int]:
-    """Busca o total de cartões amarelos de uma partida."""
+    """
+    Busca o total de cartões amarelos de uma partida (já finalizada).
+    O total encontrado fica no banco local; a API só é consultada uma vez.
+    """
+    try:
+        banco = obter_banco_local()
+        if banco is not None:
+            cartoes = banco.cartoes_amarelos(event_id)
+            if cartoes is not None:
+                return cartoes
+        
+        cartoes = _contar_cartoes_partida(event_id)
+        if cartoes is not None and banco is not None:
+            banco.salvar_cartoes_amarelos(event_id, cartoes)
+        return cartoes
+        
+    except Exception:
+        return None
+
+
+def _contar_cartoes_partida(event_id: int) -> Optional[int]:
+    """Total de amarelos pelas estatísticas do evento, com fallback nos incidentes."""
     try:
-        url = f"{BASE_URL}/event/{event_id}/statistics"
-        dados = fazer_requisicao(url)
-        
-        if dados and 'statistics' in dados:
-            for grupo in dados['statistics']:
-                for item in grupo.get('groups', []):
-                    for stat in item.get('statisticsItems', []):
-                        nome = stat.get('name', '').lower()
-                        if 'yellow' in nome and 'card' in nome:
-                            home = int(stat.get('home', 0) or 0)
-                            away = int(stat.get('away', 0) or 0)
-                            return home + away
+        estatisticas = obter_estatisticas_evento(event_id, finalizada=True)
+        
+        if estatisticas:
+            item = estatisticas.primeiro_item(lambda nome: 'yellow' in nome and 'card' in nome)
+            if item:
+                home, away = item
+                return int(home or 0) + int(away or 0)
         
         # Fallback: incidentes
         url_incidents = f"{BASE_URL}/event/{event_id}/incidents"
-        dados_incidents = fazer_requisicao(url_incidents)
+        dados_incidents = fazer_requisicao(url_incidents, ttl=SEM_EXPIRACAO)
         
         if dados_incidents and 'incidents' in dados_incidents:
             cartoes = 0
@@ -835,6 +838,7 @@ def validar_partida_v2(partida: PartidaPrevisaoV2) -> List[ResultadoValidacaoV2]
     return resultados
 
 
+@perfilado('gerar_relatorio')
 def gerar_relatorio_v2(partidas: List[PartidaPrevisaoV2], data_arquivo: str) -> RelatorioValidacaoV2:
     """Gera o relatório de validação V2.0."""
     
@@ -897,6 +901,7 @@ def gerar_relatorio_v2(partidas: List[PartidaPrevisaoV2], data_arquivo: str) ->
 # GERAÇÃO DO HTML DO RELATÓRIO V2.0
 # =============================================================================
 
+@perfilado('gerar_html_relatorio')
 def gerar_html_relatorio_v2(relatorio: RelatorioValidacaoV2) -> str:
     """Gera o HTML do relatório de validação V2.0."""
     
@@ -1494,8 +1499,6 @@ def processar_arquivo_v2(caminho: str, pasta_saida: str) -> Optional[RelatorioVa
         else:
             print("❌ Não encontrado")
             partida.status = "não encontrado"
-        
-        time.sleep(REQUEST_DELAY)
     
     # Gera relatório
     print("\n   📊 Gerando relatório...")
@@ -1944,4 +1947,6 @@ def exibir_resumo_final_v2(relatorios: list):
 
 
 if __name__ == "__main__":
+    if perfilador_solicitado():
+        iniciar_perfilador('validacao')
     main()